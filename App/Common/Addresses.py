@@ -1,151 +1,55 @@
 # App/Common/Addresses.py
 
-# All addresses are corrected to use AT00 or AT01
-AUDIO_SAMPLE_ADDRESSES: dict[str, dict[str, int]] = {
-    # Shared Samples
-    'OCARINA:G080'           : {'OOT': 0x000FAD40, 'MM': 0x002786B0},
-    'BANDONEON:C072'         : {'OOT': 0x000FDFC0, 'MM': 0x0027B930},
-    'HARP:F077'              : {'OOT': 0x001026F0, 'MM': 0x00280060},
-    'MALON & LULU VOICE:D074': {'OOT': 0x00106C20, 'MM': 0x00284590},
-    'PICCOLO:G091'           : {'OOT': 0x00108690, 'MM': 0x00286000},
-    'PANDEIRO:TAP'           : {'OOT': 0x00335740, 'MM': 0x0028CFA0},
-    'TAMBOURINE:A118'        : {'OOT': 0x00338450, 'MM': 0x0028F270},
-    'TIMPANI:C048'           : {'OOT': 0x00317260, 'MM': 0x0029C360},
-    'PIANO:C072'             : {'OOT': 0x002D96A0, 'MM': 0x002AFCD0},
-    'FEMALE CHOIR:B071'      : {'OOT': 0x002DFF40, 'MM': 0x003C0F20},
-    'FEMALE CHOIR:F077'      : {'OOT': 0x002E7410, 'MM': 0x003C83F0},
-    'HARP:F065'              : {'OOT': 0x002EF650, 'MM': 0x003D0630},
-    'GLOCKENSPIEL:B083'      : {'OOT': 0x002F3300, 'MM': 0x003D42E0},
-    'CONCERT BASS DRUM:D038' : {'OOT': 0x00304E30, 'MM': 0x003D9670},
-    'ORCH SNARE:SNGL'        : {'OOT': 0x00309BD0, 'MM': 0x003DE410},
-    'ORCH SNARE:ROLL'        : {'OOT': 0x0030C360, 'MM': 0x003E0BA0},
-    'CRASH CYMBAL:C060'      : {'OOT': 0x0030EAF0, 'MM': 0x003E3330},
-    'PANDEIRO:SLAP'          : {'OOT': 0x00337A10, 'MM': 0x003F3980},
-    'TROMBONE:G067'          : {'OOT': 0x002FD270, 'MM': 0x003F43C0},
-    'PIANO:A045'             : {'OOT': 0x002C8510, 'MM': 0x003F9010},
-    'PIANO:C060'             : {'OOT': 0x002CFEE0, 'MM': 0x004009E0},
-    'VIOLIN:A069'            : {'OOT': 0x003E3F80, 'MM': 0x0040A1A0},
-    'STRINGS:C036'           : {'OOT': 0x0031F640, 'MM': 0x00419100},
-    'STRINGS:G056'           : {'OOT': 0x00324660, 'MM': 0x0041E120},
-    'STRINGS:G068'           : {'OOT': 0x00328D10, 'MM': 0x004227D0},
-    'OBOE:E076'              : {'OOT': 0x0033A980, 'MM': 0x004264C0},
-    'FRENCH HORN:C072'       : {'OOT': 0x00351810, 'MM': 0x00427770},
-    'TRUMPET:C072'           : {'OOT': 0x002F9A90, 'MM': 0x0042F0D0},
-    'TUBA:E040'              : {'OOT': 0x00301EC0, 'MM': 0x004328B0},
-    'HARMONICA:G068'         : {'OOT': 0x0032CA00, 'MM': 0x00435820},
-    'NYLON STR GUITAR:G056'  : {'OOT': 0x0032ECB0, 'MM': 0x00437AD0},
-    'NYLON STR GUITAR:D075'  : {'OOT': 0x00332D10, 'MM': 0x0043BB30},
-    'BASSOON:A045'           : {'OOT': 0x0033BC30, 'MM': 0x0043E560},
-    'PIZZ. STRINGS:B047'     : {'OOT': 0x0033D130, 'MM': 0x0043FA60},
-    'PIZZ. STRINGS:A070'     : {'OOT': 0x003403F0, 'MM': 0x00442D20},
-    'ACOUSTIC BASS:A033'     : {'OOT': 0x00359170, 'MM': 0x004461A0},
-    'SYNFANTASIA3:D075'      : {'OOT': 0x003A4410, 'MM': 0x0044A130},
-    'EERIE WIND:F042'        : {'OOT': 0x00381930, 'MM': 0x004520D0},
-    'MALE CHOIR:G067'        : {'OOT': 0x002AF020, 'MM': 0x00483620},
-    'MALE CHOIR:C109'        : {'OOT': 0x002B43B0, 'MM': 0x004889B0},
-    'BOUZOUKI:D050'          : {'OOT': 0x003AC3B0, 'MM': 0x004B6610},
-    'BOUZOUKI:D062'          : {'OOT': 0x003AFA80, 'MM': 0x004B9CE0},
-    'DJEMBE:OPEN'            : {'OOT': 0x003B4330, 'MM': 0x004BE590},
-    'DJEMBE:SLAP'            : {'OOT': 0x003B5350, 'MM': 0x004BF5B0},
-    'DJEMBE:MUTE'            : {'OOT': 0x003B6B40, 'MM': 0x004C0DA0},
-    'GONG:G068'              : {'OOT': 0x003B7A60, 'MM': 0x004C1CC0}, # OOT: 0x0044A690 (AT06 Corrected)
-    'BAR CHIMES:D123'        : {'OOT': 0x003C1F90, 'MM': 0x004CC1F0}, # OOT: 0x00454BC0 (AT06 Corrected)
-    'BENT CONGA:C072'        : {'OOT': 0x003C7A90, 'MM': 0x004D1CF0}, # OOT: 0x00427D30 (AT05 Corrected), MM: 0x00538CC0 (AT02 Corrected)
-    'HARPSICHORD:G067'       : {'OOT': 0x00398650, 'MM': 0x004DEB10},
-    'CLARINET:C072'          : {'OOT': 0x00397A60, 'MM': 0x004EC650},
-    'BANJO:D050'             : {'OOT': 0x003EDFB0, 'MM': 0x004F3440},
-    'BANJO:A057'             : {'OOT': 0x003F0DF0, 'MM': 0x004F6280},
-    'PERC:CONGA:MUTE'        : {'OOT': 0x003D45A0, 'MM': 0x004F8B20}, # OOT: 0x0042A270 (AT05 Corrected), MM: 0x0053B200 (AT02 Corrected)
-    'PERC:CONGA:OPEN'        : {'OOT': 0x003D6860, 'MM': 0x004FADE0},
-    'PERC:CONGA:SLAP'        : {'OOT': 0x003D9030, 'MM': 0x004FD5B0}, # OOT: 0x0042C530 (AT05 Corrected), MM: 0x0053D4C0 (AT02 Corrected)
-    'CABASA:D123'            : {'OOT': 0x003DBB00, 'MM': 0x00500080},
-    'COWBELL:E076'           : {'OOT': 0x003DCA50, 'MM': 0x00500FD0},
-    'MARIMBA:D062'           : {'OOT': 0x0039FBE0, 'MM': 0x00513220},
-    'MARIMBA:D074'           : {'OOT': 0x003A2280, 'MM': 0x005158C0},
-    'SUSTAIN E. GUITAR:A045' : {'OOT': 0x003DD710, 'MM': 0x00517A50},
-    'SUSTAIN E. GUITAR:C060' : {'OOT': 0x003DFEF0, 'MM': 0x0051A230},
-    'SUSTAIN E. GUITAR:G079' : {'OOT': 0x003E20B0, 'MM': 0x0051C3F0},
-    'CHURCH BELL:A070'       : {'OOT': 0x003E8000, 'MM': 0x0051E2C0},
-    'STEEL DRUM:C060'        : {'OOT': 0x003F3690, 'MM': 0x00522F10},
-    'STEEL DRUM:D074'        : {'OOT': 0x003F82F0, 'MM': 0x00527B70},
-    'DIGI PAD 04:F065'       : {'OOT': 0x003CB570, 'MM': 0x0052A260}, # OOT: 0x0045A6C0 (AT06 Corrected)
-    'CUICA:OPEN'             : {'OOT': 0x003ECC50, 'MM': 0x0053FF90}, # OOT: 0x0042F000 (AT05 Corrected)
-    'CUICA:MUTE'             : {'OOT': 0x003ED4F0, 'MM': 0x00540830}, # OOT: 0x0042F8A0 (AT05 Corrected)
-    'REVERB MARIMBA:A057'    : {'OOT': 0x0037A4B0, 'MM': 0x005412F0}, # OOT: 0x00430360 (AT05 Corrected)
+from bisect import bisect_left
 
-    # OOT-Exclusive Samples
-    'ANCIENTS-R:G068'        : {'OOT': 0x0029FE30, 'MM': -1}, # Dodongo's Cavern & Shadow Temple
-    'LORE DRONE:A069'        : {'OOT': 0x002A4D40, 'MM': -1},
-    'SHINE:E088'             : {'OOT': 0x002A8500, 'MM': -1},
-    'SPACEOSPHERE:G091'      : {'OOT': 0x002B9E60, 'MM': -1},
-    'METAL GRIND:C060'       : {'OOT': 0x002F8690, 'MM': -1},
-    'PIPE ORGAN:C048'        : {'OOT': 0x00343870, 'MM': -1},
-    'PIPE ORGAN:C060'        : {'OOT': 0x0034D670, 'MM': -1},
-    'CLAP:C072'              : {'OOT': 0x0035C900, 'MM': -1},
-    'RELIGIOUS PRAYER:D086'  : {'OOT': 0x0035D100, 'MM': -1},
-    'RELIGIOUS PRAYER:C072'  : {'OOT': 0x00365DB0, 'MM': -1},
-    'RELIGIOUS PRAYER:F089'  : {'OOT': 0x0036C840, 'MM': -1},
-    'FU YIN GONG:A081'       : {'OOT': 0x0038D230, 'MM': -1},
-    'AL RYTHM 26:LOW'        : {'OOT': 0x00391FD0, 'MM': -1},
-    'AL RYTHM 26:PRIM'       : {'OOT': 0x00395710, 'MM': -1},
-    'BAMBREMORO:B071'        : {'OOT': 0x003C9FD0, 'MM': -1},
-    'AFRIK FLUTE7:LOW'       : {'OOT': 0x003D1980, 'MM': -1},
-    'AFRIK FLUTE7:PRIM'      : {'OOT': 0x003D2840, 'MM': -1},
-    'AFRIK FLUTE7:HIGH'      : {'OOT': 0x003D37A0, 'MM': -1},
-    'ENIGMATIC:F054'         : {'OOT': 0x003FA9E0, 'MM': -1},
-    'ANCIENTS-L:B047'        : {'OOT': 0x004006B0, 'MM': -1}, # Jabu-Jabu's Belly (Near perfect waveform match)
-    'TRIP-HOPPIN:KICK'       : {'OOT': 0x00409270, 'MM': -1},
-    'TRIP-HOPPIN:SNRE'       : {'OOT': 0x0040AC40, 'MM': -1},
-    'CRUNCH ROAR:C060'       : {'OOT': 0x00416B30, 'MM': -1},
-    'SYNTH STRINGS:C060'     : {'OOT': 0x004377E0, 'MM': -1}, # OOT: 0x0040BA60 (AT03 Corrected), 0x004377E0 (AT06 Corrected); same os MM except root and VADPCM info
-    'DUDUK:D086'             : {'OOT': 0x004428B0, 'MM': -1},
+from App.Resources.Presets.SampleAddresses import (
+    SAMPLE_GAMES, SAMPLE_NAMES, SAMPLE_ADDRESSES,
+    SAMPLE_ADDRESSES_SORTED, SAMPLE_ADDRESS_ROWS
+)
 
-    # MM-Exclusive Samples
-    'SURDO:A045'             : {'OOT': -1,         'MM': 0x0028A690},
-    'RAWHIDE DRUM:B047'      : {'OOT': -1,         'MM': 0x002917A0},
-    'STEEL STR GUITAR:D050'  : {'OOT': -1,         'MM': 0x00295040},
-    'MUTED TRUMPET:C060'     : {'OOT': -1,         'MM': 0x0029A8F0},
-    'JP CYMBAL:PRIM'         : {'OOT': -1,         'MM': 0x002A4740},
-    'FRETLESS BASS:F041'     : {'OOT': -1,         'MM': 0x002B6570},
-    'GORON CHILD:B071'       : {'OOT': -1,         'MM': 0x002B82E0},
-    "GIANTS' VOICE:C061"     : {'OOT': -1,         'MM': 0x002BB710},
-    'SLEIGHBELL:B107'        : {'OOT': -1,         'MM': 0x003EBAA0},
-    'TENOR SAXOPHONE:A057'   : {'OOT': -1,         'MM': 0x003EF2C0},
-    'TENOR SAXOPHONE:E064'   : {'OOT': -1,         'MM': 0x003F0780},
-    'STEEL STR GUITAR:D074'  : {'OOT': -1,         'MM': 0x003F21D0},
-    'KICK DRUM:G043'         : {'OOT': -1,         'MM': 0x0040E220},
-    'SHAKER:E112'            : {'OOT': -1,         'MM': 0x0040EBE0},
-    'ACOUSTIC SNARE:SNGL'    : {'OOT': -1,         'MM': 0x00411340},
-    'HI-HAT:OPEN'            : {'OOT': -1,         'MM': 0x00412620},
-    'RIDE CYMBAL:G116'       : {'OOT': -1,         'MM': 0x00414C60},
-    'RHODES E. PIANO:F054'   : {'OOT': -1,         'MM': 0x0045D9D0},
-    'RHODES E. PIANO:C072'   : {'OOT': -1,         'MM': 0x004608E0},
-    'OMINOUSITY:F018'        : {'OOT': -1,         'MM': 0x00464970},
-    'VERBHHOD6:C120'         : {'OOT': -1,         'MM': 0x0046AB90},
-    'PIT HIT 1:D038'         : {'OOT': -1,         'MM': 0x0046E340},
-    'MUTED E. GUITAR:E052'   : {'OOT': -1,         'MM': 0x004728F0},
-    'DANGER:F066'            : {'OOT': -1,         'MM': 0x00473E10},
-    'SYNTH STRINGS:G067'     : {'OOT': -1,         'MM': 0x00478C20}, # Same as OOT except root and VADPCM info
-    'ELECTRIC ORGAN:G068'    : {'OOT': -1,         'MM': 0x00480600},
-    'UDU:D038'               : {'OOT': -1,         'MM': 0x0048E460},
-    'UDU:A046'               : {'OOT': -1,         'MM': 0x00491090},
-    'CONGAS:OPEN'            : {'OOT': -1,         'MM': 0x00493E70},
-    'CONGAS:MUTE'            : {'OOT': -1,         'MM': 0x00495240},
-    'BRUSH SNARE:C048'       : {'OOT': -1,         'MM': 0x00496610},
-    'AWKBIRD1:D074'          : {'OOT': -1,         'MM': 0x00498B50},
-    'AWKBIRD2:D087'          : {'OOT': -1,         'MM': 0x0049A670},
-    'AFRICAN 13 111-A:A093'  : {'OOT': -1,         'MM': 0x0049BF60},
-    'TUNNEL RAIN:F029'       : {'OOT': -1,         'MM': 0x004A5780},
-    'HEAVY METALLIC HIT:F066': {'OOT': -1,         'MM': 0x004AB940},
-    'TABLA:G055'             : {'OOT': -1,         'MM': 0x004AEF20},
-    'HIGH-Q:B119'            : {'OOT': -1,         'MM': 0x004B0BA0},
-    'MYSTIC PAD:F030'        : {'OOT': -1,         'MM': 0x004B0CD0},
-    'VELOCITY MC-202:C036'   : {'OOT': -1,         'MM': 0x004B4940},
-    'ICELAND 1:D086'         : {'OOT': -1,         'MM': 0x004D4230},
-    'BASSOON:A069'           : {'OOT': -1,         'MM': 0x004E60A0},
-    'ELVES:C096'             : {'OOT': -1,         'MM': 0x004E65F0},
-    'SHEHNAI:A057'           : {'OOT': -1,         'MM': 0x004ED240},
-    'SITAR:A057'             : {'OOT': -1,         'MM': 0x004EF640},
-    'JP CYMBAL:LOW'          : {'OOT': -1,         'MM': 0x00501C90},
-    'JP CYMBAL:HIGH'         : {'OOT': -1,         'MM': 0x0050AA40},
-}
+
+#region Lookups
+def find_sample_row(name: str) -> int:
+    """ Returns the row of a sample name in the address table, or -1 if it is unknown. """
+    name = name.upper()
+    row = bisect_left(SAMPLE_NAMES, name)
+    if row < len(SAMPLE_NAMES) and SAMPLE_NAMES[row] == name:
+        return row
+    return -1
+
+
+def is_known_sample(name: str) -> bool:
+    return find_sample_row(name) != -1
+
+
+def get_sample_address(name: str, game: str, default: int = -1) -> int:
+    """
+    Returns the address of a named sample in a game.
+
+    Samples a known game does not have are always -1, default is only returned
+    for unknown names or games.
+    """
+    row = find_sample_row(name)
+    addresses = SAMPLE_ADDRESSES.get(game.upper())
+    if row == -1 or addresses is None:
+        return default
+    return addresses[row]
+
+
+def get_sample_name(game: str, address: int) -> str | None:
+    """ Returns the name of the sample at an address in a game, or None if it is undocumented. """
+    addresses = SAMPLE_ADDRESSES_SORTED.get(game.upper())
+    if addresses is None:
+        return None
+
+    i = bisect_left(addresses, address)
+    if i < len(addresses) and addresses[i] == address:
+        return SAMPLE_NAMES[SAMPLE_ADDRESS_ROWS[game.upper()][i]]
+    return None
+
+
+def iter_sample_addresses():
+    """ Yields (name, {game: address}) for every documented sample. """
+    for row, name in enumerate(SAMPLE_NAMES):
+        yield name, {game: SAMPLE_ADDRESSES[game][row] for game in SAMPLE_GAMES}
+#endregion
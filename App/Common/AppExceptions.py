@@ -9,4 +9,18 @@ class InvalidGameException(Exception):
     def __init__(self, game=None, message=None):
         if message is None:
             message = self.default_message.format(game=game)
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
+class InvalidEnvelopeException(Exception):
+    def __init__(self, message: str, point: int | None = None):
+        self.point = point
+        if point is not None:
+            message = f'Point {point}: {message}'
+        super().__init__(message)
+
+class IncompleteSequenceException(Exception):
+    def __init__(self, message: str, address: int | None = None):
+        self.address = address
+        if address is not None:
+            message = f'0x{address:04X}: {message}'
+        super().__init__(message)
@@ -0,0 +1,298 @@
+# App/Common/AudioHeap.py
+
+from dataclasses import dataclass, field
+from pathlib import Path
+import struct
+
+# App/Common
+from App.Common.Enums import AudioCacheLoadType
+from App.Common.AppExceptions import InvalidGameException
+from App.Common.Helpers import align_to_16, clone_bank, bank_samples
+
+
+HEAP_SEQUENCE = 'sequence'
+HEAP_FONT = 'font'
+HEAP_SAMPLE = 'sample'
+
+HEAP_PERSISTENT = 'persistent'
+HEAP_TEMPORARY = 'temporary'
+HEAP_PERMANENT = 'permanent'
+
+# Spec field prefix of each item kind
+HEAP_SPEC_FIELDS = {HEAP_SEQUENCE: 'seq', HEAP_FONT: 'font', HEAP_SAMPLE: 'sample'}
+
+
+@dataclass(frozen=True)
+class AudioHeapSpec:
+    """ Cache pool sizes in bytes, a size of 0 leaves that pool unmodeled. """
+    persistent_seq: int
+    persistent_font: int
+    persistent_sample: int
+    temporary_seq: int
+    temporary_font: int
+    temporary_sample: int
+
+    def size(self, kind: str, cache: str) -> int:
+        return getattr(self, f'{cache}_{HEAP_SPEC_FIELDS[kind]}')
+
+
+# Cache sizes of each game's default audio spec, pass a spec matching the ROM when
+# its audio spec has been patched. MM's pools are not modeled yet.
+AUDIO_HEAP_SPECS = {
+    'OOT': AudioHeapSpec(
+        persistent_seq=0x7F0, persistent_font=0xE00, persistent_sample=0,
+        temporary_seq=0x4000, temporary_font=0x2880, temporary_sample=0
+    ),
+}
+
+
+def get_heap_spec(game: str) -> AudioHeapSpec:
+    """ The default audio spec of a game, games without a modeled spec are refused. """
+    spec = AUDIO_HEAP_SPECS.get(game.upper())
+    if spec is None:
+        raise InvalidGameException(message=f"The audio heap of '{game}' is not modeled, its cache sizes are unknown")
+    return spec
+
+
+@dataclass(frozen=True)
+class HeapItem:
+    kind: str                           # HEAP_SEQUENCE, HEAP_FONT or HEAP_SAMPLE
+    name: str
+    size: int
+    load_type: AudioCacheLoadType
+
+
+@dataclass
+class ScenarioStep:
+    """ Items that play together, none of them can be evicted while the step plays. """
+    name: str
+    items: list[HeapItem]
+
+
+@dataclass
+class HeapEvent:
+    step: int
+    action: str                         # 'load', 'evict' or 'fail'
+    pool: str
+    item: HeapItem
+
+
+@dataclass
+class ScenarioReport:
+    name: str
+    capacities: dict[str, int]
+    peaks: dict[str, int] = field(default_factory=dict)
+    events: list[HeapEvent] = field(default_factory=list)
+    permanent: int = 0                  # Bytes the scenario expects to be loaded at boot
+    streamed: int = 0                   # Cached sample bytes without a modeled sample cache
+
+    @property
+    def evictions(self) -> list[HeapEvent]:
+        return [event for event in self.events if event.action == 'evict']
+
+    @property
+    def failures(self) -> list[HeapEvent]:
+        return [event for event in self.events if event.action == 'fail']
+
+    @property
+    def fits(self) -> bool:
+        return not self.failures
+
+
+#region Cache Pools
+class PersistentPool:
+    """ Stack allocated, items stay loaded until the heap is reset. """
+    def __init__(self, name: str, size: int):
+        self.name = name
+        self.size = size
+        self.used = 0
+        self.items: set[HeapItem] = set()
+
+    def __contains__(self, item: HeapItem) -> bool:
+        return item in self.items
+
+    def load(self, item: HeapItem, locked: set[HeapItem]) -> list[tuple[str, HeapItem]]:
+        size = align_to_16(item.size)
+        if self.used + size > self.size:
+            return [('fail', item)]
+
+        self.used += size
+        self.items.add(item)
+        return [('load', item)]
+
+
+class TemporaryPool:
+    """
+    Two entries allocated from opposite ends of the pool. Loads alternate between
+    the two sides, evicting what was there and whatever the new item overlaps.
+    """
+    def __init__(self, name: str, size: int):
+        self.name = name
+        self.size = size
+        self.entries: list[HeapItem | None] = [None, None]
+        self.next_side = 0
+
+    def __contains__(self, item: HeapItem) -> bool:
+        return item in self.entries
+
+    @property
+    def used(self) -> int:
+        return sum(align_to_16(item.size) for item in self.entries if item)
+
+    def load(self, item: HeapItem, locked: set[HeapItem]) -> list[tuple[str, HeapItem]]:
+        size = align_to_16(item.size)
+        if size > self.size:
+            return [('fail', item)]
+
+        # A side that is playing can not be replaced, use the other one
+        side = self.next_side
+        if self.entries[side] in locked:
+            side ^= 1
+            if self.entries[side] in locked:
+                return [('fail', item)]
+
+        other = self.entries[side ^ 1]
+        evicted = [self.entries[side]]
+        if other and align_to_16(other.size) + size > self.size:
+            if other in locked:
+                return [('fail', item)]
+            evicted.append(other)
+
+        actions = []
+        for old in evicted:
+            if old:
+                self.entries[self.entries.index(old)] = None
+                actions.append(('evict', old))
+
+        self.entries[side] = item
+        self.next_side = side ^ 1
+        actions.append(('load', item))
+        return actions
+#endregion
+
+
+#region Simulation
+def _cache_order(load_type: AudioCacheLoadType) -> tuple[str, ...]:
+    match load_type:
+        case AudioCacheLoadType.PERSISTENT:
+            return (HEAP_PERSISTENT,)
+        case AudioCacheLoadType.TEMPORARY:
+            return (HEAP_TEMPORARY,)
+        case AudioCacheLoadType.EITHER | AudioCacheLoadType.EITHER_NOSYNC:
+            return (HEAP_TEMPORARY, HEAP_PERSISTENT)
+    return (HEAP_PERMANENT,)
+
+
+def simulate_scenario(name: str, steps: list[ScenarioStep], spec: AudioHeapSpec) -> ScenarioReport:
+    """ Loads each step's items in order and records peak cache usage and evictions. """
+    pools = {}
+    for kind in (HEAP_SEQUENCE, HEAP_FONT, HEAP_SAMPLE):
+        pools[kind, HEAP_PERSISTENT] = PersistentPool(f'{HEAP_PERSISTENT} {kind}', spec.size(kind, HEAP_PERSISTENT))
+        pools[kind, HEAP_TEMPORARY] = TemporaryPool(f'{HEAP_TEMPORARY} {kind}', spec.size(kind, HEAP_TEMPORARY))
+
+    report = ScenarioReport(name=name, capacities={pool.name: pool.size for pool in pools.values()})
+    report.peaks = {pool.name: 0 for pool in pools.values()}
+    permanent = set()
+    streamed = set()
+
+    for index, step in enumerate(steps):
+        locked = set(step.items)
+
+        for item in step.items:
+            caches = _cache_order(item.load_type)
+            if caches == (HEAP_PERMANENT,):
+                if item not in permanent:
+                    permanent.add(item)
+                    report.permanent += align_to_16(item.size)
+                continue
+
+            candidates = [pools[item.kind, cache] for cache in caches if pools[item.kind, cache].size > 0]
+            if not candidates:
+                if item.kind == HEAP_SAMPLE and item not in streamed:
+                    streamed.add(item)
+                    report.streamed += item.size
+                continue
+
+            if any(item in pool for pool in candidates):
+                continue
+
+            for pool in candidates:
+                actions = pool.load(item, locked)
+                if actions[-1][0] == 'load':
+                    break
+
+            # Only the last cache's failure is reported when an item can go in either
+            for action, target in actions:
+                report.events.append(HeapEvent(index, action, pool.name, target))
+
+            for pool in candidates:
+                report.peaks[pool.name] = max(report.peaks[pool.name], pool.used)
+
+    return report
+#endregion
+
+
+#region Heap Items
+def bank_heap_items(bank) -> list[HeapItem]:
+    """ The bank's font and the samples it caches, samples follow the font's cache. """
+    size = len(clone_bank(bank).build())
+    load_type = bank.tableEntry.cacheLoadType
+    items = [HeapItem(HEAP_FONT, bank.name, size, load_type)]
+
+    # Samples without the cached flag are streamed from ROM and never use the heap
+    for key, sample in bank_samples(bank).items():
+        if sample.is_cached:
+            items.append(HeapItem(HEAP_SAMPLE, f'{sample.name} ({key[:8]})', sample.size, load_type))
+
+    return items
+
+
+def compiled_bank_item(bank_path: Path) -> HeapItem:
+    """ Font item of a compiled .zbank, its cache type is read from the .bankmeta beside it. """
+    bank_path = Path(bank_path)
+    table_entry = bank_path.with_suffix('.bankmeta').read_bytes()
+    _, cache_load_type, *_ = struct.unpack('>6BH', table_entry[:8])
+    return HeapItem(HEAP_FONT, bank_path.stem, bank_path.stat().st_size, AudioCacheLoadType(cache_load_type))
+
+
+def sequence_heap_item(path: Path, load_type: AudioCacheLoadType = AudioCacheLoadType.TEMPORARY) -> HeapItem:
+    path = Path(path)
+    return HeapItem(HEAP_SEQUENCE, path.stem, path.stat().st_size, load_type)
+#endregion
+
+
+#region Pack Checks
+def check_banks(banks, game: str, spec: AudioHeapSpec | None = None) -> list[ScenarioReport]:
+    """
+    One scenario per bank, loaded on its own, then one scenario playing every bank
+    of the pack in turn so banks evict each other the way scene changes would.
+    """
+    spec = spec or get_heap_spec(game)
+    bank_items = [(bank.name, bank_heap_items(bank)) for bank in banks]
+
+    reports = [
+        simulate_scenario(name, [ScenarioStep(name, items)], spec)
+        for name, items in bank_items
+    ]
+    reports.append(simulate_scenario(
+        'All banks in turn',
+        [ScenarioStep(name, items) for name, items in bank_items],
+        spec
+    ))
+    return reports
+
+
+def format_report(report: ScenarioReport) -> str:
+    lines = [f"{report.name}: {'fits' if report.fits else 'does not fit'}"]
+    for pool, peak in report.peaks.items():
+        if peak:
+            lines.append(f'  {pool:<20} peak 0x{peak:05X} / 0x{report.capacities[pool]:05X}')
+    if report.permanent:
+        lines.append(f'  permanent            0x{report.permanent:05X} expected loaded at boot')
+    if report.streamed:
+        lines.append(f'  streamed samples     0x{report.streamed:05X} cached samples without a sample cache')
+    for event in report.events:
+        if event.action != 'load':
+            lines.append(f'  step {event.step}: {event.action} {event.item.kind} {event.item.name} (0x{event.item.size:X}) in {event.pool}')
+    return '\n'.join(lines)
+#endregion
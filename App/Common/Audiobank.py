@@ -13,8 +13,10 @@ from App.Common.Structs import (
 )
 from App.Common.Enums import AudioStorageMedium, AudioCacheLoadType, SampleBankId
 from App.Common.MemAllocator import MemAllocator
-from App.Common.Addresses import AUDIO_SAMPLE_ADDRESSES
+from App.Common.MemoryMap import memory_map
+from App.Common.Addresses import get_sample_address
 from App.Common.Helpers import align_to_16
+from App.Common.Vadpcm import pack_s16_array
 from App.Common.AppExceptions import InvalidGameException
 
 
@@ -68,6 +70,9 @@ class Audiobank:
         self.loopbookRegistry = {}
         self.codebookRegistry = {}
 
+        # Layout of the last build
+        self.allocator: MemAllocator | None = None
+
     #region Data Registries
     def _add_to_registry(self, item, hash, registry):
         if hash not in registry:
@@ -200,137 +205,141 @@ class Audiobank:
     #endregion
 
     #region Binary Writing
-    def compile(self, outFolder):
+    def build(self) -> bytearray:
+        """ Builds the bank's binary without writing it. """
+        # Reference deduplication
+        # ———————————————————————————————————————————————————————————————————————————
+        # If duplicate data exists in the bank, then the data should be replaced with
+        # already known existing data. This gives the smallest binary output possible.
+        for instrument in self.instruments:
+            self._process_instrument(instrument)
+
+        for drum in self.drums:
+            self._process_drum(drum)
+
+        for effect in self.effects:
+            self._process_effect(effect)
+
+        self.instruments = [
+            self.instrumentRegistry[instrument.get_hash()] if instrument else None
+            for instrument in self.instruments
+        ]
+        self.drums = [
+            self.drumRegistry[drum.get_hash()] if drum else None
+            for drum in self.drums
+        ]
+        self.effects = [
+            self.effectRegistry[effect.get_hash()] if effect else None
+            for effect in self.effects
+        ]
+        self.reassign_registry_refs()
+
+        # Pointer Allocation
+        allocator = MemAllocator()
+        self.assign_offsets(allocator)
+        self.allocator = allocator
+
+        # Create the buffer
+        buffer = bytearray(align_to_16(allocator.offset))
+
+        # Write drum list and effect list pointers
+        struct.pack_into('>2I', buffer, 0x00,
+                        self.drumList.offset,
+                        self.effectList.offset)
+
+        # Write Pointer Lists
+        for i, instrument in enumerate(self.instruments):
+            struct.pack_into('>I', buffer, self.instrumentList.offset + i * 4,
+                            instrument.offset if instrument else 0)
+
+        for i, drum in enumerate(self.drums):
+            struct.pack_into('>I', buffer, self.drumList.offset + i * 4,
+                            drum.offset if drum else 0)
+
+        for i, effect in enumerate(self.effects):
+            sample_offset = effect.effect_sample.offset if (effect and effect.effect_sample and effect.effect_sample.sample) else 0
+            tuning = effect.effect_sample.tuning if (effect and effect.effect_sample) else 0.0
+            struct.pack_into('>If', buffer, self.effectList.offset + i * 8, sample_offset, tuning)
+
+        # Write Structures
+        for offset, obj, *_ in sorted(allocator.entries, key=lambda x: x[0]):
+            match obj:
+                case _ if isinstance(obj, Pointer):
+                    continue
+
+                case _ if isEnvelope(obj):
+                    pack_s16_array(buffer, obj.offset, obj.array)
+
+                case _ if isVadpcmLoop(obj):
+                    preds = obj.predictors or []
+                    struct.pack_into(
+                        '>4i', buffer, obj.offset,
+                        obj.loop_start,
+                        obj.loop_end,
+                        obj.loop_count,
+                        obj.num_samples
+                    )
+                    pack_s16_array(buffer, obj.offset + 0x10, preds)
+
+                case _ if isVadpcmBook(obj):
+                    struct.pack_into('>2i', buffer, obj.offset, obj.order, obj.num_predictors)
+                    pack_s16_array(buffer, obj.offset + 0x08, obj.predictors)
+
+                case _ if isSample(obj):
+                    bitfield  = 0
+                    bitfield |= (obj.unk_0 & 0b1) << 31
+                    bitfield |= (obj.codec & 0b111) << 28
+                    bitfield |= (obj.medium & 0b11) << 26
+                    bitfield |= (int(obj.is_cached) & 1) << 25
+                    bitfield |= (int(obj.is_relocated) & 1) << 24
+                    bitfield |= (obj.size & 0b111111111111111111111111)
+
+                    struct.pack_into(
+                        '>4I', buffer, obj.offset,
+                        bitfield,
+                        resolve_sample_address(obj.vrom_address, self.game),
+                        obj.vadpcm_loop.offset,
+                        obj.vadpcm_book.offset
+                    )
+
+                case _ if isDrum(obj):
+                    struct.pack_into(
+                        '>3BxIfI', buffer, obj.offset,
+                        obj.decay_index,
+                        obj.pan,
+                        int(obj.is_relocated),
+                        obj.drum_sample.sample.offset,
+                        obj.drum_sample.tuning,
+                        obj.envelope.offset
+                    )
+
+                case _ if isInstrument(obj):
+                    struct.pack_into(
+                        '>4BI', buffer, obj.offset,
+                        int(obj.is_relocated),
+                        obj.key_region_low,
+                        obj.key_region_high,
+                        obj.decay_index,
+                        obj.envelope.offset
+                    )
+
+                    for j, attr in enumerate(['low_sample', 'prim_sample', 'high_sample']):
+                        tuned_sample = getattr(obj, attr)
+                        sample_offset = tuned_sample.sample.offset if tuned_sample and tuned_sample.sample else 0
+                        tuning = tuned_sample.tuning if tuned_sample else 0.0
+                        struct.pack_into('If', buffer, obj.offset + 8 + (j * 8), sample_offset, tuning)
+
+                case _:
+                    raise TypeError()
+
+        return buffer
+
+    def compile(self, outFolder, writeMap: bool = False):
         try:
             if self.game.upper() not in ['OOT', 'MM']:
                 return False, InvalidGameException(game=self.game)
 
-            # Reference deduplication
-            # ———————————————————————————————————————————————————————————————————————————
-            # If duplicate data exists in the bank, then the data should be replaced with
-            # already known existing data. This gives the smallest binary output possible.
-            for instrument in self.instruments:
-                self._process_instrument(instrument)
-
-            for drum in self.drums:
-                self._process_drum(drum)
-
-            for effect in self.effects:
-                self._process_effect(effect)
-
-            self.instruments = [
-                self.instrumentRegistry[instrument.get_hash()] if instrument else None
-                for instrument in self.instruments
-            ]
-            self.drums = [
-                self.drumRegistry[drum.get_hash()] if drum else None
-                for drum in self.drums
-            ]
-            self.effects = [
-                self.effectRegistry[effect.get_hash()] if effect else None
-                for effect in self.effects
-            ]
-            self.reassign_registry_refs()
-
-            # Pointer Allocation
-            allocator = MemAllocator()
-            self.assign_offsets(allocator)
-
-            # Create the buffer
-            buffer = bytearray(align_to_16(allocator.offset))
-
-            # Write drum list and effect list pointers
-            struct.pack_into('>2I', buffer, 0x00,
-                            self.drumList.offset,
-                            self.effectList.offset)
-
-            # Write Pointer Lists
-            for i, instrument in enumerate(self.instruments):
-                struct.pack_into('>I', buffer, self.instrumentList.offset + i * 4,
-                                instrument.offset if instrument else 0)
-
-            for i, drum in enumerate(self.drums):
-                struct.pack_into('>I', buffer, self.drumList.offset + i * 4,
-                                drum.offset if drum else 0)
-
-            for i, effect in enumerate(self.effects):
-                sample_offset = effect.effect_sample.offset if (effect and effect.effect_sample and effect.effect_sample.sample) else 0
-                tuning = effect.effect_sample.tuning if (effect and effect.effect_sample) else 0.0
-                struct.pack_into('>If', buffer, self.effectList.offset + i * 8, sample_offset, tuning)
-
-            # Write Structures
-            for offset, obj in sorted(allocator.entries, key=lambda x: x[0]):
-                match obj:
-                    case _ if isinstance(obj, Pointer):
-                        continue
-
-                    case _ if isEnvelope(obj):
-                        for i, val in enumerate(obj.array):
-                            struct.pack_into('>h', buffer, obj.offset + (i * 2), val)
-
-                    case _ if isVadpcmLoop(obj):
-                        preds = obj.predictors or []
-                        struct.pack_into(
-                            '>4i', buffer, obj.offset,
-                            obj.loop_start,
-                            obj.loop_end,
-                            obj.loop_count,
-                            obj.num_samples
-                        )
-                        for i, p in enumerate(preds):
-                            struct.pack_into('>h', buffer, obj.offset + 0x10 + (i * 2), p)
-
-                    case _ if isVadpcmBook(obj):
-                        struct.pack_into('>2i', buffer, obj.offset, obj.order, obj.num_predictors)
-                        for i, p in enumerate(obj.predictors):
-                            struct.pack_into('>h', buffer, obj.offset + 0x08 + (i * 2), p)
-
-                    case _ if isSample(obj):
-                        bitfield  = 0
-                        bitfield |= (obj.unk_0 & 0b1) << 31
-                        bitfield |= (obj.codec & 0b111) << 28
-                        bitfield |= (obj.medium & 0b11) << 26
-                        bitfield |= (int(obj.is_cached) & 1) << 25
-                        bitfield |= (int(obj.is_relocated) & 1) << 24
-                        bitfield |= (obj.size & 0b111111111111111111111111)
-
-                        struct.pack_into(
-                            '>4I', buffer, obj.offset,
-                            bitfield,
-                            resolve_sample_address(obj.vrom_address, self.game),
-                            obj.vadpcm_loop.offset,
-                            obj.vadpcm_book.offset
-                        )
-
-                    case _ if isDrum(obj):
-                        struct.pack_into(
-                            '>3BxIfI', buffer, obj.offset,
-                            obj.decay_index,
-                            obj.pan,
-                            int(obj.is_relocated),
-                            obj.drum_sample.sample.offset,
-                            obj.drum_sample.tuning,
-                            obj.envelope.offset
-                        )
-
-                    case _ if isInstrument(obj):
-                        struct.pack_into(
-                            '>4BI', buffer, obj.offset,
-                            int(obj.is_relocated),
-                            obj.key_region_low,
-                            obj.key_region_high,
-                            obj.decay_index,
-                            obj.envelope.offset
-                        )
-
-                        for j, attr in enumerate(['low_sample', 'prim_sample', 'high_sample']):
-                            tuned_sample = getattr(obj, attr)
-                            sample_offset = tuned_sample.sample.offset if tuned_sample and tuned_sample.sample else 0
-                            tuning = tuned_sample.tuning if tuned_sample else 0.0
-                            struct.pack_into('If', buffer, obj.offset + 8 + (j * 8), sample_offset, tuning)
-
-                    case _:
-                        raise TypeError()
+            buffer = self.build()
 
             # Write out the binary file
             # Output folder
@@ -351,6 +360,10 @@ class Audiobank:
             with open(bankPath, 'wb') as zbank:
                 zbank.write(bankBytes)
 
+            if writeMap:
+                mapPath = bankFolder / f'{self.name}.map'
+                mapPath.write_text(memory_map(self), encoding='utf-8')
+
             return True, None
         except Exception as ex:
             return False, ex
@@ -361,10 +374,6 @@ class Audiobank:
 def resolve_sample_address(addr, game):
     result = addr
     if isinstance(addr, str):
-        sample_dict = AUDIO_SAMPLE_ADDRESSES.get(addr.upper())
-        if sample_dict is not None:
-            result = sample_dict.get(game.upper(), 0)
-        else:
-            result = 0
+        result = get_sample_address(addr, game, 0)
     return result
 #endregion
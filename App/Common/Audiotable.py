@@ -0,0 +1,100 @@
+# App/Common/Audiotable.py
+
+from pathlib import Path
+import zipfile
+
+# App/Common
+from App.Common.Enums import SampleBankId
+from App.Common.Addresses import get_sample_address
+
+
+PREVIEW_GAMES = ('OOT', 'MM')
+
+
+class Audiotable:
+    """ The sample data of a game and its sample bank table. """
+
+    def __init__(self, game: str, data: bytes, index: bytes):
+        self.game = game
+        self.data = data
+
+        # (address, size) of every sample bank, a size of 0 points at another bank
+        num_entries = int.from_bytes(index[0:2], 'big')
+        self.sample_banks: list[tuple[int, int]] = [
+            (int.from_bytes(index[entry:entry + 4], 'big'), int.from_bytes(index[entry + 4:entry + 8], 'big'))
+            for entry in range(0x10, 0x10 + 0x10 * num_entries, 0x10)
+        ]
+
+    def bank_address(self, bank_id: int) -> int | None:
+        seen = set()
+        while 0 <= bank_id < len(self.sample_banks) and bank_id not in seen:
+            seen.add(bank_id)
+            address, size = self.sample_banks[bank_id]
+            if size != 0:
+                return address
+            bank_id = address
+        return None
+
+    def resolve_sample_address(self, sample, bank_id: int = SampleBankId.BANK_1) -> int | None:
+        """ Returns where a sample's data starts in the Audiotable, or None if it is not in this game. """
+        offset = sample.vrom_address
+        if isinstance(offset, str):
+            offset = get_sample_address(offset, self.game)
+        if offset is None or offset < 0:
+            return None
+
+        # Banks missing from the table fall back to the main bank
+        base = self.bank_address(bank_id)
+        if base is None:
+            base = self.bank_address(SampleBankId.BANK_0)
+        if base is None or base + offset + sample.size > len(self.data):
+            return None
+        return base + offset
+
+
+def load_audiotable(game: str, archive_path: Path) -> Audiotable:
+    """ Reads the Audiotable out of an .audiobin archive. """
+    with zipfile.ZipFile(archive_path, 'r') as z_ref:
+        data = z_ref.read('Audiotable')
+        index = z_ref.read('Audiotable_index')
+    return Audiotable(game, data, index)
+
+
+# Loaded Audiotables by game, with the archive path and mtime they were read from
+_audiotables: dict[str, tuple[Path, float, Audiotable]] = {}
+
+
+def get_audiotable(game: str) -> Audiotable | None:
+    """ Returns the Audiotable of a game from the configured audiobin folder, if it is there. """
+    from App.Common.Config import cfg
+
+    path = Path(cfg.get(cfg.audiobinfolder)) / f'{game.upper()}.audiobin'
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return None
+
+    cached = _audiotables.get(game.upper())
+    if cached is not None and cached[0] == path and cached[1] == mtime:
+        return cached[2]
+
+    try:
+        audiotable = load_audiotable(game.upper(), path)
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return None
+
+    _audiotables[game.upper()] = (path, mtime, audiotable)
+    return audiotable
+
+
+def find_sample_source(sample) -> tuple[Audiotable, int] | None:
+    """ Returns the first available Audiotable containing a sample and the sample's address in it. """
+    for game in PREVIEW_GAMES:
+        audiotable = get_audiotable(game)
+        if audiotable is None:
+            continue
+
+        address = audiotable.resolve_sample_address(sample)
+        if address is not None:
+            return audiotable, address
+    return None
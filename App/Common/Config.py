@@ -31,6 +31,7 @@ class Config(QConfig, QObject):
     backgroundChanged = Signal(str)
     presetsFolderChanged = Signal(str)
     outputFolderChanged = Signal(str)
+    audiobinFolderChanged = Signal(str)
 
     # Appearance
     dpiscale = OptionsConfigItem(
@@ -75,6 +76,28 @@ class Config(QConfig, QObject):
         default='output/',
         validator=FolderValidator()
     )
+    audiobinfolder = ConfigItem(
+        group='Folders',
+        name='AudiobinFolder',
+        default='audiobin/',
+        validator=FolderValidator()
+    )
+
+    # Compile
+    writemapfile = ConfigItem(
+        group='Compile',
+        name='WriteMapFile',
+        default=False,
+        validator=BoolValidator()
+    )
+
+    # Diagnostics, only set in config.json
+    repaintstats = ConfigItem(
+        group='Diagnostics',
+        name='RepaintStats',
+        default=False,
+        validator=BoolValidator()
+    )
 
     def set(self, item: ConfigItem, value):
         super().set(item, value)
@@ -88,6 +111,9 @@ class Config(QConfig, QObject):
         if item is self.outputfolder:
             self.outputFolderChanged.emit(value)
 
+        if item is self.audiobinfolder:
+            self.audiobinFolderChanged.emit(value)
+
 
 APP_VERSION = '0.8.0' # Major.Minor.Patch
 
@@ -0,0 +1,168 @@
+# App/Common/Envelopes.py
+
+from dataclasses import dataclass
+
+import numpy as np
+
+# App/Common
+from App.Common.Enums import EnvelopeOpcode
+from App.Common.AppExceptions import InvalidEnvelopeException
+
+
+ENVELOPE_MAX_LEVEL = 32767
+
+# Envelope delays count audio updates, about 240 per second on NTSC consoles
+ENVELOPE_TICK_RATE = 240.0
+
+ENVELOPE_END_HANG = 'hang'
+ENVELOPE_END_DISABLE = 'disable'
+ENVELOPE_END_LOOP = 'loop'
+
+
+#region Curves
+@dataclass
+class EnvelopeCurve:
+    """
+    Piecewise-linear amplitude of an envelope.
+
+    times are breakpoints in ticks and levels are gains 0.0..1.0. Like the game,
+    a point's level is the square of its normalised argument and the gain ramps
+    linearly between points. After the last breakpoint the curve holds (hang),
+    drops to silence (disable) or repeats from loop_start (loop).
+    """
+    times: np.ndarray
+    levels: np.ndarray
+    end: str = ENVELOPE_END_HANG
+    loop_start: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        return float(self.times[-1])
+
+    def evaluate(self, ticks) -> np.ndarray:
+        ticks = np.asarray(ticks, dtype=np.float64)
+
+        if self.end == ENVELOPE_END_LOOP:
+            period = self.duration - self.loop_start
+            ticks = np.where(ticks > self.duration, self.loop_start + np.mod(ticks - self.loop_start, period), ticks)
+
+        levels = np.interp(ticks, self.times, self.levels).astype(np.float32)
+
+        if self.end == ENVELOPE_END_DISABLE:
+            levels[ticks > self.duration] = 0.0
+        return levels
+
+    def sample(self, rate: float, seconds: float, tick_rate: float = ENVELOPE_TICK_RATE) -> np.ndarray:
+        """ Evaluates the curve at rate samples per second for the given length. """
+        ticks = np.arange(int(rate * seconds), dtype=np.float64) * (tick_rate / rate)
+        return self.evaluate(ticks)
+#endregion
+
+
+#region Compiling
+def iter_envelope_points(array):
+    for i in range(0, len(array) - 1, 2):
+        yield i // 2, int(array[i]), int(array[i + 1])
+
+
+def envelope_gain(arg: int) -> float:
+    """ The gain a point's level argument ramps to, squared as in the game's ADSR (SQ(arg / 32767)). """
+    level = min(max(arg, 0), ENVELOPE_MAX_LEVEL) / ENVELOPE_MAX_LEVEL
+    return level * level
+
+
+def compile_envelope(array) -> EnvelopeCurve:
+    """
+    Follows an envelope array the way the game does and returns its curve.
+
+    Raises InvalidEnvelopeException for unknown opcodes, GOTO targets
+    outside the array and GOTO cycles that never advance time.
+    """
+    points = list(iter_envelope_points(array))
+
+    time = 0.0
+    level = 0.0
+    times = [0.0]
+    levels = [0.0]
+
+    # Every (point, level) pair reached so far and the breakpoint it was reached at,
+    # revisiting one means the envelope repeats from there forever
+    seen: dict[tuple[int, float], int] = {}
+
+    index = 0
+    while index < len(points):
+        state = (index, level)
+        if state in seen:
+            start = seen[state]
+            if times[start] == time:
+                raise InvalidEnvelopeException('GOTO cycle never advances time', index)
+            return EnvelopeCurve(np.array(times), np.array(levels, dtype=np.float32), ENVELOPE_END_LOOP, times[start])
+        seen[state] = len(times) - 1
+
+        _, delay, arg = points[index]
+        match delay:
+            case EnvelopeOpcode.DISABLE:
+                return EnvelopeCurve(np.array(times), np.array(levels, dtype=np.float32), ENVELOPE_END_DISABLE)
+            case EnvelopeOpcode.HANG:
+                return EnvelopeCurve(np.array(times), np.array(levels, dtype=np.float32), ENVELOPE_END_HANG)
+            case EnvelopeOpcode.GOTO:
+                if not 0 <= arg < len(points):
+                    raise InvalidEnvelopeException(f'GOTO target {arg} is outside the envelope', index)
+                index = arg
+            case EnvelopeOpcode.RESTART:
+                # Restarting also drops the level back to silence
+                if level != 0.0:
+                    times.append(time)
+                    levels.append(0.0)
+                    level = 0.0
+                index = 0
+            case _ if delay < 0:
+                raise InvalidEnvelopeException(f'Unknown opcode {delay}', index)
+            case _:
+                time += delay
+                level = envelope_gain(arg)
+                times.append(time)
+                levels.append(level)
+                index += 1
+
+    # Running off the end of the array leaves the level where it is
+    return EnvelopeCurve(np.array(times), np.array(levels, dtype=np.float32), ENVELOPE_END_HANG)
+
+
+def evaluate_envelopes(curves: list[EnvelopeCurve], ticks) -> np.ndarray:
+    """ Evaluates many curves at the same ticks, one row per curve. """
+    ticks = np.asarray(ticks, dtype=np.float64)
+    result = np.empty((len(curves), len(ticks)), dtype=np.float32)
+    for row, curve in enumerate(curves):
+        result[row] = curve.evaluate(ticks)
+    return result
+#endregion
+
+
+#region Lint
+def lint_envelope(array) -> list[str]:
+    """ Returns human readable problems with an envelope array, empty if there are none. """
+    problems = []
+
+    if len(array) % 2:
+        problems.append('The array has an odd number of values, the last one is ignored')
+
+    points = list(iter_envelope_points(array))
+    if not points:
+        return problems + ['The envelope has no points']
+
+    for index, delay, arg in points:
+        if delay > 0 and not 0 <= arg <= ENVELOPE_MAX_LEVEL:
+            problems.append(f'Point {index}: level {arg} is outside 0..{ENVELOPE_MAX_LEVEL}')
+
+    terminators = (EnvelopeOpcode.DISABLE, EnvelopeOpcode.HANG, EnvelopeOpcode.GOTO, EnvelopeOpcode.RESTART)
+    if points[-1][1] not in terminators:
+        problems.append('The envelope does not end with DISABLE, HANG, GOTO or RESTART')
+
+    try:
+        compile_envelope(array)
+    except InvalidEnvelopeException as ex:
+        problems.append(str(ex))
+
+    return problems
+#endregion
@@ -0,0 +1,73 @@
+# App/Common/Frames.py
+
+import time
+
+from PySide6.QtCore import QObject, QEvent, QTimer
+from PySide6.QtWidgets import QApplication
+
+
+class FrameGovernor(QObject):
+    """
+    Coalesces work requested faster than the frame budget. Each scheduled callback
+    runs once on the next frame, and frames are never closer than the budget. When
+    nothing is scheduled no timer runs.
+    """
+    def __init__(self, fps: int = 60, parent=None):
+        super().__init__(parent)
+        self.budget = 1.0 / fps
+        self.pending: dict = {}
+        self.lastFrame = 0.0
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._runFrame)
+
+    def schedule(self, callback):
+        """ Runs the callback on the next frame, requests already waiting are merged. """
+        self.pending[callback] = None
+        if self.timer.isActive():
+            return
+
+        wait = self.lastFrame + self.budget - time.perf_counter()
+        self.timer.start(max(0, int(wait * 1000)))
+
+    def flush(self):
+        if self.timer.isActive():
+            self.timer.stop()
+            self._runFrame()
+
+    def _runFrame(self):
+        self.lastFrame = time.perf_counter()
+        callbacks, self.pending = self.pending, {}
+        for callback in callbacks:
+            callback()
+
+
+class RepaintCounter(QObject):
+    """ Counts paint events application wide and prints the rate once a second. """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.count = 0
+        self.widgets: set[str] = set()
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self._report)
+
+    def start(self):
+        QApplication.instance().installEventFilter(self)
+        self.timer.start(1000)
+
+    def stop(self):
+        QApplication.instance().removeEventFilter(self)
+        self.timer.stop()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            self.count += 1
+            self.widgets.add(type(obj).__name__)
+        return False
+
+    def _report(self):
+        print(f'[RepaintCounter] {self.count} repaints/s across {len(self.widgets)} widget types')
+        self.count = 0
+        self.widgets.clear()
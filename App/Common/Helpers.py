@@ -1,12 +1,10 @@
 # App/Common/Helpers.py
 
-from io import BytesIO
-from PIL import Image
 from copy import deepcopy
 from hashlib import sha256
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap, QPainter, QIcon, QColor
+from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QPixmap, QPainter, QIcon, QColor, QImage
 from PySide6.QtWidgets import QApplication
 
 from qfluentwidgets import ComboBox
@@ -25,7 +23,7 @@ def stable_hash(*parts: object, length: int = 32) -> str:
 
 #region Sample Retrieval
 def has_valid_address(preset, game_id: str, preset_type: str) -> bool:
-    from App.Common.Addresses import AUDIO_SAMPLE_ADDRESSES
+    from App.Common.Addresses import get_sample_address
     from App.Common.Constants import SAMPLE_FIELDS
 
     sample_fields = SAMPLE_FIELDS.get(preset_type, [])
@@ -33,9 +31,7 @@ def has_valid_address(preset, game_id: str, preset_type: str) -> bool:
         sample_obj = getattr(preset, field, None)
         if not sample_obj or not sample_obj.sample:
             continue
-        sample_name = sample_obj.sample.name
-        sample_entry = AUDIO_SAMPLE_ADDRESSES.get(sample_name.upper())
-        if not sample_entry or sample_entry.get(game_id, -1) == -1:
+        if get_sample_address(sample_obj.sample.name, game_id) == -1:
             return False
     return True # All samples valid
 #endregion
@@ -55,31 +51,18 @@ def patch_combo_setCurrentIndex(combo: ComboBox):
         combo.currentTextChanged.emit(text)
 
     combo.setCurrentIndex = new_setCurrentIndex
-
-
-def populate_combo_box(combo, builtin_list, user_list, target_obj=None, add_none=False):
-    combo.clear()
-
-    if add_none:
-        combo.addItem('None', userData=None)
-
-    for item in builtin_list:
-        combo.addItem(item.name, userData=item)
-
-    for item in user_list:
-        combo.addItem(item.name, userData=item)
-
-    patch_combo_setCurrentIndex(combo)
-
-    if target_obj is not None:
-        index = combo.findData(target_obj)
-        if index >= 0:
-            combo.setCurrentIndex(index)
 #endregion
 
 
 #region Image Helpers
-def load_image_and_resize_image(path: str, target_size, keep_aspect=True, upscale=False, max_dim=1080) -> QPixmap:
+def load_image_and_resize_image(path: str, target_size, keep_aspect=True, upscale=False, max_dim=1080) -> QImage:
+    """
+    Decodes and resizes an image with PIL. The RGBA pixels are handed to the QImage
+    as they are, which keeps a reference to them. No Qt pixmaps are involved, so this
+    can run on a worker thread.
+    """
+    from PIL import Image
+
     try:
         with Image.open(path) as img:
             if max(img.size) > max_dim:
@@ -93,27 +76,35 @@ def load_image_and_resize_image(path: str, target_size, keep_aspect=True, upscal
                 else:
                     img = img.resize(target_size, Image.Resampling.LANCZOS)
 
-            buffer = BytesIO()
-            img.save(buffer, format='PNG')
+            if img.mode != 'RGBA':
+                img = img.convert('RGBA')
 
-            pixmap = QPixmap()
-            pixmap.loadFromData(buffer.getvalue())
-            return pixmap
+            data = img.tobytes('raw', 'RGBA')
+            return QImage(data, img.width, img.height, img.width * 4, QImage.Format.Format_RGBA8888)
     except Exception as e:
         print(f'Error loading image file: {e}')
-        return QPixmap()
+        return QImage()
 
 
-def apply_opacity_to_pixmap(pixmap: QPixmap, opacity: float) -> QPixmap:
+def composite_background(image: QImage, size: QSize, opacity: float) -> QImage:
+    """
+    Scales an image to cover the size and bakes in its opacity. Only QImage and
+    QPainter on images are used, so this is safe to run on a worker thread.
+    """
+    scaled = image.scaled(
+        size,
+        Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+        Qt.TransformationMode.SmoothTransformation
+    )
     if opacity >= 1.0:
-        return pixmap
+        return scaled
 
-    result = QPixmap(pixmap.size())
+    result = QImage(scaled.size(), QImage.Format.Format_ARGB32_Premultiplied)
     result.fill(Qt.GlobalColor.transparent)
 
     painter = QPainter(result)
     painter.setOpacity(opacity)
-    painter.drawPixmap(0, 0, pixmap)
+    painter.drawImage(0, 0, scaled)
     painter.end()
     return result
 #endregion
@@ -169,6 +160,16 @@ def pad_to_16(b: bytes) -> bytes:
 
 
 #region Object Helpers
+def preset_key(preset):
+    """
+    Identity of a preset that survives copies, the struct's unique id. Presets
+    without one fall back to the object id.
+    """
+    if preset is None:
+        return None
+    return getattr(preset, '_unique_id', None) or id(preset)
+
+
 def clone_bank(original, new_name: str = '', game=''):
     """ Clones an audiobank while preserving original references. """
     from App.Common.Audiobank import Audiobank
@@ -187,6 +188,25 @@ def clone_bank(original, new_name: str = '', game=''):
     return cloned
 
 
+def bank_samples(bank) -> dict:
+    """ Unique samples referenced by a bank, keyed by hash. """
+    samples = {}
+    for instrument in bank.instruments:
+        if instrument:
+            for tuned_sample in (instrument.low_sample, instrument.prim_sample, instrument.high_sample):
+                if tuned_sample and tuned_sample.sample:
+                    samples[tuned_sample.sample.get_hash()] = tuned_sample.sample
+
+    for drum in bank.drums:
+        if drum and drum.drum_sample and drum.drum_sample.sample:
+            samples[drum.drum_sample.sample.get_hash()] = drum.drum_sample.sample
+
+    for effect in bank.effects:
+        if effect and effect.effect_sample and effect.effect_sample.sample:
+            samples[effect.effect_sample.sample.get_hash()] = effect.effect_sample.sample
+    return samples
+
+
 def clone_struct(original, new_name: str = ''):
     from App.Common.Structs import Instrument, Drum, Effect, Sample, Envelope
 
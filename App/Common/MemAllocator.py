@@ -1,19 +1,30 @@
 # App/Common/MemAllocator.py
 
+from typing import NamedTuple
+
+
+class MemEntry(NamedTuple):
+    offset: int
+    obj: object
+    size: int
+    padding: int        # Alignment bytes skipped before the entry
+
+
 class MemAllocator:
     def __init__(self, start=0x0F):
         self.offset = start
-        self.entries = []
+        self.entries: list[MemEntry] = []
 
     def reserve_mem(self, obj, size, align=0x0F, already_aligned=False):
+        start = self.offset
         if not already_aligned:
             self.offset = self._align_mem(self.offset, align)
 
         obj.offset = self.offset
-        self.entries.append((self.offset, obj))
+        self.entries.append(MemEntry(self.offset, obj, size, self.offset - start))
         self.offset += size
 
         return obj.offset
 
     def _align_mem(self, memory, alignment):
-        return (memory + alignment) & ~alignment
\ No newline at end of file
+        return (memory + alignment) & ~alignment
@@ -0,0 +1,106 @@
+# App/Common/MemoryMap.py
+
+from dataclasses import dataclass
+
+# App/Common
+from App.Common.Structs import (
+    isInstrument, isDrum, isSample, isVadpcmLoop, isVadpcmBook, isEnvelope
+)
+from App.Common.Helpers import align_to_16
+
+
+# Sections in the order assign_offsets places them
+MAP_SECTIONS = ['header', 'instruments', 'drums', 'samples', 'loops', 'books', 'envelopes']
+
+
+@dataclass
+class MapSection:
+    count: int = 0
+    size: int = 0
+    padding: int = 0
+
+
+def _section(obj) -> str:
+    match obj:
+        case _ if isInstrument(obj):
+            return 'instruments'
+        case _ if isDrum(obj):
+            return 'drums'
+        case _ if isSample(obj):
+            return 'samples'
+        case _ if isVadpcmLoop(obj):
+            return 'loops'
+        case _ if isVadpcmBook(obj):
+            return 'books'
+        case _ if isEnvelope(obj):
+            return 'envelopes'
+    return 'header'
+
+
+def _header_entries(bank) -> list[tuple[int, int, str]]:
+    """ Pointer lists at the start of the bank, these are placed before the allocator runs. """
+    entries = [(0x00, 0x08, 'drum and effect list pointers')]
+    if bank.instruments:
+        entries.append((bank.instrumentList.offset, len(bank.instruments) * 4, 'instrument list'))
+    if bank.drumList.offset:
+        entries.append((bank.drumList.offset, len(bank.drums) * 4, 'drum list'))
+    if bank.effectList.offset:
+        entries.append((bank.effectList.offset, len(bank.effects) * 8, 'effect list'))
+    return entries
+
+
+def memory_map(bank) -> str:
+    """ Linker style map of the bank's last build, read from the allocator's entries. """
+    if bank.allocator is None:
+        raise ValueError(f"Bank '{bank.name}' has not been built")
+
+    # Loops and books have no names of their own, they are named after their samples
+    owners = {}
+    for sample in bank.sampleRegistry.values():
+        owners.setdefault(id(sample.vadpcm_loop), sample.name)
+        owners.setdefault(id(sample.vadpcm_book), sample.name)
+
+    sections = {name: MapSection() for name in MAP_SECTIONS}
+    rows = []
+    end = 0
+
+    for offset, size, name in _header_entries(bank):
+        rows.append((offset, size, offset - end, 'header', name))
+        sections['header'].count += 1
+        sections['header'].size += size
+        sections['header'].padding += offset - end
+        end = offset + size
+
+    # The gap after the pointer lists counts as padding of the first entry
+    entries = sorted(bank.allocator.entries, key=lambda entry: entry.offset)
+    if entries:
+        entries[0] = entries[0]._replace(padding=entries[0].offset - end)
+
+    for offset, obj, size, padding in entries:
+        section = _section(obj)
+        name = getattr(obj, 'name', None) or owners.get(id(obj), '')
+        rows.append((offset, size, padding, section, name))
+        sections[section].count += 1
+        sections[section].size += size
+        sections[section].padding += padding
+        end = offset + size
+
+    total = align_to_16(end)
+    lines = [
+        f'Bank:  {bank.name} ({bank.game})',
+        f'Size:  0x{total:06X} ({total} bytes)',
+        '',
+        f"{'Offset':<8}  {'Size':<8}  {'Pad':<6}  {'Section':<11}  Name",
+    ]
+    for offset, size, padding, section, name in rows:
+        lines.append(f'0x{offset:06X}  0x{size:06X}  0x{padding:04X}  {section:<11}  {name}')
+    if total > end:
+        lines.append(f'0x{end:06X}  0x{0:06X}  0x{total - end:04X}  {"end":<11}  alignment')
+
+    lines += ['', f"{'Section':<11}  {'Count':>5}  {'Size':>8}  {'Padding':>8}"]
+    for name, section in sections.items():
+        lines.append(f'{name:<11}  {section.count:>5}  {section.size:>8}  {section.padding:>8}')
+    lines.append(f"{'total':<11}  {sum(s.count for s in sections.values()):>5}  {total:>8}  "
+                 f"{sum(s.padding for s in sections.values()) + total - end:>8}")
+
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,207 @@
+# App/Common/PcmCache.py
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import blake2b
+from pathlib import Path
+from threading import Lock
+from weakref import WeakKeyDictionary
+
+import numpy as np
+
+# App/Common
+from App.Common.Vadpcm import decode_sample, decode_samples
+
+
+DEFAULT_PCM_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def audiotable_digest(audiotable) -> str:
+    return blake2b(memoryview(audiotable), digest_size=16).hexdigest()
+
+
+@dataclass
+class PcmCacheStats:
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.disk_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.hits + self.disk_hits) / self.lookups if self.lookups else 0.0
+
+
+class PcmCache:
+    """
+    Size-bounded LRU cache of decoded sample PCM.
+
+    Entries are keyed by Sample.get_hash(), the digest of the Audiotable they
+    were decoded from and the resolved address when one is given, lookups take
+    the Audiotable itself. When a cache
+    directory is set, decoded PCM is also written there as .npy files and
+    memory-mapped back on later misses, so a sample is only ever decoded once
+    per Audiotable.
+    """
+    def __init__(self, max_bytes: int = DEFAULT_PCM_CACHE_BYTES, cache_dir: Path | None = None):
+        self.max_bytes = max_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.stats = PcmCacheStats()
+        self.current_bytes = 0
+
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = Lock()
+
+        # Audiotables are treated as immutable, their digests are computed once
+        # and forgotten along with the Audiotable
+        self._digests: WeakKeyDictionary = WeakKeyDictionary()
+
+    #region Keys
+    def get_digest(self, audiotable) -> str:
+        with self._lock:
+            digest = self._digests.get(audiotable)
+        if digest is not None:
+            return digest
+
+        digest = audiotable_digest(audiotable.data)
+        with self._lock:
+            self._digests[audiotable] = digest
+        return digest
+
+    def make_key(self, sample, audiotable, address: int | None = None) -> str:
+        # The same sample read through another sample bank starts at another address
+        key = f'{sample.get_hash()}-{self.get_digest(audiotable)}'
+        return key if address is None else f'{key}-{address:X}'
+    #endregion
+
+    #region Lookups
+    def get(self, sample, audiotable, address: int | None = None) -> np.ndarray:
+        """ Returns the PCM of a sample, decoding it only if neither tier has it. """
+        key = self.make_key(sample, audiotable, address)
+        pcm = self._lookup(key)
+        if pcm is not None:
+            return pcm
+
+        return self._store(key, decode_sample(sample, audiotable.data, address))
+
+    def get_many(self, samples, audiotable, addresses=None, workers: int = 1) -> list[np.ndarray]:
+        """ Like get(), but all misses are decoded together in one batch, across workers processes if more than one. """
+        samples = list(samples)
+        if addresses is None:
+            addresses = [None] * len(samples)
+
+        keys = [self.make_key(sample, audiotable, address) for sample, address in zip(samples, addresses)]
+        results = [self._lookup(key) for key in keys]
+
+        missing = [i for i, pcm in enumerate(results) if pcm is None]
+        if missing:
+            decoded = decode_samples([samples[i] for i in missing], audiotable.data, [addresses[i] for i in missing], workers)
+            for i, pcm in zip(missing, decoded):
+                results[i] = self._store(keys[i], pcm)
+
+        return results
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def clear(self):
+        """ Drops the memory tier, files on disk are kept. """
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = PcmCacheStats()
+    #endregion
+
+    #region Internal
+    def _lookup(self, key: str) -> np.ndarray | None:
+        with self._lock:
+            pcm = self._entries.get(key)
+            if pcm is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return pcm
+
+        pcm = self._load_from_disk(key)
+        with self._lock:
+            if pcm is None:
+                self.stats.misses += 1
+                return None
+            self.stats.disk_hits += 1
+
+        self._insert(key, pcm)
+        return pcm
+
+    def _store(self, key: str, pcm: np.ndarray) -> np.ndarray:
+        # Batch decodes return views into one padded buffer, a cached view would keep
+        # all of it alive while only its own nbytes are counted
+        if pcm.base is not None:
+            pcm = pcm.copy()
+
+        # Cached arrays are shared between callers, so they must not be changed
+        pcm.flags.writeable = False
+        self._save_to_disk(key, pcm)
+        self._insert(key, pcm)
+        return pcm
+
+    def _insert(self, key: str, pcm: np.ndarray):
+        with self._lock:
+            if key in self._entries:
+                return
+
+            # Arrays larger than the whole budget are returned but never kept
+            if pcm.nbytes > self.max_bytes:
+                return
+
+            self._entries[key] = pcm
+            self.current_bytes += pcm.nbytes
+
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= evicted.nbytes
+                self.stats.evictions += 1
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / f'{key}.npy'
+
+    def _load_from_disk(self, key: str) -> np.ndarray | None:
+        if self.cache_dir is None:
+            return None
+
+        path = self._disk_path(key)
+        if not path.exists():
+            return None
+
+        try:
+            return np.load(path, mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+
+    def _save_to_disk(self, key: str, pcm: np.ndarray):
+        if self.cache_dir is None:
+            return
+
+        path = self._disk_path(key)
+        if path.exists():
+            return
+
+        # Write to a temporary file first so readers never see a partial array
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.save(f, pcm)
+            tmp_path.replace(path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+    #endregion
+
+
+pcmCache = PcmCache()
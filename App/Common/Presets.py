@@ -1,6 +1,8 @@
 # App/Common/Presets.py
 
+import threading
 import yaml
+from pathlib import Path
 
 from PySide6.QtCore import QFile, QTextStream
 
@@ -8,9 +10,24 @@ from PySide6.QtCore import QFile, QTextStream
 from App.Common.Structs import Instrument, Drum, Drumkit, Effect, TunedSample, Sample, VadpcmLoop, VadpcmBook, Envelope
 from App.Common.Audiobank import Audiobank
 from App.Common.Serialization import bank_from_dict, drumkit_from_dict, instrument_from_dict, drum_from_dict, effect_from_dict, sample_from_dict, envelope_from_dict
+from App.Common.SignalBus import signalBus
+from App.Common.Workers import run_in_background
 
-# App/Resources
-from App.Resources.Presets.PresetPaths import BANKS_PATHS, DRUMKITS_PATHS, INSTRUMENTS_PATHS, SAMPLES_PATHS, ENVELOPES_PATHS
+
+# Store attribute holding each preset type
+PRESET_TYPES = {
+    Instrument: 'instruments',
+    Drum: 'drums',
+    Effect: 'effects',
+    Sample: 'samples',
+    Envelope: 'envelopes',
+    Drumkit: 'drumkits',
+    Audiobank: 'banks',
+}
+
+
+def get_preset_type(obj) -> str:
+    return PRESET_TYPES.get(type(obj), '')
 
 
 #region Base Class
@@ -30,21 +47,9 @@ class PresetStoreBase:
         key = id(obj)
         self.file_map[key] = path
 
-        match obj:
-            case Instrument():
-                self.instruments[key] = obj
-            case Drum():
-                self.drums[key] = obj
-            case Effect():
-                self.effects[key] = obj
-            case Sample():
-                self.samples[key] = obj
-            case Envelope():
-                self.envelopes[key] = obj
-            case Drumkit():
-                self.drumkits[key] = obj
-            case Audiobank():
-                self.banks[key] = obj
+        preset_type = get_preset_type(obj)
+        if preset_type:
+            getattr(self, preset_type)[key] = obj
 
         return obj
 
@@ -94,6 +99,11 @@ class PresetStoreBase:
 
     def get_path(self, key: int):
         return self.file_map.get(key)
+
+    def adopt(self, other: 'PresetStoreBase'):
+        """ Takes over the presets of a store read elsewhere and announces them. """
+        self.__dict__.update(other.__dict__)
+        signalBus.presetsChanged.emit('')
 #endregion
 
 
@@ -150,10 +160,18 @@ class BuiltinPresetStore(PresetStoreBase):
 
         self.loaded_paths.add(path)
 
-    def load_builtin_presets(self):
+    def read_builtin_presets(self):
+        from App.Resources.Presets.PresetPaths import BANKS_PATHS, DRUMKITS_PATHS, INSTRUMENTS_PATHS, SAMPLES_PATHS, ENVELOPES_PATHS
+
         for path in (ENVELOPES_PATHS + SAMPLES_PATHS + INSTRUMENTS_PATHS + DRUMKITS_PATHS + BANKS_PATHS):
             self.load_builtin_yaml(path)
 
+    def load_builtin_presets(self):
+        self.read_builtin_presets()
+
+        # An empty type tells preset models every type may have changed
+        signalBus.presetsChanged.emit('')
+
     def get_builtin_preset_list(self, game_id: str, preset_type: str):
         from App.Common.Helpers import has_valid_address
 
@@ -174,10 +192,14 @@ class UserPresetStore(PresetStoreBase):
 
     def clear(self):
         self.__init__()
+        signalBus.presetsChanged.emit('')
 
     def load_user_presets(self, preset_dir):
-        self.clear()
+        self.__init__()
+        self.read_user_presets(preset_dir)
+        signalBus.presetsChanged.emit('')
 
+    def read_user_presets(self, preset_dir):
         type_map = {
             'bank': bank_from_dict,
             'drumkit': drumkit_from_dict,
@@ -221,28 +243,31 @@ class UserPresetStore(PresetStoreBase):
         return user_list
 
     def add_preset(self, obj, path=None):
+        preset_type = get_preset_type(obj)
+        exists = preset_type and id(obj) in getattr(self, preset_type)
+
+        # Adding a stored preset again only updates its path
         self.register(obj, path)
+        if exists:
+            signalBus.presetUpdated.emit(obj)
+        else:
+            signalBus.presetAdded.emit(obj)
 
     def remove_preset(self, obj):
         key = id(obj)
 
-        match obj:
-            case Instrument():
-                self.instruments.pop(key, None)
-            case Drum():
-                self.drums.pop(key, None)
-            case Effect():
-                self.effects.pop(key, None)
-            case Sample():
-                self.samples.pop(key, None)
-            case Envelope():
-                self.envelopes.pop(key, None)
-            case Drumkit():
-                self.drumkits.pop(key, None)
-            case Audiobank():
-                self.banks.pop(key, None)
+        preset_type = get_preset_type(obj)
+        removed = preset_type and getattr(self, preset_type).pop(key, None) is not None
 
         self.file_map.pop(key, None)
+        if removed:
+            signalBus.presetRemoved.emit(obj)
+
+    def update_preset(self, obj):
+        """ Announces a stored preset that was edited in place. """
+        preset_type = get_preset_type(obj)
+        if preset_type and id(obj) in getattr(self, preset_type):
+            signalBus.presetUpdated.emit(obj)
 
     def replace_preset(self, old_preset, new_preset):
         self.remove_preset(old_preset)
@@ -252,17 +277,20 @@ class UserPresetStore(PresetStoreBase):
 
 #region Preset Registry
 class PresetRegistry:
+    """ Shared by the UI thread and preset loading workers, so lookups go through a lock. """
     def __init__(self):
         self._registry = {}
         self.id_map: dict[int, object] = {}
+        self._lock = threading.Lock()
 
     def get_or_register(self, obj):
         key = id(obj)
-        if key in self._registry:
-            return self._registry[key]
+        with self._lock:
+            if key in self._registry:
+                return self._registry[key]
 
-        self._registry[key] = obj
-        self.id_map[key] = obj
+            self._registry[key] = obj
+            self.id_map[key] = obj
         return obj
 
     def get_by_id(self, key: int):
@@ -273,8 +301,81 @@ class PresetRegistry:
 #endregion
 
 
+#region Background Loading
+def read_builtin_store() -> BuiltinPresetStore:
+    store = BuiltinPresetStore()
+    store.read_builtin_presets()
+    return store
+
+
+def read_user_store(preset_dir: Path) -> UserPresetStore:
+    store = UserPresetStore()
+    store.read_user_presets(preset_dir)
+    return store
+
+
+class PresetLoader:
+    """
+    Reads presets on a worker into new stores, the shared stores are never touched off
+    the UI thread. Parsing still registers every preset in the shared presetRegistry
+    from the worker, which is why the registry locks. Built-in presets are read first since user presets refer to them,
+    each store is swapped in as soon as it is read so views fill in stage by stage.
+    A load started while another runs supersedes it.
+    """
+    def __init__(self):
+        self.generation = 0
+        self.loading = False
+
+    def load(self, preset_dir: Path, on_finished=None):
+        self.generation += 1
+        self.loading = True
+        generation = self.generation
+
+        def finish():
+            if generation == self.generation:
+                self.loading = False
+            if on_finished is not None:
+                on_finished()
+
+        def read_user():
+            run_in_background(
+                read_user_store, preset_dir,
+                on_finished=lambda store: on_user_read(store),
+                on_failed=lambda ex: on_failed('user', ex),
+            )
+
+        def on_builtin_read(store: BuiltinPresetStore):
+            if generation == self.generation:
+                builtinPresetStore.adopt(store)
+            read_user()
+
+        def on_user_read(store: UserPresetStore):
+            if generation == self.generation:
+                userPresetStore.adopt(store)
+            finish()
+
+        def on_failed(stage: str, ex: Exception):
+            print(f'[PresetLoader] Failed to read {stage} presets: {ex}')
+            if stage == 'builtin':
+                read_user()
+            else:
+                finish()
+
+        # Built-in presets never change once read
+        if builtinPresetStore.loaded_paths:
+            read_user()
+        else:
+            run_in_background(
+                read_builtin_store,
+                on_finished=on_builtin_read,
+                on_failed=lambda ex: on_failed('builtin', ex),
+            )
+#endregion
+
+
 #region Instantiate
 presetRegistry = PresetRegistry()
 builtinPresetStore = BuiltinPresetStore()
 userPresetStore = UserPresetStore()
+presetLoader = PresetLoader()
 #endregion
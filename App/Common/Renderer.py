@@ -0,0 +1,377 @@
+# App/Common/Renderer.py
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+import os
+import struct
+import wave
+
+import numpy as np
+
+# App/Common
+from App.Common.Enums import AudioSampleLoopCount, SampleBankId
+from App.Common.Envelopes import EnvelopeCurve, compile_envelope, ENVELOPE_TICK_RATE
+from App.Common.AppExceptions import InvalidEnvelopeException
+from App.Common.PcmCache import pcmCache
+from App.Common.Vadpcm import decode_samples
+
+
+RENDER_SAMPLE_RATE = 32000
+
+# Instruments are chosen with programs, program 0x7F plays the bank's drums
+DRUM_PROGRAM = 0x7F
+MIDI_DRUM_CHANNEL = 9
+
+# z64 semitones start at MIDI note 21 (A0), semitone 39 is middle C
+SEMITONE_MIDI_OFFSET = 21
+MIDDLE_C_SEMITONE = 39
+
+CENTER_PAN = 64
+
+# Notes fade out over a fixed time when released, the game's decay tables are not modeled
+RELEASE_SECONDS = 0.1
+
+# Voices below this many output samples are not worth sending to another process
+PARALLEL_MIN_SAMPLES = RENDER_SAMPLE_RATE * 8
+RENDER_CHUNK_VOICES = 64
+
+
+@dataclass
+class RenderEvent:
+    time: float      # Seconds
+    program: int     # Instrument index, or DRUM_PROGRAM
+    key: int         # MIDI note
+    velocity: int    # 0..127
+    duration: float  # Seconds until the note is released
+
+
+#region Voices
+@dataclass
+class Voice:
+    start: int                     # Output sample index
+    held: int                      # Output samples until release
+    release: int                   # Output samples of the release fade
+    step: float                    # Sample frames advanced per output sample
+    gain: float
+    pan: int
+    curve: EnvelopeCurve | None    # None plays at full level
+
+
+def _pan_gains(pan: int) -> tuple[float, float]:
+    """ Equal power pan, 0 is hard left and 127 hard right. """
+    angle = min(max(pan, 0), 127) / 127 * (np.pi / 2)
+    return float(np.cos(angle)), float(np.sin(angle))
+
+
+def _envelope_levels(voice: Voice, rate: int) -> np.ndarray:
+    if voice.curve is None:
+        levels = np.ones(voice.held, dtype=np.float32)
+    else:
+        levels = voice.curve.evaluate(np.arange(voice.held, dtype=np.float64) * (ENVELOPE_TICK_RATE / rate)).astype(np.float32)
+
+    last = levels[-1] if voice.held else np.float32(1.0)
+    fade = np.linspace(last, 0.0, voice.release, endpoint=False, dtype=np.float32)
+    return np.concatenate([levels, fade])
+
+
+def _render_voices(pcm: np.ndarray, loop_start: int, loop_end: int, looped: bool, voices: list[Voice], rate: int) -> tuple[int, np.ndarray]:
+    """
+    Resamples one sample for every voice playing it.
+
+    Returns the voices mixed into one stereo block and the output sample
+    index it starts at, so a worker sends back a single array.
+    """
+    source = pcm.astype(np.float32) / 32768.0
+    source = np.append(source, source[-1:] if len(source) else np.zeros(1, dtype=np.float32))
+
+    offset = min(voice.start for voice in voices)
+    mix = np.zeros((max(voice.start + voice.held + voice.release for voice in voices) - offset, 2), dtype=np.float32)
+
+    for voice in voices:
+        length = voice.held + voice.release
+        positions = np.arange(length, dtype=np.float64) * voice.step
+
+        if looped:
+            period = loop_end - loop_start
+            positions = np.where(positions >= loop_end, loop_start + np.mod(positions - loop_start, period), positions)
+        else:
+            # One-shot samples end when the data runs out
+            length = min(length, int(np.ceil((len(pcm) - 1) / voice.step)) if len(pcm) > 1 else 0)
+            positions = positions[:length]
+
+        if length <= 0:
+            continue
+
+        # Linear interpolation between neighbouring frames
+        indices = positions.astype(np.int64)
+        fractions = (positions - indices).astype(np.float32)
+        mono = source[indices] + (source[indices + 1] - source[indices]) * fractions
+        mono *= _envelope_levels(voice, rate)[:length] * voice.gain
+
+        left, right = _pan_gains(voice.pan)
+        start = voice.start - offset
+        mix[start:start + length, 0] += mono * left
+        mix[start:start + length, 1] += mono * right
+
+    return offset, mix
+#endregion
+
+
+#region Rendering
+def _select_tuned_sample(bank, event: RenderEvent):
+    """ Returns the tuned sample, semitone offset used for pitch, and pan of an event. """
+    semitone = event.key - SEMITONE_MIDI_OFFSET
+
+    if event.program == DRUM_PROGRAM:
+        if not 0 <= semitone < len(bank.drums) or bank.drums[semitone] is None:
+            return None
+        drum = bank.drums[semitone]
+        return drum.drum_sample, drum.envelope, 0, drum.pan
+
+    if not 0 <= event.program < len(bank.instruments) or bank.instruments[event.program] is None:
+        return None
+
+    instrument = bank.instruments[event.program]
+    if semitone < instrument.key_region_low and instrument.low_sample:
+        tuned_sample = instrument.low_sample
+    elif semitone > instrument.key_region_high and instrument.high_sample:
+        tuned_sample = instrument.high_sample
+    else:
+        tuned_sample = instrument.prim_sample
+
+    return tuned_sample, instrument.envelope, semitone - MIDDLE_C_SEMITONE, CENTER_PAN
+
+
+def _compile_curve(envelope, curves: dict) -> EnvelopeCurve | None:
+    if envelope is None:
+        return None
+    if id(envelope) not in curves:
+        try:
+            curves[id(envelope)] = compile_envelope(envelope.array)
+        except InvalidEnvelopeException:
+            curves[id(envelope)] = None
+    return curves[id(envelope)]
+
+
+def plan_voices(bank, events: list[RenderEvent], audiotable, sample_bank_id: int | None = None, rate: int = RENDER_SAMPLE_RATE):
+    """
+    Turns events into voices grouped by the sample they play.
+
+    Returns {id(sample): (sample, address, voices)}. Events whose program, key
+    or sample cannot be resolved are skipped.
+    """
+    if sample_bank_id is None:
+        table_entry = getattr(bank, 'tableEntry', None)
+        sample_bank_id = table_entry.sampleBankId_1 if table_entry is not None else SampleBankId.BANK_1
+
+    release = int(RELEASE_SECONDS * rate)
+    curves = {}
+    groups = {}
+    for event in events:
+        selected = _select_tuned_sample(bank, event)
+        if selected is None:
+            continue
+
+        tuned_sample, envelope, semitones, pan = selected
+        if tuned_sample is None or tuned_sample.sample is None:
+            continue
+
+        sample = tuned_sample.sample
+        if id(sample) not in groups:
+            address = audiotable.resolve_sample_address(sample, sample_bank_id)
+            if address is None:
+                continue
+            groups[id(sample)] = (sample, address, [])
+
+        groups[id(sample)][2].append(Voice(
+            start=int(event.time * rate),
+            held=max(int(event.duration * rate), 1),
+            release=release,
+            step=tuned_sample.tuning * 2.0 ** (semitones / 12) * (RENDER_SAMPLE_RATE / rate),
+            gain=(event.velocity / 127) ** 2,
+            pan=pan,
+            curve=_compile_curve(envelope, curves),
+        ))
+
+    return groups
+
+
+def render_bank(bank, events: list[RenderEvent], audiotable, sample_bank_id: int | None = None, rate: int = RENDER_SAMPLE_RATE, workers: int | None = None) -> np.ndarray:
+    """
+    Renders events played on a bank to a float32 (num_frames, 2) array.
+
+    Samples are decoded once through pcmCache. Voices are resampled per
+    sample with vectorized linear interpolation, and large jobs are spread
+    across a process pool with one task per sample.
+    """
+    groups = plan_voices(bank, events, audiotable, sample_bank_id, rate)
+    if not groups:
+        return np.zeros((0, 2), dtype=np.float32)
+
+    entries = list(groups.values())
+    samples = [sample for sample, _, _ in entries]
+    addresses = [address for _, address, _ in entries]
+
+    # Banks read by the Tools extractor have no preset hashes to cache by
+    if all(hasattr(sample, 'get_hash') for sample in samples):
+        pcms = pcmCache.get_many(samples, audiotable, addresses)
+    else:
+        pcms = decode_samples(samples, audiotable.data, addresses)
+
+    tasks = []
+    for (sample, _, voices), pcm in zip(entries, pcms):
+        loop = sample.vadpcm_loop
+        looped = loop.loop_count != AudioSampleLoopCount.NO_LOOP and 0 <= loop.loop_start < loop.loop_end <= len(pcm)
+
+        # Split long runs of voices into time ordered chunks so every worker gets a share
+        voices.sort(key=lambda voice: voice.start)
+        for i in range(0, len(voices), RENDER_CHUNK_VOICES):
+            tasks.append((np.asarray(pcm), loop.loop_start, loop.loop_end, looped, voices[i:i + RENDER_CHUNK_VOICES], rate))
+
+    total_samples = sum(voice.held + voice.release for task in tasks for voice in task[4])
+    workers = workers if workers is not None else os.cpu_count() or 1
+
+    if workers > 1 and len(tasks) > 1 and total_samples >= PARALLEL_MIN_SAMPLES:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_render_voices, *zip(*tasks)))
+    else:
+        results = [_render_voices(*task) for task in tasks]
+
+    mix = np.zeros((max(offset + len(block) for offset, block in results), 2), dtype=np.float32)
+    for offset, block in results:
+        mix[offset:offset + len(block)] += block
+
+    return mix
+
+
+def audition_events(bank, note_seconds: float = 1.0, gap_seconds: float = 0.25, key: int = 60) -> list[RenderEvent]:
+    """ Plays every instrument at key, then every drum once. """
+    events = []
+    time = 0.0
+    for program, instrument in enumerate(bank.instruments):
+        if instrument is None:
+            continue
+        events.append(RenderEvent(time, program, key, 100, note_seconds))
+        time += note_seconds + gap_seconds
+
+    for index, drum in enumerate(bank.drums):
+        if drum is None:
+            continue
+        events.append(RenderEvent(time, DRUM_PROGRAM, index + SEMITONE_MIDI_OFFSET, 100, note_seconds / 2))
+        time += (note_seconds + gap_seconds) / 2
+
+    return events
+
+
+def write_wav(path: Path, audio: np.ndarray, rate: int = RENDER_SAMPLE_RATE, normalize: bool = True):
+    """ Writes a float stereo array as 16-bit PCM. """
+    peak = float(np.abs(audio).max()) if len(audio) else 0.0
+    if normalize and peak > 0.0:
+        audio = audio * (0.98 / peak)
+
+    data = (np.clip(audio, -1.0, 1.0) * 32767).astype('<i2')
+    with wave.open(str(path), 'wb') as f:
+        f.setnchannels(2)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(data.tobytes())
+#endregion
+
+
+#region MIDI
+def _read_varlen(data: bytes, pos: int) -> tuple[int, int]:
+    value = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            return value, pos
+
+
+def read_midi_events(path: Path) -> list[RenderEvent]:
+    """
+    Reads the notes of a standard MIDI file.
+
+    Program changes choose instruments per channel and channel 10 plays drums.
+    Tempo changes are honoured, everything else is ignored.
+    """
+    data = Path(path).read_bytes()
+    if data[0:4] != b'MThd':
+        raise ValueError(f'{path} is not a MIDI file')
+
+    header_length, _, num_tracks, division = struct.unpack('>IHHH', data[4:14])
+    if division & 0x8000:
+        raise ValueError('SMPTE time division is not supported')
+
+    # (tick, order, kind, channel, a, b) from every track, merged and sorted later
+    messages = []
+    tempos = [(0, 500000)]
+    pos = 8 + header_length
+    for _ in range(num_tracks):
+        if data[pos:pos + 4] != b'MTrk':
+            break
+        length = struct.unpack('>I', data[pos + 4:pos + 8])[0]
+        end = pos + 8 + length
+        pos += 8
+
+        tick = 0
+        status = 0
+        while pos < end:
+            delta, pos = _read_varlen(data, pos)
+            tick += delta
+
+            if data[pos] & 0x80:
+                status = data[pos]
+                pos += 1
+
+            if status == 0xFF:
+                meta_type = data[pos]
+                meta_length, pos = _read_varlen(data, pos + 1)
+                if meta_type == 0x51 and meta_length == 3:
+                    tempos.append((tick, int.from_bytes(data[pos:pos + 3], 'big')))
+                pos += meta_length
+            elif status in (0xF0, 0xF7):
+                sysex_length, pos = _read_varlen(data, pos)
+                pos += sysex_length
+            else:
+                kind, channel = status & 0xF0, status & 0x0F
+                if kind in (0xC0, 0xD0):
+                    messages.append((tick, len(messages), kind, channel, data[pos], 0))
+                    pos += 1
+                else:
+                    messages.append((tick, len(messages), kind, channel, data[pos], data[pos + 1]))
+                    pos += 2
+        pos = end
+
+    # Tick to seconds through the tempo map
+    tempos.sort()
+    def to_seconds(tick: int) -> float:
+        seconds = 0.0
+        last_tick, tempo = 0, 500000
+        for change_tick, change_tempo in tempos:
+            if change_tick > tick:
+                break
+            seconds += (change_tick - last_tick) * tempo / (division * 1e6)
+            last_tick, tempo = change_tick, change_tempo
+        return seconds + (tick - last_tick) * tempo / (division * 1e6)
+
+    programs = [0] * 16
+    held: dict[tuple[int, int], tuple[float, int, int]] = {}
+    events = []
+    for tick, _, kind, channel, a, b in sorted(messages):
+        if kind == 0xC0:
+            programs[channel] = a
+        elif kind == 0x90 and b > 0:
+            program = DRUM_PROGRAM if channel == MIDI_DRUM_CHANNEL else programs[channel]
+            held[(channel, a)] = (to_seconds(tick), program, b)
+        elif kind == 0x80 or (kind == 0x90 and b == 0):
+            start = held.pop((channel, a), None)
+            if start is not None:
+                time, program, velocity = start
+                events.append(RenderEvent(time, program, a, velocity, max(to_seconds(tick) - time, 0.0)))
+
+    events.sort(key=lambda event: event.time)
+    return events
+#endregion
@@ -0,0 +1,397 @@
+# App/Common/Sequence.py
+
+from dataclasses import dataclass, field
+from itertools import product
+from pathlib import Path
+
+# App/Common
+from App.Common.Audiobank import Audiobank
+from App.Common.AppExceptions import IncompleteSequenceException
+from App.Common.Helpers import clone_bank, bank_samples
+
+
+# Instrument ids past the bank's instrument list select drums, sound effects and synthetic waves
+SEQ_EFFECTS_INSTRUMENT = 0x7E
+SEQ_DRUMS_INSTRUMENT = 0x7F
+
+# Channels that never select an instrument play with the player's default
+SEQ_DEFAULT_INSTRUMENTS = frozenset({0, SEQ_DRUMS_INSTRUMENT})
+
+SEQ_NUM_LAYERS = 4
+
+# Argument sizes in bytes for commands with fixed arguments. Commands missing from these
+# tables are either handled by the walker or unknown, unknown commands stop the analysis
+# of their script since the following bytes can not be decoded reliably.
+SEQ_ARG_SIZES = {
+    0xC4: 2, 0xC5: 2, 0xC7: 3, 0xC8: 1, 0xC9: 1, 0xCC: 1, 0xCE: 1,
+    0xD0: 1, 0xD1: 2, 0xD2: 2, 0xD3: 1, 0xD4: 0, 0xD5: 1, 0xD6: 2, 0xD7: 2,
+    0xD9: 1, 0xDA: 3, 0xDB: 1, 0xDC: 1, 0xDD: 1, 0xF0: 0, 0xF1: 1,
+}
+
+CHANNEL_ARG_SIZES = {
+    0xC1: 1, 0xC2: 2, 0xC3: 0, 0xC4: 0, 0xC5: 0, 0xC6: 1, 0xC8: 1, 0xC9: 1,
+    0xCA: 1, 0xCB: 2, 0xCC: 1, 0xD0: 1, 0xD1: 1, 0xD2: 1, 0xD3: 1, 0xD4: 1,
+    0xD7: 1, 0xD8: 1, 0xD9: 1, 0xDA: 2, 0xDB: 1, 0xDC: 1, 0xDD: 1, 0xDE: 2,
+    0xDF: 1, 0xE0: 1, 0xE1: 3, 0xE2: 3, 0xE3: 1, 0xE5: 1, 0xE6: 1, 0xE7: 2,
+    0xE8: 8, 0xE9: 1, 0xEB: 2, 0xEC: 0, 0xED: 1, 0xF0: 0, 0xF1: 1,
+}
+
+LAYER_ARG_SIZES = {
+    0xC1: 1, 0xC2: 1, 0xC4: 0, 0xC5: 0, 0xC6: 1, 0xC8: 0, 0xC9: 1, 0xCA: 1,
+    0xCB: 3, 0xCC: 0, 0xCD: 1, 0xCE: 1,
+}
+
+
+@dataclass
+class LayerUsage:
+    notes: set[int] = field(default_factory=set)            # Semitones before transposition
+    instruments: set[int] = field(default_factory=set)
+    transpositions: set[int] = field(default_factory=lambda: {0})
+
+
+@dataclass
+class ChannelUsage:
+    instruments: set[int] = field(default_factory=set)
+    transpositions: set[int] = field(default_factory=lambda: {0})
+    layers: set[tuple[int, bool]] = field(default_factory=set)
+
+
+@dataclass
+class SequenceUsage:
+    instruments: set[int] = field(default_factory=set)      # Instrument list indices
+    drums: set[int] = field(default_factory=set)            # Drum list indices
+    effects: bool = False
+    problems: list[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return not self.problems
+
+
+class SequenceWalker:
+    """ Statically follows every reachable path of a sequence's scripts. """
+    def __init__(self, data: bytes):
+        self.data = bytes(data)
+        self.transpositions = {0}
+        self.channels: dict[int, ChannelUsage] = {}
+        self.layers: dict[tuple[int, bool], LayerUsage] = {}
+        self.problems: list[str] = []
+
+    #region Script Reading
+    def _problem(self, message: str, address: int):
+        self.problems.append(f'0x{address:04X}: {message}')
+
+    def _u8(self, pc: int) -> int:
+        return self.data[pc]
+
+    def _s8(self, pc: int) -> int:
+        value = self.data[pc]
+        return value - 0x100 if value & 0x80 else value
+
+    def _u16(self, pc: int) -> int:
+        return (self.data[pc] << 8) | self.data[pc + 1]
+
+    def _s16(self, pc: int) -> int:
+        value = self._u16(pc)
+        return value - 0x10000 if value & 0x8000 else value
+
+    def _varlen(self, pc: int) -> int:
+        """ Size of a compressed u16, a set high bit marks a second byte. """
+        return 2 if self.data[pc] & 0x80 else 1
+
+    def _flow(self, cmd: int, pc: int) -> list[int] | None:
+        """ Successors of the flow control commands shared by every script, None if not one. """
+        match cmd:
+            case 0xFF:
+                return []
+            case 0xFC | 0xFA | 0xF9 | 0xF5:
+                return [self._u16(pc + 1), pc + 3]
+            case 0xFB:
+                return [self._u16(pc + 1)]
+            case 0xF8:
+                return [pc + 2]
+            case 0xF7 | 0xF6:
+                return [pc + 1]
+            case 0xF4:
+                return [pc + 2 + self._s8(pc + 1)]
+            case 0xF3 | 0xF2:
+                return [pc + 2 + self._s8(pc + 1), pc + 2]
+        return None
+
+    def _walk(self, start, step):
+        """ Visits every reachable state from start, step returns the successor states. """
+        pending = [start]
+        visited = set()
+        while pending:
+            state = pending.pop()
+            if state in visited:
+                continue
+            visited.add(state)
+
+            pc = state[0]
+            if not 0 <= pc < len(self.data):
+                self._problem('script address is outside the sequence', pc)
+                continue
+
+            try:
+                pending.extend(step(*state))
+            except IndexError:
+                self._problem('script runs past the end of the sequence', pc)
+
+    def walk(self):
+        self._walk((0,), self._seq_step)
+
+        for (address, large_notes), layer in self.layers.items():
+            self._walk((address, large_notes), lambda pc, large_notes, layer=layer: self._layer_step(pc, large_notes, layer))
+        return self
+    #endregion
+
+    #region Sequence Script
+    def _seq_step(self, pc: int) -> list:
+        cmd = self._u8(pc)
+
+        successors = self._flow(cmd, pc)
+        if successors is not None:
+            return [(next_pc,) for next_pc in successors]
+
+        if cmd >= 0xC0:
+            match cmd:
+                case 0xFE:
+                    return [(pc + 1,)]
+                case 0xFD:
+                    return [(pc + 1 + self._varlen(pc + 1),)]
+                case 0xDF:
+                    self.transpositions.add(self._s8(pc + 1))
+                    return [(pc + 2,)]
+                case 0xDE:
+                    self._problem('relative sequence transposition', pc)
+                    return []
+                case 0xCD:
+                    self._problem('dynamic call', pc)
+                    return []
+                case _ if cmd in SEQ_ARG_SIZES:
+                    return [(pc + 1 + SEQ_ARG_SIZES[cmd],)]
+            self._problem(f'unknown sequence command 0x{cmd:02X}', pc)
+            return []
+
+        match cmd & 0xF0:
+            case 0x00 | 0x40 | 0x50 | 0x70 | 0x80:
+                return [(pc + 1,)]
+            case 0x90:
+                self._add_channel(self._u16(pc + 1))
+                return [(pc + 3,)]
+            case 0xA0:
+                self._add_channel(pc + 3 + self._s16(pc + 1))
+                return [(pc + 3,)]
+        self._problem(f'unknown sequence command 0x{cmd:02X}', pc)
+        return []
+
+    def _add_channel(self, address: int):
+        if address in self.channels:
+            return
+
+        channel = self.channels[address] = ChannelUsage()
+        self._walk((address, False), lambda pc, large_notes: self._channel_step(pc, large_notes, channel))
+    #endregion
+
+    #region Channel Script
+    def _channel_step(self, pc: int, large_notes: bool, channel: ChannelUsage) -> list:
+        cmd = self._u8(pc)
+
+        successors = self._flow(cmd, pc)
+        if successors is not None:
+            return [(next_pc, large_notes) for next_pc in successors]
+
+        if cmd >= 0xB0:
+            match cmd:
+                case 0xFE:
+                    return [(pc + 1, large_notes)]
+                case 0xFD:
+                    return [(pc + 1 + self._varlen(pc + 1), large_notes)]
+                case 0xC1:
+                    channel.instruments.add(self._u8(pc + 1))
+                case 0xEB:
+                    channel.instruments.add(self._u8(pc + 2))
+                case 0xDB:
+                    channel.transpositions.add(self._s8(pc + 1))
+                case 0xC3:
+                    large_notes = False
+                case 0xC4:
+                    large_notes = True
+                case 0xE4:
+                    self._problem('dynamic call', pc)
+                    return []
+                case 0xC7:
+                    self._problem('sequence data is rewritten at runtime', pc)
+                    return []
+                case 0xEA:
+                    return []
+
+            if cmd not in CHANNEL_ARG_SIZES:
+                self._problem(f'unknown channel command 0x{cmd:02X}', pc)
+                return []
+            return [(pc + 1 + CHANNEL_ARG_SIZES[cmd], large_notes)]
+
+        if cmd >= 0x70:
+            index = cmd & 0x07
+            match cmd & 0xF8:
+                case 0x70 | 0x80 | 0x90:
+                    return [(pc + 1, large_notes)]
+                case 0x78 if index < SEQ_NUM_LAYERS:
+                    self._add_layer(channel, pc + 3 + self._s16(pc + 1), large_notes)
+                    return [(pc + 3, large_notes)]
+                case 0x88 if index < SEQ_NUM_LAYERS:
+                    self._add_layer(channel, self._u16(pc + 1), large_notes)
+                    return [(pc + 3, large_notes)]
+                case 0x98:
+                    self._problem('dynamic layer', pc)
+                    return []
+            self._problem(f'unknown channel command 0x{cmd:02X}', pc)
+            return []
+
+        match cmd & 0xF0:
+            case 0x00 | 0x50 | 0x60:
+                return [(pc + 1, large_notes)]
+            case 0x20:
+                self._add_channel(self._u16(pc + 1))
+                return [(pc + 3, large_notes)]
+            case 0x30 | 0x40:
+                return [(pc + 2, large_notes)]
+        self._problem(f'unknown channel command 0x{cmd:02X}', pc)
+        return []
+
+    def _add_layer(self, channel: ChannelUsage, address: int, large_notes: bool):
+        key = (address, large_notes)
+        channel.layers.add(key)
+        self.layers.setdefault(key, LayerUsage())
+    #endregion
+
+    #region Layer Script
+    def _layer_step(self, pc: int, large_notes: bool, layer: LayerUsage) -> list:
+        cmd = self._u8(pc)
+
+        successors = self._flow(cmd, pc)
+        if successors is not None:
+            return [(next_pc, large_notes) for next_pc in successors]
+
+        # Notes, the low six bits are the semitone
+        if cmd < 0xC0:
+            layer.notes.add(cmd & 0x3F)
+            size = 1
+            if large_notes:
+                match cmd & 0xC0:
+                    case 0x00:
+                        size += self._varlen(pc + 1) + 2
+                    case 0x40:
+                        size += self._varlen(pc + 1) + 1
+                    case _:
+                        size += 2
+            elif cmd < 0x80:
+                size += self._varlen(pc + 1)
+            return [(pc + size, large_notes)]
+
+        match cmd:
+            case 0xC0 | 0xC3:
+                return [(pc + 1 + self._varlen(pc + 1), large_notes)]
+            case 0xC2:
+                layer.transpositions.add(self._s8(pc + 1))
+            case 0xC6:
+                layer.instruments.add(self._u8(pc + 1))
+            case 0xC7:
+                # Special portamento modes store the time in a single byte
+                size = 3 + (1 if self._u8(pc + 1) & 0x80 else self._varlen(pc + 3))
+                return [(pc + size, large_notes)]
+            case _ if 0xD0 <= cmd < 0xF0:
+                return [(pc + 1, large_notes)]
+
+        if cmd not in LAYER_ARG_SIZES:
+            self._problem(f'unknown layer command 0x{cmd:02X}', pc)
+            return []
+        return [(pc + 1 + LAYER_ARG_SIZES[cmd], large_notes)]
+    #endregion
+
+
+#region Usage
+def sequence_usage(data: bytes) -> SequenceUsage:
+    """ Instruments and drums a sequence can select, a superset over every reachable path. """
+    walker = SequenceWalker(data).walk()
+    usage = SequenceUsage(problems=walker.problems)
+
+    for channel in walker.channels.values():
+        for key in channel.layers:
+            layer = walker.layers[key]
+            if not layer.notes:
+                continue
+
+            instruments = channel.instruments | layer.instruments or SEQ_DEFAULT_INSTRUMENTS
+            usage.instruments.update(i for i in instruments if i < SEQ_EFFECTS_INSTRUMENT)
+            usage.effects |= SEQ_EFFECTS_INSTRUMENT in instruments
+
+            # Drums are selected by the final semitone
+            if SEQ_DRUMS_INSTRUMENT in instruments:
+                for note, seq_t, channel_t, layer_t in product(
+                    layer.notes, walker.transpositions, channel.transpositions, layer.transpositions
+                ):
+                    usage.drums.add(note + seq_t + channel_t + layer_t)
+
+    return usage
+
+
+def read_sequence_usage(path: Path) -> SequenceUsage:
+    return sequence_usage(Path(path).read_bytes())
+#endregion
+
+
+#region Bank Pruning
+@dataclass
+class PruneReport:
+    original_size: int
+    pruned_size: int
+    removed_instruments: list[int]
+    removed_drums: list[int]
+    sample_bytes: int               # Sample data the pruned bank no longer references
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.original_size - self.pruned_size
+
+
+def prune_bank(bank: Audiobank, usage: SequenceUsage, new_name: str = '') -> tuple[Audiobank, PruneReport]:
+    """ Clones a bank without the instruments and drums a sequence never plays. """
+    if not usage.complete:
+        raise IncompleteSequenceException(
+            f"The sequence could not be fully analyzed, nothing was pruned ({usage.problems[0]})"
+        )
+
+    pruned = clone_bank(bank, new_name)
+    removed_instruments = [i for i, inst in enumerate(bank.instruments) if inst and i not in usage.instruments]
+    removed_drums = [i for i, drum in enumerate(bank.drums) if drum and i not in usage.drums]
+
+    for i in removed_instruments:
+        pruned.instruments[i] = None
+    for i in removed_drums:
+        pruned.drums[i] = None
+
+    # Sequences select by index, so only the unused slots at the end of each list can go
+    while pruned.instruments and pruned.instruments[-1] is None:
+        pruned.instruments.pop()
+    while pruned.drums and pruned.drums[-1] is None:
+        pruned.drums.pop()
+    pruned.tableEntry.numInstruments = len(pruned.instruments)
+    pruned.tableEntry.numDrums = len(pruned.drums)
+
+    kept_samples = bank_samples(pruned)
+    sample_bytes = sum(
+        sample.size for key, sample in bank_samples(bank).items()
+        if key not in kept_samples
+    )
+
+    report = PruneReport(
+        original_size=len(clone_bank(bank).build()),
+        pruned_size=len(clone_bank(pruned).build()),
+        removed_instruments=removed_instruments,
+        removed_drums=removed_drums,
+        sample_bytes=sample_bytes
+    )
+    return pruned, report
+#endregion
@@ -149,38 +149,42 @@ def parse_reference(ref: str) -> tuple[str, str]:
     return type_.lower(), name.lower()
 
 
-def resolve_reference(ref: str):
-    from App.Common.Presets import builtinPresetStore, userPresetStore
+def resolve_reference(ref: str, store=None):
+    from App.Common.Presets import builtinPresetStore, userPresetStore, BuiltinPresetStore
     type_, name = parse_reference(ref)
 
+    # A store still being read stands in for the shared store of its kind
+    builtin = store if isinstance(store, BuiltinPresetStore) else builtinPresetStore
+    user = store if store is not None and not isinstance(store, BuiltinPresetStore) else userPresetStore
+
     match type_:
         case 'sample':
-            return builtinPresetStore.get_sample_by_name(name) or \
-                userPresetStore.get_sample_by_name(name)
+            return builtin.get_sample_by_name(name) or \
+                user.get_sample_by_name(name)
 
         case 'envelope':
-            return builtinPresetStore.get_envelope_by_name(name) or \
-                userPresetStore.get_envelope_by_name(name)
+            return builtin.get_envelope_by_name(name) or \
+                user.get_envelope_by_name(name)
 
         case 'instrument':
-            return builtinPresetStore.get_instrument_by_name(name) or \
-                userPresetStore.get_instrument_by_name(name)
+            return builtin.get_instrument_by_name(name) or \
+                user.get_instrument_by_name(name)
 
         case 'drum':
-            return builtinPresetStore.get_drum_by_name(name) or \
-                userPresetStore.get_drum_by_name(name)
+            return builtin.get_drum_by_name(name) or \
+                user.get_drum_by_name(name)
 
         case 'effect':
-            return userPresetStore.get_effect_by_name(name)
+            return user.get_effect_by_name(name)
 
         case 'drumkit':
-            return builtinPresetStore.get_drumkit_by_name(name) or \
-                userPresetStore.get_drumkit_by_name(name)
+            return builtin.get_drumkit_by_name(name) or \
+                user.get_drumkit_by_name(name)
 
 
 def resolve_envelope(data: str | dict, store=None) -> Optional[Envelope]:
     if isinstance(data, str):
-        return resolve_reference(data)
+        return resolve_reference(data, store)
 
     env = envelope_from_dict(data)
     if store:
@@ -197,7 +201,7 @@ def resolve_tuned_sample(data: dict, store=None) -> Optional[TunedSample]:
 
     sample = None
     if isinstance(sample_ref, str):
-        sample =  resolve_reference(sample_ref)
+        sample =  resolve_reference(sample_ref, store)
 
     elif isinstance(sample_ref, dict):
         sample = sample_from_dict(sample_ref)
@@ -210,7 +214,7 @@ def resolve_tuned_sample(data: dict, store=None) -> Optional[TunedSample]:
 
 def resolve_drumkit(data: str | dict, store=None) -> list[Drum]:
     if isinstance(data, str):
-        drumkit = resolve_reference(data)
+        drumkit = resolve_reference(data, store)
         return drumkit if drumkit else []
 
     return drumkit_from_dict(data, store)
@@ -321,7 +325,7 @@ def drumkit_from_dict(data: dict, store=None) -> list[Drum]:
     for i, entry in enumerate(drum_entries):
         try:
             if isinstance(entry, str):
-                drum = resolve_reference(entry)
+                drum = resolve_reference(entry, store)
                 if not drum:
                     raise ValueError(f'Failed to resolve drum reference: {entry}')
             elif isinstance(entry, dict):
@@ -367,7 +371,7 @@ def bank_from_dict(data: dict, store) -> Audiobank:
         if entry is None or entry == "~":
             bank.instruments[i] = None
         elif isinstance(entry, str):
-            instrument = resolve_reference(entry)
+            instrument = resolve_reference(entry, store)
             if not instrument:
                 raise ValueError(f"Failed to resolve instrument reference: {entry}")
             bank.instruments[i] = instrument
@@ -380,7 +384,7 @@ def bank_from_dict(data: dict, store) -> Audiobank:
     # drums is also expected to be a list
     drum_data = data.get("drums", [])
     if isinstance(drum_data, str):
-        resolved = resolve_reference(drum_data)
+        resolved = resolve_reference(drum_data, store)
         if isinstance(resolved, Drumkit):
             bank.drums = resolved.drums
         else:
@@ -404,7 +408,7 @@ def bank_from_dict(data: dict, store) -> Audiobank:
         if entry is None or entry == "~":
             bank.effects[i] = None
         elif isinstance(entry, str):
-            effect = resolve_reference(entry)
+            effect = resolve_reference(entry, store)
             if not effect:
                 raise ValueError(f"Failed to resolve effect reference: {entry}")
             bank.effects[i] = effect
@@ -5,4 +5,10 @@ from PySide6.QtCore import QObject, Signal
 class SignalBus(QObject):
     micaEnableChanged = Signal(bool)
 
+    # User preset store
+    presetAdded = Signal(object)
+    presetRemoved = Signal(object)
+    presetUpdated = Signal(object)
+    presetsChanged = Signal(str)      # Bulk change of a preset type, e.g. 'instruments', or '' for every type
+
 signalBus = SignalBus()
\ No newline at end of file
@@ -0,0 +1,396 @@
+# App/Common/SoundFont.py
+
+from contextlib import contextmanager
+from pathlib import Path
+import math
+import os
+import struct
+
+import numpy as np
+
+# App/Common
+from App.Common.Enums import AudioSampleLoopCount
+from App.Common.Envelopes import compile_envelope, ENVELOPE_TICK_RATE, ENVELOPE_END_DISABLE, ENVELOPE_END_LOOP
+from App.Common.AppExceptions import InvalidEnvelopeException
+from App.Common.PcmCache import pcmCache
+from App.Common.Renderer import RENDER_SAMPLE_RATE, RELEASE_SECONDS, SEMITONE_MIDI_OFFSET
+
+
+# Sample data is followed by this many zero points, as the SF2 spec requires
+SF2_SAMPLE_PADDING = 46
+
+SF2_DRUM_BANK = 128
+SF2_EFFECT_BANK = 1
+
+# Generator operators
+GEN_PAN = 17
+GEN_ATTACK_VOL_ENV = 34
+GEN_DECAY_VOL_ENV = 36
+GEN_SUSTAIN_VOL_ENV = 37
+GEN_RELEASE_VOL_ENV = 38
+GEN_INSTRUMENT = 41
+GEN_KEY_RANGE = 43
+GEN_COARSE_TUNE = 51
+GEN_FINE_TUNE = 52
+GEN_SAMPLE_ID = 53
+GEN_SAMPLE_MODES = 54
+GEN_OVERRIDING_ROOT_KEY = 58
+
+MIN_TIMECENTS = -12000       # About 1 ms
+MAX_ATTENUATION_CB = 1440    # Silence
+
+
+#region RIFF Writer
+class RiffWriter:
+    """
+    Writes RIFF chunks straight to a seekable file.
+
+    Chunk sizes are written as placeholders and patched when the chunk ends,
+    so chunk contents never have to be held in memory.
+    """
+    def __init__(self, f):
+        self.f = f
+
+    @contextmanager
+    def chunk(self, chunk_id: bytes, form: bytes | None = None):
+        self.f.write(chunk_id + b'\0\0\0\0')
+        start = self.f.tell()
+        if form is not None:
+            self.f.write(form)
+
+        yield self
+
+        end = self.f.tell()
+        if (end - start) % 2:
+            self.f.write(b'\0')
+        self.f.seek(start - 4)
+        self.f.write(struct.pack('<I', end - start))
+        self.f.seek(0, os.SEEK_END)
+
+    def write(self, data):
+        self.f.write(data)
+
+    def write_chunk(self, chunk_id: bytes, data: bytes):
+        with self.chunk(chunk_id):
+            self.f.write(data)
+
+
+def _sf2_name(name: str) -> bytes:
+    return name.encode('ascii', 'replace')[:19].ljust(20, b'\0')
+
+
+def _zstr(text: str) -> bytes:
+    data = text.encode('ascii', 'replace') + b'\0'
+    return data + b'\0' if len(data) % 2 else data
+#endregion
+
+
+#region Zones
+def _tuning_generators(key: int, tuning: float) -> list[tuple[int, int]]:
+    """
+    Returns the generators that make a zone play at tuning when key is pressed.
+
+    The game plays sample frames tuning times faster at the reference key, so
+    the root key is that key shifted down by the tuning's pitch.
+    """
+    root = key - 12 * math.log2(tuning) if tuning > 0 else key
+    root_key = min(max(round(root), 0), 127)
+
+    cents = round((root_key - root) * 100)
+    coarse, fine = int(cents / 100), cents - int(cents / 100) * 100
+    return [(GEN_OVERRIDING_ROOT_KEY, root_key), (GEN_COARSE_TUNE, coarse), (GEN_FINE_TUNE, fine)]
+
+
+def _timecents(seconds: float) -> int:
+    if seconds <= 0.001:
+        return MIN_TIMECENTS
+    return max(round(1200 * math.log2(seconds)), MIN_TIMECENTS)
+
+
+def _attenuation(level: float) -> int:
+    if level <= 0.0:
+        return MAX_ATTENUATION_CB
+    return min(round(-200 * math.log10(level)), MAX_ATTENUATION_CB)
+
+
+def _envelope_generators(envelope, cache: dict) -> list[tuple[int, int]]:
+    """
+    Approximates an envelope with the SF2 volume envelope.
+
+    The attack runs to the loudest point, the decay runs from there to the end
+    of the envelope, and the sustain is the level it holds. Looping envelopes
+    sustain at their average loop level.
+    """
+    if envelope is None:
+        return []
+
+    if id(envelope) in cache:
+        return cache[id(envelope)]
+
+    try:
+        curve = compile_envelope(envelope.array)
+    except InvalidEnvelopeException:
+        cache[id(envelope)] = []
+        return []
+
+    levels = np.asarray(curve.levels, dtype=np.float64)
+    times = np.asarray(curve.times, dtype=np.float64)
+    peak = int(levels.argmax())
+    peak_level = float(levels[peak]) or 1.0
+
+    if curve.end == ENVELOPE_END_DISABLE:
+        sustain = 0.0
+    elif curve.end == ENVELOPE_END_LOOP:
+        sustain = float(levels[times >= curve.loop_start].mean())
+    else:
+        sustain = float(levels[-1])
+
+    generators = [
+        (GEN_ATTACK_VOL_ENV, _timecents(times[peak] / ENVELOPE_TICK_RATE)),
+        (GEN_DECAY_VOL_ENV, _timecents((curve.duration - times[peak]) / ENVELOPE_TICK_RATE)),
+        (GEN_SUSTAIN_VOL_ENV, _attenuation(sustain / peak_level)),
+        (GEN_RELEASE_VOL_ENV, _timecents(RELEASE_SECONDS)),
+    ]
+    cache[id(envelope)] = generators
+    return generators
+
+
+def _instrument_zones(instrument) -> list[tuple[int, int, object]]:
+    """ Returns (low key, high key, tuned sample) for each sample an instrument plays. """
+    low = instrument.key_region_low + SEMITONE_MIDI_OFFSET
+    high = instrument.key_region_high + SEMITONE_MIDI_OFFSET
+
+    zones = []
+    if instrument.low_sample and instrument.low_sample.sample:
+        zones.append((0, low - 1, instrument.low_sample))
+    else:
+        low = 0
+
+    if instrument.high_sample and instrument.high_sample.sample:
+        zones.append((high + 1, 127, instrument.high_sample))
+    else:
+        high = 127
+
+    if instrument.prim_sample and instrument.prim_sample.sample:
+        zones.append((low, high, instrument.prim_sample))
+
+    return [(min(max(lo, 0), 127), min(max(hi, 0), 127), tuned) for lo, hi, tuned in zones if lo <= hi]
+#endregion
+
+
+#region Export
+class SoundFontBuilder:
+    """ Collects the presets, instruments and zones of one SF2 file. """
+
+    def __init__(self):
+        self.presets: list[tuple[str, int, int, int]] = []             # name, program, bank, instrument index
+        self.instruments: list[tuple[str, list[list[tuple[int, int]]]]] = []
+        self.envelope_cache = {}
+
+    def add_instrument(self, name: str, zones: list[list[tuple[int, int]]], program: int, bank: int):
+        if not zones:
+            return
+        self.instruments.append((name, zones))
+        self.presets.append((name, program, bank, len(self.instruments) - 1))
+
+    def make_zone(self, low_key: int, high_key: int, key: int, tuned_sample, sample_index: int, looped: bool, envelope=None, pan: int | None = None) -> list[tuple[int, int]]:
+        # keyRange must come first and sampleID last
+        generators = [(GEN_KEY_RANGE, low_key | (high_key << 8))]
+        generators += _tuning_generators(key, tuned_sample.tuning)
+        generators += _envelope_generators(envelope, self.envelope_cache)
+        if pan is not None:
+            generators.append((GEN_PAN, round((min(max(pan, 0), 127) - 64) * 500 / 64)))
+        if looped:
+            generators.append((GEN_SAMPLE_MODES, 1))
+        generators.append((GEN_SAMPLE_ID, sample_index))
+        return generators
+
+    def write_pdta(self, riff: RiffWriter, sample_headers: list[bytes]):
+        presets = sorted(self.presets, key=lambda preset: (preset[2], preset[1]))
+
+        with riff.chunk(b'LIST', b'pdta'):
+            # One zone per preset, pointing at its instrument
+            riff.write_chunk(b'phdr', b''.join(
+                [struct.pack('<20sHHHIII', _sf2_name(name), program, bank, i, 0, 0, 0) for i, (name, program, bank, _) in enumerate(presets)]
+                + [struct.pack('<20sHHHIII', _sf2_name('EOP'), 0, 0, len(presets), 0, 0, 0)]
+            ))
+            riff.write_chunk(b'pbag', b''.join(struct.pack('<HH', i, 0) for i in range(len(presets) + 1)))
+            riff.write_chunk(b'pmod', bytes(10))
+            riff.write_chunk(b'pgen', b''.join(
+                [struct.pack('<HH', GEN_INSTRUMENT, instrument) for *_, instrument in presets] + [bytes(4)]
+            ))
+
+            inst, ibag, igen = [], [], []
+            for name, zones in self.instruments:
+                inst.append(struct.pack('<20sH', _sf2_name(name), len(ibag)))
+                for generators in zones:
+                    ibag.append(struct.pack('<HH', len(igen), 0))
+                    for operator, amount in generators:
+                        if operator == GEN_KEY_RANGE:
+                            igen.append(struct.pack('<HH', operator, amount))
+                        else:
+                            igen.append(struct.pack('<Hh', operator, amount))
+
+            inst.append(struct.pack('<20sH', _sf2_name('EOI'), len(ibag)))
+            ibag.append(struct.pack('<HH', len(igen), 0))
+            igen.append(bytes(4))
+
+            riff.write_chunk(b'inst', b''.join(inst))
+            riff.write_chunk(b'ibag', b''.join(ibag))
+            riff.write_chunk(b'imod', bytes(10))
+            riff.write_chunk(b'igen', b''.join(igen))
+            riff.write_chunk(b'shdr', b''.join(sample_headers) + struct.pack('<20sIIIIIBbHH', _sf2_name('EOS'), 0, 0, 0, 0, 0, 0, 0, 0, 0))
+
+
+def _loop_points(sample, pcm: np.ndarray) -> tuple[int, int] | None:
+    loop = sample.vadpcm_loop
+    if loop.loop_count == AudioSampleLoopCount.NO_LOOP or not 0 <= loop.loop_start < loop.loop_end <= len(pcm):
+        return None
+    return loop.loop_start, loop.loop_end
+
+
+def _bank_tuned_samples(bank):
+    for instrument in bank.instruments:
+        if instrument is not None:
+            for _, _, tuned_sample in _instrument_zones(instrument):
+                yield tuned_sample
+    for drum in bank.drums:
+        if drum is not None and drum.drum_sample and drum.drum_sample.sample:
+            yield drum.drum_sample
+    for effect in bank.effects:
+        if effect is not None and effect.effect_sample and effect.effect_sample.sample:
+            yield effect.effect_sample
+
+
+def decode_bank_samples(banks, audiotable, workers: int | None = None) -> dict[str, np.ndarray]:
+    """
+    Decodes every sample used by banks once, across worker processes.
+
+    Returns PCM by Sample.get_hash(). Samples with no data in the Audiotable
+    are left out.
+    """
+    workers = workers if workers is not None else os.cpu_count() or 1
+
+    unique = {}
+    for bank in banks:
+        bank_id = bank.tableEntry.sampleBankId_1
+        for tuned_sample in _bank_tuned_samples(bank):
+            sample = tuned_sample.sample
+            key = sample.get_hash()
+            if key in unique:
+                continue
+
+            address = audiotable.resolve_sample_address(sample, bank_id)
+            if address is not None:
+                unique[key] = (sample, address)
+
+    entries = list(unique.items())
+    pcms = pcmCache.get_many(
+        [sample for _, (sample, _) in entries],
+        audiotable,
+        [address for _, (_, address) in entries],
+        workers
+    )
+    return {key: pcm for (key, _), pcm in zip(entries, pcms)}
+
+
+def export_soundfont(bank, audiotable, path: Path, pcms: dict[str, np.ndarray] | None = None, workers: int | None = None):
+    """
+    Writes a bank to a SoundFont 2 file.
+
+    Instruments become presets in bank 0 with their program numbers, drums
+    become one preset in bank 128 and effects one preset in bank 1, each
+    drum and effect on its own key. Samples are written once no matter how
+    many zones use them.
+    """
+    if pcms is None:
+        pcms = decode_bank_samples([bank], audiotable, workers)
+
+    builder = SoundFontBuilder()
+    sample_indices: dict[str, int] = {}
+    samples = []
+
+    def add_zone(zones: list, low_key: int, high_key: int, key: int, tuned_sample, envelope=None, pan: int | None = None):
+        sample_key = tuned_sample.sample.get_hash()
+        if sample_key not in pcms:
+            return
+
+        if sample_key not in sample_indices:
+            sample_indices[sample_key] = len(samples)
+            samples.append((tuned_sample.sample, pcms[sample_key], _loop_points(tuned_sample.sample, pcms[sample_key])))
+
+        index = sample_indices[sample_key]
+        zones.append(builder.make_zone(low_key, high_key, key, tuned_sample, index, samples[index][2] is not None, envelope, pan))
+
+    for program, instrument in enumerate(bank.instruments):
+        if instrument is None:
+            continue
+
+        zones = []
+        for low_key, high_key, tuned_sample in _instrument_zones(instrument):
+            add_zone(zones, low_key, high_key, 60, tuned_sample, instrument.envelope)
+        builder.add_instrument(instrument.name or f'Instrument {program}', zones, program, 0)
+
+    drum_zones = []
+    for semitone, drum in enumerate(bank.drums):
+        key = semitone + SEMITONE_MIDI_OFFSET
+        if drum is None or not drum.drum_sample or not drum.drum_sample.sample or key > 127:
+            continue
+        add_zone(drum_zones, key, key, key, drum.drum_sample, drum.envelope, drum.pan)
+    builder.add_instrument('Drums', drum_zones, 0, SF2_DRUM_BANK)
+
+    effect_zones = []
+    for semitone, effect in enumerate(bank.effects):
+        key = semitone + SEMITONE_MIDI_OFFSET
+        if effect is None or not effect.effect_sample or not effect.effect_sample.sample or key > 127:
+            continue
+        add_zone(effect_zones, key, key, key, effect.effect_sample)
+    builder.add_instrument('Effects', effect_zones, 0, SF2_EFFECT_BANK)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, 'wb') as f:
+        riff = RiffWriter(f)
+        with riff.chunk(b'RIFF', b'sfbk'):
+            with riff.chunk(b'LIST', b'INFO'):
+                riff.write_chunk(b'ifil', struct.pack('<HH', 2, 1))
+                riff.write_chunk(b'isng', _zstr('EMU8000'))
+                riff.write_chunk(b'INAM', _zstr(bank.name[:255]))
+                riff.write_chunk(b'ISFT', _zstr('Z64 Bank Creator'))
+
+            # Sample data is streamed one sample at a time
+            headers = []
+            position = 0
+            with riff.chunk(b'LIST', b'sdta'):
+                with riff.chunk(b'smpl'):
+                    for sample, pcm, loop_points in samples:
+                        riff.write(np.asarray(pcm, dtype='<i2').tobytes())
+                        riff.write(bytes(SF2_SAMPLE_PADDING * 2))
+
+                        loop_start, loop_end = loop_points or (0, len(pcm))
+
+                        headers.append(struct.pack(
+                            '<20sIIIIIBbHH',
+                            _sf2_name(sample.name or f'Sample {len(headers)}'),
+                            position, position + len(pcm),
+                            position + loop_start, position + loop_end,
+                            RENDER_SAMPLE_RATE, 60, 0, 0, 1
+                        ))
+                        position += len(pcm) + SF2_SAMPLE_PADDING
+
+            builder.write_pdta(riff, headers)
+
+
+def export_soundfonts(banks, audiotable, out_dir: Path, workers: int | None = None) -> list[Path]:
+    """ Exports banks of one game, decoding the samples they share only once. """
+    banks = list(banks)
+    pcms = decode_bank_samples(banks, audiotable, workers)
+
+    paths = []
+    for bank in banks:
+        path = Path(out_dir) / f'{bank.name}.sf2'
+        export_soundfont(bank, audiotable, path, pcms)
+        paths.append(path)
+    return paths
+#endregion
@@ -0,0 +1,77 @@
+# App/Common/Startup.py
+
+import builtins
+import sys
+import threading
+import time
+
+
+class StartupReport:
+    """
+    Times the first import of every module on the main thread and the milestones
+    of start up, much like python -X importtime but from inside the app. Imported
+    before anything else so its clock starts with the process. Enabled with the
+    --startup-report command line flag.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.start = time.perf_counter()
+        self.imports: dict[str, tuple[float, float]] = {}   # Module to (self, cumulative) seconds
+        self.marks: list[tuple[str, float]] = []
+
+        self._import = builtins.__import__
+        self._children: list[float] = []
+
+    def enable(self):
+        if self.enabled:
+            return
+
+        self.enabled = True
+        builtins.__import__ = self._timed_import
+
+    def disable(self):
+        if not self.enabled:
+            return
+
+        self.enabled = False
+        builtins.__import__ = self._import
+
+    def mark(self, label: str):
+        if self.enabled:
+            self.marks.append((label, time.perf_counter() - self.start))
+
+    def report(self, limit: int = 20):
+        """ Prints the milestones and slowest imports, then stops timing imports. """
+        if not self.enabled:
+            return
+
+        self.disable()
+        for label, elapsed in self.marks:
+            print(f'[StartupReport] {label}: {elapsed * 1000:.1f} ms')
+
+        total = sum(own for own, _ in self.imports.values())
+        print(f'[StartupReport] {len(self.imports)} modules imported in {total * 1000:.1f} ms, slowest:')
+        print(f'[StartupReport] {"self [ms]":>10} | {"cumulative [ms]":>15} | module')
+
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)
+        for name, (own, cumulative) in slowest[:limit]:
+            print(f'[StartupReport] {own * 1000:>10.1f} | {cumulative * 1000:>15.1f} | {name}')
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Relative and repeat imports are lookups, imports on workers would interleave
+        if level or name in sys.modules or threading.current_thread() is not threading.main_thread():
+            return self._import(name, globals, locals, fromlist, level)
+
+        self._children.append(0.0)
+        started = time.perf_counter()
+        try:
+            return self._import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = time.perf_counter() - started
+            children = self._children.pop()
+            if self._children:
+                self._children[-1] += cumulative
+            self.imports[name] = (cumulative - children, cumulative)
+
+
+startupReport = StartupReport()
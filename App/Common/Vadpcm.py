@@ -0,0 +1,613 @@
+# App/Common/Vadpcm.py
+
+from dataclasses import dataclass
+
+import numpy as np
+
+# App/Common
+from App.Common.Enums import AudioSampleCodec, AudioSampleLoopCount
+from App.Common.Structs import VadpcmBook, VadpcmLoop
+
+
+BE_S16 = np.dtype('>i2')
+
+VADPCM_LOOP_PREDICTOR_COUNT = 16
+
+VADPCM_FRAME_SAMPLES = 16
+VADPCM_GROUP_SAMPLES = 8
+VADPCM_FRAME_SIZES = {
+    AudioSampleCodec.ADPCM: 9,
+    AudioSampleCodec.SMALL_ADPCM: 5,
+}
+
+# Frames decoded together share one sequential loop, padded to the longest member
+VADPCM_DECODE_BATCH_SIZE = 32
+
+# Fewer frames than this are decoded in-process, a pool would cost more than it saves
+VADPCM_PARALLEL_MIN_FRAMES = 1 << 16
+
+# Codebook design, the same defaults as the SDK's tabledesign
+VADPCM_ENCODE_ORDER = 2
+VADPCM_ENCODE_PREDICTORS = 4
+VADPCM_ENCODE_ITERATIONS = 8
+VADPCM_ENCODE_SPLIT = 0.01
+
+VADPCM_MAX_SCALE = 12
+VADPCM_CODE_RANGES = {
+    AudioSampleCodec.ADPCM: (-8, 7),
+    AudioSampleCodec.SMALL_ADPCM: (-2, 1),
+}
+
+
+#region Binary Views
+def read_s16_array(data, offset: int, count: int) -> np.ndarray:
+    """ Views `count` big-endian shorts at `offset` without copying or creating Python ints. """
+    return np.frombuffer(data, dtype=BE_S16, count=count, offset=offset)
+
+
+def read_book_predictors(data, offset: int, order: int, num_predictors: int) -> np.ndarray:
+    return read_s16_array(data, offset, 8 * order * num_predictors)
+
+
+def read_loop_predictors(data, offset: int) -> np.ndarray:
+    return read_s16_array(data, offset, VADPCM_LOOP_PREDICTOR_COUNT)
+
+
+def read_envelope_points(data, offset: int, num_points: int = 4) -> np.ndarray:
+    return read_s16_array(data, offset, num_points * 2)
+
+
+def pack_s16_array(buffer: bytearray, offset: int, values) -> None:
+    """ Writes values as big-endian shorts into buffer in a single copy. """
+    if values is None or len(values) == 0:
+        return
+    data = np.asarray(values, dtype=BE_S16).tobytes()
+    buffer[offset:offset + len(data)] = data
+
+
+def predictors_to_list(predictors) -> list[int] | None:
+    """ Converts a predictor array to plain ints, only needed when serializing. """
+    if predictors is None:
+        return None
+    if isinstance(predictors, np.ndarray):
+        return predictors.reshape(-1).tolist()
+    return list(predictors)
+
+
+def predictors_key(predictors) -> bytes:
+    """ Hashable, allocation-light key for a predictor array. """
+    if predictors is None:
+        return b''
+    return np.asarray(predictors, dtype=BE_S16).tobytes()
+#endregion
+
+
+#region Decoding
+def expand_book(order: int, num_predictors: int, predictors) -> np.ndarray:
+    """ Returns the codebook as a (num_predictors, order, 8) int64 array. """
+    return np.asarray(predictors, dtype=np.int64).reshape(num_predictors, order, VADPCM_GROUP_SAMPLES)
+
+
+def unpack_frames(data, codec: AudioSampleCodec) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Splits VADPCM data into its frames.
+
+    Returns the scaled residuals as a (num_frames, 16) array and the
+    predictor index of every frame.
+    """
+    frame_size = VADPCM_FRAME_SIZES.get(codec)
+    if frame_size is None:
+        raise ValueError(f'Unsupported VADPCM codec: {codec}')
+
+    num_frames = len(data) // frame_size
+    frames = np.frombuffer(data, dtype=np.uint8, count=num_frames * frame_size).reshape(num_frames, frame_size)
+
+    headers = frames[:, 0]
+    scales = (headers >> 4).astype(np.int64)
+    predictor_indices = (headers & 0x0F).astype(np.intp)
+
+    if codec is AudioSampleCodec.ADPCM:
+        body = frames[:, 1:]
+        codes = np.empty((num_frames, VADPCM_FRAME_SAMPLES), dtype=np.int64)
+        codes[:, 0::2] = body >> 4
+        codes[:, 1::2] = body & 0x0F
+        codes[codes >= 8] -= 16
+    else:
+        shifts = np.array([6, 4, 2, 0], dtype=np.uint8)
+        codes = ((frames[:, 1:, None] >> shifts) & 0x03).reshape(num_frames, VADPCM_FRAME_SAMPLES).astype(np.int64)
+        codes[codes >= 2] -= 4
+
+    return codes << scales[:, None], predictor_indices
+
+
+def _group_matrices(book: np.ndarray) -> np.ndarray:
+    """
+    Builds the (num_predictors, 8, 8) matrices applying each predictor to the
+    residuals of its own group, the part of the filter that needs no state.
+    """
+    num_predictors, order, _ = book.shape
+    matrices = np.zeros((num_predictors, VADPCM_GROUP_SAMPLES, VADPCM_GROUP_SAMPLES), dtype=np.int64)
+    diagonal = np.arange(VADPCM_GROUP_SAMPLES)
+    matrices[:, diagonal, diagonal] = 2048
+
+    # Residual k feeds sample i > k through the last book row, lagged by i - k
+    for lag in range(1, VADPCM_GROUP_SAMPLES):
+        i = np.arange(lag, VADPCM_GROUP_SAMPLES)
+        matrices[:, i, i - lag] = book[:, order - 1, lag - 1][:, None]
+    return matrices
+
+
+def _prepare_vadpcm(data, codec: AudioSampleCodec, book: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """ Returns the state-free contribution of every group and the predictor index of every group. """
+    residuals, predictor_indices = unpack_frames(data, codec)
+    if len(predictor_indices) and predictor_indices.max() >= len(book):
+        raise ValueError(f'Frame uses predictor {predictor_indices.max()} but the book only has {len(book)}')
+    groups = residuals.reshape(-1, VADPCM_GROUP_SAMPLES)
+    group_predictors = np.repeat(predictor_indices, 2)
+
+    contributions = np.einsum('gik,gk->gi', _group_matrices(book)[group_predictors], groups)
+    return contributions, group_predictors
+
+
+def _decode_prepared(prepared: list[tuple[np.ndarray, np.ndarray, np.ndarray]], order: int) -> list[np.ndarray]:
+    """ Runs the sequential part of the filter for several samples at once. """
+    batch_size = len(prepared)
+    num_groups = max(len(contributions) for contributions, _, _ in prepared)
+    num_predictors = max(len(book) for _, _, book in prepared)
+
+    contributions = np.zeros((batch_size, num_groups, VADPCM_GROUP_SAMPLES), dtype=np.int64)
+    predictors = np.zeros((batch_size, num_groups), dtype=np.intp)
+    books = np.zeros((batch_size, num_predictors, order, VADPCM_GROUP_SAMPLES), dtype=np.int64)
+    for b, (item_contributions, item_predictors, book) in enumerate(prepared):
+        contributions[b, :len(item_contributions)] = item_contributions
+        predictors[b, :len(item_predictors)] = item_predictors
+        books[b, :len(book)] = book
+
+    output = np.empty((batch_size, num_groups, VADPCM_GROUP_SAMPLES), dtype=np.int16)
+    state = np.zeros((batch_size, order, 1), dtype=np.int64)
+    rows = np.arange(batch_size)
+
+    for g in range(num_groups):
+        coefficients = books[rows, predictors[:, g]]
+        acc = contributions[:, g] + (coefficients * state).sum(axis=1)
+        group = np.clip(acc >> 11, -32768, 32767)
+        output[:, g] = group
+        state = group[:, VADPCM_GROUP_SAMPLES - order:, None]
+
+    return [
+        output[b, :len(item_contributions)].reshape(-1)
+        for b, (item_contributions, _, _) in enumerate(prepared)
+    ]
+
+
+def decode_vadpcm_batch(items, batch_size: int = VADPCM_DECODE_BATCH_SIZE) -> list[np.ndarray]:
+    """
+    Decodes several VADPCM streams to s16 PCM.
+
+    items is an iterable of (data, codec, book, num_samples), where book is a
+    (num_predictors, order, 8) array from expand_book() and num_samples trims
+    the output when not None. Streams of similar length are decoded together
+    so the frame loop runs once per batch instead of once per sample.
+    """
+    items = list(items)
+    results: list[np.ndarray | None] = [None] * len(items)
+
+    prepared = {}
+    for i, (data, codec, book, _) in enumerate(items):
+        contributions, group_predictors = _prepare_vadpcm(data, codec, book)
+        prepared[i] = (contributions, group_predictors, book)
+
+    # Streams can only share a batch if they use the same predictor order
+    by_order: dict[int, list[int]] = {}
+    for i, (_, _, book, _) in enumerate(items):
+        by_order.setdefault(book.shape[1], []).append(i)
+
+    for order, indices in by_order.items():
+        indices.sort(key=lambda i: len(prepared[i][0]))
+        for start in range(0, len(indices), batch_size):
+            chunk = indices[start:start + batch_size]
+            for i, pcm in zip(chunk, _decode_prepared([prepared[i] for i in chunk], order)):
+                num_samples = items[i][3]
+                results[i] = pcm[:num_samples] if num_samples is not None else pcm
+
+    return results
+
+
+def decode_vadpcm(data, codec: AudioSampleCodec, book: np.ndarray, num_samples: int | None = None) -> np.ndarray:
+    return decode_vadpcm_batch([(data, codec, book, num_samples)])[0]
+#endregion
+
+
+#region Codebook Estimation
+def _frame_covariances(pcm: np.ndarray, order: int) -> np.ndarray:
+    """
+    Returns the (num_frames, order + 1, order + 1) covariance matrix of every
+    16 sample frame, over the frame's samples and the order samples before them.
+    """
+    x = np.concatenate([np.zeros(order), np.asarray(pcm, dtype=np.float64)])
+    num_frames = -(-len(pcm) // VADPCM_FRAME_SAMPLES)
+    x = np.pad(x, (0, num_frames * VADPCM_FRAME_SAMPLES + order - len(x)))
+
+    # Column j holds x[n - j] for every n of every frame
+    n = np.arange(num_frames * VADPCM_FRAME_SAMPLES).reshape(num_frames, VADPCM_FRAME_SAMPLES) + order
+    lagged = x[n[:, :, None] - np.arange(order + 1)]
+    return np.einsum('fni,fnj->fij', lagged, lagged)
+
+
+def _solve_predictor(covariance: np.ndarray, order: int) -> np.ndarray:
+    """ Returns the coefficients minimizing the prediction error over a summed covariance. """
+    a = covariance[1:, 1:] + np.eye(order) * (1e-9 * np.trace(covariance[1:, 1:]) + 1e-9)
+    try:
+        return np.linalg.solve(a, covariance[1:, 0])
+    except np.linalg.LinAlgError:
+        return np.zeros(order)
+
+
+def _stabilize_predictor(coefficients: np.ndarray, limit: float = 0.9999) -> np.ndarray:
+    """ Clamps the reflection coefficients of a predictor so its filter cannot blow up. """
+    order = len(coefficients)
+    a = np.array(coefficients, dtype=np.float64)
+    reflections = np.zeros(order)
+
+    # Step down to reflection coefficients
+    for m in range(order - 1, -1, -1):
+        k = a[m]
+        reflections[m] = k
+        if m == 0:
+            break
+        if abs(k) >= 1.0:
+            k = np.sign(k) * limit
+        a = (a[:m] + k * a[:m][::-1]) / (1.0 - k * k)
+
+    reflections = np.clip(reflections, -limit, limit)
+
+    # Step back up to predictor coefficients
+    a = np.zeros(0)
+    for m in range(order):
+        k = reflections[m]
+        a = np.concatenate([a - k * a[::-1], [k]])
+    return a
+
+
+def predictor_to_book(coefficients: np.ndarray) -> np.ndarray:
+    """
+    Expands predictor coefficients into one (order, 8) codebook entry.
+
+    Row k is the filter's response over a group to a unit state value at
+    x[-(order - k)], the layout decode_vadpcm_batch() expects.
+    """
+    order = len(coefficients)
+    rows = np.zeros((order, VADPCM_GROUP_SAMPLES))
+    for k in range(order):
+        history = [0.0] * order
+        history[k] = 1.0
+        for i in range(VADPCM_GROUP_SAMPLES):
+            value = sum(coefficients[j] * history[-1 - j] for j in range(order))
+            history.append(value)
+            rows[k, i] = value
+    return np.clip(np.rint(rows * 2048), -32768, 32767).astype(np.int64)
+
+
+def _prediction_errors(covariances: np.ndarray, predictors: np.ndarray) -> np.ndarray:
+    """ Returns the squared prediction error of every frame under every predictor. """
+    a = np.concatenate([np.ones((len(predictors), 1)), -predictors], axis=1)
+    return np.einsum('pi,fij,pj->fp', a, covariances, a)
+
+
+def estimate_book(pcm: np.ndarray, order: int = VADPCM_ENCODE_ORDER, num_predictors: int = VADPCM_ENCODE_PREDICTORS, iterations: int = VADPCM_ENCODE_ITERATIONS) -> np.ndarray:
+    """
+    Designs a codebook for a sample, returned as a (num_predictors, order, 8) array.
+
+    Every frame's covariance is measured once, then predictors are clustered
+    by splitting the worst cluster and refining with k-means, where a frame
+    belongs to the predictor with the lowest prediction error on it and each
+    predictor is re-solved from its frames' summed covariances.
+    """
+    covariances = _frame_covariances(pcm, order)
+
+    # Silent frames say nothing about the signal's spectrum
+    energy = covariances[:, 0, 0]
+    active = covariances[energy > max(energy.max(initial=0.0) * 1e-6, 1.0)]
+    if not len(active):
+        return np.zeros((num_predictors, order, VADPCM_GROUP_SAMPLES), dtype=np.int64)
+
+    predictors = _solve_predictor(active.sum(axis=0), order)[None, :]
+    while len(predictors) < num_predictors:
+        errors = _prediction_errors(active, predictors)
+        assignment = errors.argmin(axis=1)
+        worst = np.bincount(assignment, weights=errors.min(axis=1), minlength=len(predictors)).argmax()
+        predictors = np.concatenate([predictors, predictors[worst:worst + 1] * (1.0 + VADPCM_ENCODE_SPLIT)])
+        predictors[worst] *= 1.0 - VADPCM_ENCODE_SPLIT
+
+        for _ in range(iterations):
+            assignment = _prediction_errors(active, predictors).argmin(axis=1)
+            sums = np.zeros((len(predictors), order + 1, order + 1))
+            np.add.at(sums, assignment, active)
+            for p in np.unique(assignment):
+                predictors[p] = _solve_predictor(sums[p], order)
+
+    return np.stack([predictor_to_book(_stabilize_predictor(predictor)) for predictor in predictors])
+#endregion
+
+
+#region Encoding
+def _encode_prepared(pcms: np.ndarray, books: np.ndarray, states: np.ndarray, codec: AudioSampleCodec) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Encodes a padded (batch, num_frames, 16) block of segments that share a codec and order.
+
+    Every frame is tried with every predictor at the open-loop scale and one
+    above it. Residuals are quantized closed-loop against the decoder's own
+    arithmetic, and the candidate with the lowest error is kept. states holds
+    the order samples before every segment. Returns the codes, scales and
+    predictor indices of every frame.
+    """
+    batch_size, num_frames, _ = pcms.shape
+    _, num_predictors, order, _ = books.shape
+    code_min, code_max = VADPCM_CODE_RANGES[codec]
+    rows = np.arange(batch_size)[:, None]
+
+    # Open-loop scales, solving each group's residuals exactly with the original samples as state
+    groups = pcms.reshape(batch_size, num_frames * 2, VADPCM_GROUP_SAMPLES).astype(np.float64)
+    group_states = np.concatenate([states[:, None, :], groups[:, :-1, VADPCM_GROUP_SAMPLES - order:]], axis=1)
+    inverses = np.linalg.inv(np.stack([_group_matrices(book) for book in books]).astype(np.float64))
+    state_part = np.einsum('bpki,bgk->bgpi', books.astype(np.float64), group_states)
+    ideal = np.einsum('bpij,bgpj->bgpi', inverses, 2048 * groups[:, :, None, :] - state_part)
+    peaks = np.abs(ideal).max(axis=3).reshape(batch_size, num_frames, 2, num_predictors).max(axis=2)
+    open_scales = np.ceil(np.log2(np.maximum(peaks, 1e-9) / (code_max + 0.5)))
+    open_scales = np.clip(open_scales, 0, VADPCM_MAX_SCALE).astype(np.int64)
+
+    # Candidates are every predictor at its open-loop scale and one above
+    candidate_predictors = np.tile(np.arange(num_predictors), 2)
+    candidate_offsets = np.repeat([0, 1], num_predictors)
+    num_candidates = len(candidate_predictors)
+    candidate_books = books[:, candidate_predictors].astype(np.float64)    # (b, c, order, 8)
+
+    # Weights spreading residual i over samples i..7 of its group, its own sample at 2048
+    last_rows = candidate_books[:, :, order - 1]
+    spreads = [
+        np.concatenate([np.full((batch_size, num_candidates, 1), 2048.0), last_rows[:, :, :VADPCM_GROUP_SAMPLES - 1 - i]], axis=2)
+        for i in range(VADPCM_GROUP_SAMPLES)
+    ]
+
+    codes = np.zeros((batch_size, num_frames, VADPCM_FRAME_SAMPLES), dtype=np.int64)
+    scales = np.zeros((batch_size, num_frames), dtype=np.int64)
+    predictors = np.zeros((batch_size, num_frames), dtype=np.int64)
+    state = states.astype(np.float64)
+
+    candidate_codes = np.empty((batch_size, num_candidates, VADPCM_FRAME_SAMPLES))
+    output = np.empty((batch_size, num_candidates, VADPCM_FRAME_SAMPLES))
+
+    for f in range(num_frames):
+        frame = pcms[:, f].astype(np.float64)
+        frame_scales = np.minimum(open_scales[:, f, candidate_predictors] + candidate_offsets, VADPCM_MAX_SCALE)
+        multipliers = np.ldexp(1.0, frame_scales)
+        reciprocals = 1.0 / (2048.0 * multipliers)
+
+        candidate_state = np.broadcast_to(state[:, None, :], (batch_size, num_candidates, order))
+        for g in range(2):
+            offset = g * VADPCM_GROUP_SAMPLES
+            target = 2048.0 * frame[:, None, offset:offset + VADPCM_GROUP_SAMPLES]
+            acc = np.einsum('bcki,bck->bci', candidate_books, candidate_state)
+
+            for i in range(VADPCM_GROUP_SAMPLES):
+                code = np.clip(np.rint((target[:, :, i] - acc[:, :, i]) * reciprocals), code_min, code_max)
+                candidate_codes[:, :, offset + i] = code
+                acc[:, :, i:] += spreads[i] * (code * multipliers)[:, :, None]
+
+            group = np.clip(np.floor(acc / 2048.0), -32768, 32767)
+            output[:, :, offset:offset + VADPCM_GROUP_SAMPLES] = group
+            candidate_state = group[:, :, VADPCM_GROUP_SAMPLES - order:]
+
+        errors = np.square(output - frame[:, None, :]).sum(axis=2)
+        best = errors.argmin(axis=1)[:, None]
+
+        codes[:, f] = candidate_codes[rows, best, :][:, 0]
+        scales[:, f] = frame_scales[rows, best][:, 0]
+        predictors[:, f] = candidate_predictors[best[:, 0]]
+        state = output[rows, best, VADPCM_FRAME_SAMPLES - order:][:, 0]
+
+    return codes, scales, predictors
+
+
+def pack_frames(codes: np.ndarray, scales: np.ndarray, predictors: np.ndarray, codec: AudioSampleCodec) -> bytes:
+    """ Packs frame codes, scales and predictor indices into VADPCM data, the inverse of unpack_frames(). """
+    headers = ((scales << 4) | predictors).astype(np.uint8)[:, None]
+    codes = codes.astype(np.uint8)
+
+    if codec is AudioSampleCodec.ADPCM:
+        body = ((codes[:, 0::2] & 0x0F) << 4) | (codes[:, 1::2] & 0x0F)
+    else:
+        quads = (codes & 0x03).reshape(len(codes), -1, 4)
+        body = (quads[:, :, 0] << 6) | (quads[:, :, 1] << 4) | (quads[:, :, 2] << 2) | quads[:, :, 3]
+
+    return np.concatenate([headers, body.astype(np.uint8)], axis=1).tobytes()
+
+
+def encode_vadpcm_batch(items, batch_size: int = VADPCM_DECODE_BATCH_SIZE) -> list[bytes]:
+    """
+    Encodes several s16 PCM streams to VADPCM.
+
+    items is an iterable of (pcm, codec, book) with book a (num_predictors,
+    order, 8) array. Like decoding, streams of similar length that share a
+    codec and order are encoded together, so the frame loop runs once per
+    batch instead of once per stream.
+    """
+    items = list(items)
+    results: list[bytes | None] = [None] * len(items)
+
+    by_kind: dict[tuple, list[int]] = {}
+    for i, (_, codec, book) in enumerate(items):
+        by_kind.setdefault((AudioSampleCodec(codec), book.shape[1]), []).append(i)
+
+    for (codec, order), indices in by_kind.items():
+        indices.sort(key=lambda i: len(items[i][0]))
+        for start in range(0, len(indices), batch_size):
+            chunk = indices[start:start + batch_size]
+            num_frames = max(-(-len(items[i][0]) // VADPCM_FRAME_SAMPLES) for i in chunk)
+            num_predictors = max(len(items[i][2]) for i in chunk)
+
+            pcms = np.zeros((len(chunk), num_frames * VADPCM_FRAME_SAMPLES), dtype=np.int64)
+            books = np.zeros((len(chunk), num_predictors, order, VADPCM_GROUP_SAMPLES), dtype=np.int64)
+            for b, i in enumerate(chunk):
+                pcms[b, :len(items[i][0])] = items[i][0]
+                books[b, :len(items[i][2])] = items[i][2]
+
+            # Books with fewer predictors are padded with repeats of their first one
+            for b, i in enumerate(chunk):
+                books[b, len(items[i][2]):] = items[i][2][0]
+
+            states = np.zeros((len(chunk), order), dtype=np.int64)
+            codes, scales, predictors = _encode_prepared(pcms.reshape(len(chunk), num_frames, VADPCM_FRAME_SAMPLES), books, states, codec)
+
+            for b, i in enumerate(chunk):
+                item_frames = -(-len(items[i][0]) // VADPCM_FRAME_SAMPLES)
+                item_predictors = np.where(predictors[b, :item_frames] < len(items[i][2]), predictors[b, :item_frames], 0)
+                results[i] = pack_frames(codes[b, :item_frames], scales[b, :item_frames], item_predictors, codec)
+
+    return results
+
+
+def encode_vadpcm(pcm: np.ndarray, codec: AudioSampleCodec, book: np.ndarray) -> bytes:
+    return encode_vadpcm_batch([(pcm, codec, book)])[0]
+#endregion
+
+
+#region Samples
+def get_sample_data(sample, audiotable, address: int | None = None) -> memoryview:
+    """ Returns the Audiotable bytes of a sample, address defaults to its resolved vrom_address. """
+    if address is None:
+        address = sample.vrom_address
+    return memoryview(audiotable)[address:address + sample.size]
+
+
+def _sample_decode_item(sample, audiotable, address: int | None = None):
+    book = sample.vadpcm_book
+    loop_end = sample.vadpcm_loop.loop_end
+    return (
+        get_sample_data(sample, audiotable, address),
+        AudioSampleCodec(sample.codec),
+        expand_book(book.order, book.num_predictors, book.predictors),
+        loop_end or None,
+    )
+
+
+def decode_sample(sample, audiotable, address: int | None = None) -> np.ndarray:
+    """ Decodes a sample to s16 PCM, ending at its loop end like the game does. """
+    return decode_vadpcm_batch([_sample_decode_item(sample, audiotable, address)])[0]
+
+
+def decode_samples(samples, audiotable, addresses=None, workers: int = 1) -> list[np.ndarray]:
+    """
+    Decodes many samples in batches, addresses default to each sample's vrom_address.
+
+    With more than one worker, large jobs are split across a process pool.
+    Only each sample's own bytes are sent to the workers, not the Audiotable.
+    """
+    samples = list(samples)
+    if addresses is None:
+        addresses = [None] * len(samples)
+
+    items = [
+        _sample_decode_item(sample, audiotable, address)
+        for sample, address in zip(samples, addresses)
+    ]
+
+    num_frames = sum(len(data) for data, _, _, _ in items) // VADPCM_FRAME_SIZES[AudioSampleCodec.ADPCM]
+    if workers <= 1 or len(items) < 2 or num_frames < VADPCM_PARALLEL_MIN_FRAMES:
+        return decode_vadpcm_batch(items)
+
+    # Interleave by size so every chunk gets a similar amount of work
+    order = sorted(range(len(items)), key=lambda i: len(items[i][0]), reverse=True)
+    chunks = [order[w::workers] for w in range(workers) if order[w::workers]]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    results: list[np.ndarray | None] = [None] * len(items)
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        jobs = [
+            pool.submit(decode_vadpcm_batch, [(bytes(items[i][0]),) + items[i][1:] for i in chunk])
+            for chunk in chunks
+        ]
+        for chunk, job in zip(chunks, jobs):
+            for i, pcm in zip(chunk, job.result()):
+                results[i] = pcm
+
+    return results
+
+
+@dataclass
+class EncodedSample:
+    data: bytes
+    book: VadpcmBook
+    loop: VadpcmLoop
+
+
+def loop_state(pcm: np.ndarray, loop_start: int) -> list[int]:
+    """ Returns the decoder state when jumping back to loop_start, the 16 samples before its frame. """
+    frame_start = loop_start - loop_start % VADPCM_FRAME_SAMPLES
+    state = np.zeros(VADPCM_LOOP_PREDICTOR_COUNT, dtype=np.int64)
+    history = np.asarray(pcm[max(frame_start - VADPCM_LOOP_PREDICTOR_COUNT, 0):frame_start], dtype=np.int64)
+    if len(history):
+        state[-len(history):] = history
+    return state.tolist()
+
+
+def _encode_sample_items(items, codec: AudioSampleCodec, num_predictors: int) -> list[EncodedSample]:
+    books = [estimate_book(pcm, VADPCM_ENCODE_ORDER, num_predictors) for pcm, _, _ in items]
+    encoded = encode_vadpcm_batch((pcm, codec, book) for (pcm, _, _), book in zip(items, books))
+
+    # The loop state comes from the decoded data, only the frames before the loop are needed
+    looped = [i for i, (_, loop_start, loop_end) in enumerate(items) if loop_start is not None and loop_end is not None]
+    frame_size = VADPCM_FRAME_SIZES[codec]
+    decoded = dict(zip(looped, decode_vadpcm_batch(
+        (encoded[i][:(items[i][1] // VADPCM_FRAME_SAMPLES) * frame_size], codec, books[i], None)
+        for i in looped
+    )))
+
+    results = []
+    for i, ((pcm, loop_start, loop_end), book, data) in enumerate(zip(items, books, encoded)):
+        if i in decoded:
+            loop = VadpcmLoop(loop_start, loop_end, AudioSampleLoopCount.INDEFINITE, len(pcm), loop_state(decoded[i], loop_start))
+        else:
+            loop = VadpcmLoop(0, len(pcm), AudioSampleLoopCount.NO_LOOP, len(pcm))
+
+        results.append(EncodedSample(
+            data,
+            VadpcmBook(book.shape[1], book.shape[0], book.reshape(-1).tolist()),
+            loop
+        ))
+    return results
+
+
+def encode_samples(items, codec: AudioSampleCodec = AudioSampleCodec.ADPCM, num_predictors: int = VADPCM_ENCODE_PREDICTORS, workers: int = 1) -> list[EncodedSample]:
+    """
+    Encodes PCM to samples, designing a codebook for each.
+
+    items is an iterable of (pcm, loop_start, loop_end), with None loop points
+    for one-shot samples. With more than one worker, large jobs are split
+    across a process pool like decode_samples().
+    """
+    items = [(np.asarray(pcm, dtype=np.int16), loop_start, loop_end) for pcm, loop_start, loop_end in items]
+
+    num_frames = sum(len(pcm) for pcm, _, _ in items) // VADPCM_FRAME_SAMPLES
+    if workers <= 1 or len(items) < 2 or num_frames < VADPCM_PARALLEL_MIN_FRAMES // 16:
+        return _encode_sample_items(items, codec, num_predictors)
+
+    order = sorted(range(len(items)), key=lambda i: len(items[i][0]), reverse=True)
+    chunks = [order[w::workers] for w in range(workers) if order[w::workers]]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    results: list[EncodedSample | None] = [None] * len(items)
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        jobs = [pool.submit(_encode_sample_items, [items[i] for i in chunk], codec, num_predictors) for chunk in chunks]
+        for chunk, job in zip(chunks, jobs):
+            for i, encoded in zip(chunk, job.result()):
+                results[i] = encoded
+
+    return results
+
+
+def encode_sample(pcm: np.ndarray, loop_start: int | None = None, loop_end: int | None = None, codec: AudioSampleCodec = AudioSampleCodec.ADPCM, num_predictors: int = VADPCM_ENCODE_PREDICTORS) -> EncodedSample:
+    return encode_samples([(pcm, loop_start, loop_end)], codec, num_predictors)[0]
+#endregion
@@ -0,0 +1,148 @@
+# App/Common/Waveform.py
+
+import numpy as np
+
+# App/Common
+from App.Common.PcmCache import pcmCache
+
+
+WAVEFORM_BASE_BLOCK = 16 # One VADPCM frame per bucket at the finest level
+
+
+class WaveformPyramid:
+    """
+    Min/max summaries of a waveform at halving resolutions.
+
+    Level 0 has one bucket per base_block samples, every following level
+    merges pairs of buckets. Values are kept as the s16 PCM itself, so quiet
+    samples keep their shape. Level 0 takes an eighth of the PCM's size and the
+    halving levels above it as much again, about a quarter in all.
+    """
+    __slots__ = ('num_samples', 'base_block', 'levels')
+
+    def __init__(self, num_samples: int, base_block: int, levels: list[np.ndarray]):
+        self.num_samples = num_samples
+        self.base_block = base_block
+        self.levels = levels
+
+    @property
+    def nbytes(self) -> int:
+        return sum(level.nbytes for level in self.levels)
+
+    @property
+    def peak(self) -> int:
+        """ Largest absolute PCM value, read from the single bucket of the coarsest level. """
+        if not self.levels:
+            return 0
+        low, high = self.levels[-1][0]
+        return max(-int(low), int(high))
+
+    def level_for(self, width: int) -> int:
+        """ Returns the coarsest level that still has at least width buckets. """
+        for i in range(len(self.levels) - 1, -1, -1):
+            if len(self.levels[i]) >= width:
+                return i
+        return 0
+
+    def columns(self, width: int, normalize: bool = False) -> tuple[np.ndarray, np.ndarray]:
+        """ Returns the min and max of width columns, scaled to -1.0..1.0 of full scale or of the peak. """
+        if width <= 0 or not self.levels:
+            return np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.float32)
+
+        level = self.levels[self.level_for(width)]
+        if len(level) < width:
+            # Fewer buckets than columns, stretch them
+            indices = (np.arange(width) * len(level)) // width
+            mins, maxs = level[indices, 0], level[indices, 1]
+        else:
+            edges = (np.arange(width) * len(level)) // width
+            mins = np.minimum.reduceat(level[:, 0], edges)
+            maxs = np.maximum.reduceat(level[:, 1], edges)
+
+        scale = np.float32(1.0 / (max(self.peak, 1) if normalize else 32768.0))
+        return mins.astype(np.float32) * scale, maxs.astype(np.float32) * scale
+
+
+def build_waveform_pyramid(pcm: np.ndarray, base_block: int = WAVEFORM_BASE_BLOCK) -> WaveformPyramid:
+    num_samples = len(pcm)
+    if num_samples == 0:
+        return WaveformPyramid(0, base_block, [])
+
+    # Pad with the last value so padding never widens the last bucket's range
+    padded_length = -(-num_samples // base_block) * base_block
+    blocks = np.pad(np.asarray(pcm, dtype=np.int16), (0, padded_length - num_samples), mode='edge').reshape(-1, base_block)
+
+    level = np.empty((len(blocks), 2), dtype=np.int16)
+    level[:, 0] = blocks.min(axis=1)
+    level[:, 1] = blocks.max(axis=1)
+
+    levels = [level]
+    while len(level) > 1:
+        if len(level) % 2:
+            level = np.concatenate([level, level[-1:]])
+        pairs = level.reshape(-1, 2, 2)
+        level = np.stack([pairs[:, :, 0].min(axis=1), pairs[:, :, 1].max(axis=1)], axis=1)
+        levels.append(level)
+
+    return WaveformPyramid(num_samples, base_block, levels)
+
+
+# Pyramids by PCM cache key, they are small enough to keep for the whole session
+waveformCache: dict[str, WaveformPyramid] = {}
+
+
+def _try_decode(sample, audiotable, address) -> np.ndarray | None:
+    try:
+        return pcmCache.get(sample, audiotable, address)
+    except ValueError:
+        return None
+
+
+def build_sample_waveforms(samples) -> dict[int, WaveformPyramid]:
+    """
+    Builds the waveform pyramids of samples that have data in an available Audiotable.
+
+    Returns the pyramids by id(sample). Samples sharing an Audiotable are decoded
+    together in one batch, and previously built pyramids are reused.
+    """
+    from App.Common.Audiotable import find_sample_source
+
+    results: dict[int, WaveformPyramid] = {}
+    pending: dict[int, tuple[object, list]] = {}
+
+    for sample in samples:
+        if sample is None or id(sample) in results:
+            continue
+
+        source = find_sample_source(sample)
+        if source is None:
+            continue
+
+        audiotable, address = source
+        key = pcmCache.make_key(sample, audiotable, address)
+        pyramid = waveformCache.get(key)
+        if pyramid is not None:
+            results[id(sample)] = pyramid
+            continue
+
+        pending.setdefault(id(audiotable), (audiotable, []))[1].append((sample, address, key))
+
+    for audiotable, entries in pending.values():
+        try:
+            pcms = pcmCache.get_many(
+                [sample for sample, _, _ in entries],
+                audiotable,
+                [address for _, address, _ in entries]
+            )
+        except ValueError:
+            # One sample with bad data should not hide the others
+            pcms = [_try_decode(sample, audiotable, address) for sample, address, _ in entries]
+
+        for (sample, _, key), pcm in zip(entries, pcms):
+            if pcm is None:
+                continue
+            pyramid = build_waveform_pyramid(pcm)
+            waveformCache[key] = pyramid
+            results[id(sample)] = pyramid
+
+    return results
@@ -0,0 +1,49 @@
+# App/Common/Workers.py
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class WorkerSignals(QObject):
+    finished = Signal(object)
+    failed = Signal(object)
+
+
+class Worker(QRunnable):
+    """ Runs a function on the global thread pool and reports the result through signals. """
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+        # Created on the calling thread, so connected slots run there too
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as ex:
+            self.signals.failed.emit(ex)
+        else:
+            self.signals.finished.emit(result)
+
+
+# Python references keep the workers and their signals alive until their result is delivered
+_activeWorkers: set[Worker] = set()
+
+
+def run_in_background(fn, *args, on_finished=None, on_failed=None, **kwargs) -> Worker:
+    worker = Worker(fn, *args, **kwargs)
+    if on_finished is not None:
+        worker.signals.finished.connect(on_finished)
+    if on_failed is not None:
+        worker.signals.failed.connect(on_failed)
+
+    # Results are queued to the calling thread, releasing the worker any earlier drops them
+    worker.signals.finished.connect(lambda _: _activeWorkers.discard(worker))
+    worker.signals.failed.connect(lambda _: _activeWorkers.discard(worker))
+
+    _activeWorkers.add(worker)
+    QThreadPool.globalInstance().start(worker)
+    return worker
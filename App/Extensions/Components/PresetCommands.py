@@ -40,11 +40,13 @@ class EditBankTableEntryCommand(QUndoCommand):
 
     def undo(self):
         self.preset.tableEntry = self.oldEntry
+        self.viewModel.userPresets.update_preset(self.preset)
         self.viewModel.refresh()
         # self.viewModel._clearPresetSelection()
 
     def redo(self):
         self.preset.tableEntry = self.newEntry
+        self.viewModel.userPresets.update_preset(self.preset)
         self.viewModel.refresh()
         # self.viewModel._clearPresetSelection()
 #endregion
@@ -62,11 +64,13 @@ class EditBankListCommand(QUndoCommand):
 
     def undo(self):
         setattr(self.preset, self.listType, self.oldList)
+        self.viewModel.userPresets.update_preset(self.preset)
         self.viewModel.refresh()
         # self.viewModel._clearPresetSelection()
 
     def redo(self):
         setattr(self.preset, self.listType, self.newList)
+        self.viewModel.userPresets.update_preset(self.preset)
         self.viewModel.refresh()
         # self.viewModel._clearPresetSelection()
 #endregion
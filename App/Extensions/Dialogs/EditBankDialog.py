@@ -8,15 +8,13 @@ from App.Extensions.Forms.BankListEditForm import BankListEditForm
 
 
 class EditBankDialog(MessageBoxBase):
-    def __init__(self, mode: str, bank = None, listType: str = '', currentList: list = None, combinedPresets=None, builtinPresets=None, userPresets=None, parent=None):
+    def __init__(self, mode: str, bank = None, listType: str = '', currentList: list = None, game: str = '', parent=None):
         super().__init__(parent)
         self.mode = mode
         self.bank = bank
         self.listType = listType
         self.currentList = currentList or []
-        self.combinedPresets = combinedPresets or []
-        self.builtinPresets = builtinPresets or []
-        self.userPresets = userPresets or []
+        self.game = game
 
         self.titleLabel = SubtitleLabel(self._getTitle(), self)
         self.form = self._getForm()
@@ -47,9 +45,7 @@ class EditBankDialog(MessageBoxBase):
                     count=len(self.currentList),
                     listType=self.listType,
                     currentList=self.currentList,
-                    combinedPresets=self.combinedPresets,
-                    builtinPresets=self.builtinPresets,
-                    userPresets=self.userPresets
+                    game=self.game
                 )
 
     def applyChanges(self):
@@ -58,4 +54,4 @@ class EditBankDialog(MessageBoxBase):
 
     def getSelection(self):
         if self.form:
-            self.form.getSelection()
+            return self.form.getSelection()
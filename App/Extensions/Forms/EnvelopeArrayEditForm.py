@@ -3,16 +3,19 @@
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QTableWidgetItem
 
-from qfluentwidgets import TableWidget, CommandBar, Action, LineEdit
+from qfluentwidgets import TableWidget, CommandBar, Action, LineEdit, CaptionLabel
 
 # App/Resources
 from App.Resources.Icons.MSFluentIcons import MSFluentIcon as FICO
 
 # App/Common
 from App.Common.Enums import EnvelopeOpcode
+from App.Common.Envelopes import compile_envelope, lint_envelope
+from App.Common.AppExceptions import InvalidEnvelopeException
 
 # App/Extensions
 from App.Extensions.Widgets.CardGroup import CardGroup
+from App.Extensions.Widgets.EnvelopeWidget import EnvelopeWidget
 
 
 S16_MIN = -32768
@@ -31,6 +34,8 @@ class EnvelopeArrayEditForm(QWidget):
     def _initForm(self):
         self._createNameGroup()
         self._createTableGroup()
+        self._createPreviewGroup()
+        self._updatePreview()
 
     def _initLayout(self):
         layout = QVBoxLayout(self)
@@ -38,6 +43,7 @@ class EnvelopeArrayEditForm(QWidget):
 
         layout.addWidget(self.nameGroup)
         layout.addWidget(self.tableGroup)
+        layout.addWidget(self.previewGroup)
 
     def _createNameGroup(self):
         self.nameGroup = CardGroup('Preset name', 14, self)
@@ -59,6 +65,20 @@ class EnvelopeArrayEditForm(QWidget):
             self.tableView
         ])
 
+    def _createPreviewGroup(self):
+        self.previewGroup = CardGroup('Preview', 14, self)
+        self.previewGroup.cardLayout.setSpacing(4)
+
+        self.envelopeWidget = EnvelopeWidget(self.previewGroup)
+        self.lintLabel = CaptionLabel(self.previewGroup)
+        self.lintLabel.setWordWrap(True)
+        self.lintLabel.setTextColor('#C42B1C', '#FF99A4')
+
+        self.previewGroup.addCards([
+            self.envelopeWidget,
+            self.lintLabel
+        ])
+
     def _createCommandBar(self):
         self.commandBar = CommandBar(self.tableGroup)
         self.commandBar.setSpaing(0) # Bugged should be setSpacing()
@@ -95,6 +115,7 @@ class EnvelopeArrayEditForm(QWidget):
 
         self._loadTableViewData()
         self.tableView.itemSelectionChanged.connect(self._updateCommandBarButtonState)
+        self.tableView.itemChanged.connect(self._updatePreview)
 
     def _getRowCount(self):
         return len(self.envArray) // 2
@@ -122,11 +143,29 @@ class EnvelopeArrayEditForm(QWidget):
         self.tableView.insertRow(row)
         self.tableView.setItem(row, 0, QTableWidgetItem('HANG'))
         self.tableView.setItem(row, 1, QTableWidgetItem('0'))
+        self._updatePreview()
 
     def _deleteSelectedRow(self):
         selectedRows = [item.row() for item in self.tableView.selectedItems()]
         for row in sorted(set(selectedRows), reverse=True):
             self.tableView.removeRow(row)
+        self._updatePreview()
+
+    def _updatePreview(self):
+        # Called while the table is still being filled
+        if not hasattr(self, 'envelopeWidget'):
+            return
+
+        envArray = self._getEnvelope(report=False)
+        problems = lint_envelope(envArray)
+
+        try:
+            self.envelopeWidget.setCurve(compile_envelope(envArray))
+        except InvalidEnvelopeException:
+            self.envelopeWidget.setCurve(None)
+
+        self.lintLabel.setText('\n'.join(problems))
+        self.lintLabel.setVisible(bool(problems))
 
     def _updateCommandBarButtonState(self):
         selectedCount: int = len(self.tableView.selectedItems())
@@ -135,10 +174,13 @@ class EnvelopeArrayEditForm(QWidget):
 
         self.removeTableRowAction.setEnabled(hasSelection)
 
-    def _getEnvelope(self) -> list[int | EnvelopeOpcode]:
+    def _getEnvelope(self, report: bool = True) -> list[int | EnvelopeOpcode]:
         result = []
         for row in range(self.tableView.rowCount()):
             try:
+                if self.tableView.item(row, 0) is None or self.tableView.item(row, 1) is None:
+                    continue
+
                 timeOrOpcodeText = self.tableView.item(row, 0).text().strip()
                 ampOrIndexText = self.tableView.item(row, 1).text().strip()
 
@@ -156,7 +198,8 @@ class EnvelopeArrayEditForm(QWidget):
                 result.extend([timeOrOpcodeValue, ampOrIndexValue])
 
             except Exception as ex:
-                print(f'Invalid input for row {row}: {ex}')
+                if report:
+                    print(f'Invalid input for row {row}: {ex}')
                 continue
 
         return result
@@ -3,22 +3,20 @@
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 
-from qfluentwidgets import ComboBox, ToolTipFilter, ToolTipPosition
-
-# App/Common
-from App.Common.Presets import builtinPresetStore, userPresetStore
-from App.Common.Helpers import populate_combo_box
+from qfluentwidgets import ToolTipFilter, ToolTipPosition
 
 # App/Extensions
 from App.Extensions.Widgets.CardGroup import CardGroup
+from App.Extensions.Widgets.PresetComboBox import PresetComboBox
+
+# App/Models
+from App.Models.PresetListModel import sharedPresetModel
 
 
 class EnvelopeAssignForm(QWidget):
     def __init__(self, preset, parent=None):
         super().__init__(parent)
         self.preset = preset
-        self.userPresets = userPresetStore
-        self.builtinPresets = builtinPresetStore
 
         self._initForm()
         self._initLayout()
@@ -36,24 +34,18 @@ class EnvelopeAssignForm(QWidget):
         self.envelopeGroup = CardGroup('Envelope', 14, self)
 
         # Envelope
-        self.envelopeCombo = ComboBox(self.envelopeGroup)
-        self.envelopeCombo.setMaxVisibleItems(8)
+        self.envelopeCombo = PresetComboBox(self.envelopeGroup)
         self.envelopeCombo.installEventFilter(ToolTipFilter(self.envelopeCombo, showDelay=300, position=ToolTipPosition.TOP))
         self.envelopeCombo.currentIndexChanged.connect(self._updateEnvelopeTooltip)
 
-        self._updateEnvelopeTooltip(self.envelopeCombo.currentIndex())
         self._populateEnvelopeCombo()
+        self._updateEnvelopeTooltip(self.envelopeCombo.currentIndex())
 
         self.envelopeGroup.addCard(self.envelopeCombo)
 
     def _populateEnvelopeCombo(self):
-        populate_combo_box(
-            self.envelopeCombo,
-            self.builtinPresets.envelopes.values(),
-            self.userPresets.envelopes.values(),
-            target_obj=self.preset.envelope,
-            add_none=True
-        )
+        self.envelopeCombo.setPresetModel(sharedPresetModel('envelopes'))
+        self.envelopeCombo.setCurrentPreset(self.preset.envelope)
 
     def _updateEnvelopeTooltip(self, index: int):
         env = self.envelopeCombo.itemData(index)
@@ -3,15 +3,20 @@
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QSizePolicy
 
-from qfluentwidgets import DoubleSpinBox, ComboBox
+from qfluentwidgets import DoubleSpinBox
 
 # App/Common
 from App.Common.Structs import TunedSample
-from App.Common.Presets import builtinPresetStore, userPresetStore
-from App.Common.Helpers import populate_combo_box
+from App.Common.Waveform import build_sample_waveforms
+from App.Common.Workers import run_in_background
 
 # App/Extensions
 from App.Extensions.Widgets.CardGroup import CardGroup
+from App.Extensions.Widgets.WaveformWidget import WaveformWidget, createWaveformIcon
+from App.Extensions.Widgets.PresetComboBox import PresetComboBox
+
+# App/Models
+from App.Models.PresetListModel import sharedPresetModel
 
 
 class MultiSampleAssignForm(QWidget):
@@ -21,11 +26,12 @@ class MultiSampleAssignForm(QWidget):
 
         self._initForm()
         self._initLayout()
+        self._initWaveforms()
 
     def _initForm(self):
-        self.lowSampleGroup, self.lowSampleCombo, self.lowSampleTuningSpin = createSampleGroup('Low sample', 'low_sample', self.preset, self)
-        self.primSampleGroup, self.primSampleCombo, self.primSampleTuningSpin = createSampleGroup('Prim sample', 'prim_sample', self.preset, self)
-        self.highSampleGroup, self.highSampleCombo, self.highSampleTuningSpin = createSampleGroup('High sample', 'high_sample', self.preset, self)
+        self.lowSampleGroup, self.lowSampleCombo, self.lowSampleTuningSpin, self.lowSampleWaveform = createSampleGroup('Low sample', 'low_sample', self.preset, self)
+        self.primSampleGroup, self.primSampleCombo, self.primSampleTuningSpin, self.primSampleWaveform = createSampleGroup('Prim sample', 'prim_sample', self.preset, self)
+        self.highSampleGroup, self.highSampleCombo, self.highSampleTuningSpin, self.highSampleWaveform = createSampleGroup('High sample', 'high_sample', self.preset, self)
 
     def _initLayout(self):
         layout = QVBoxLayout(self)
@@ -34,6 +40,22 @@ class MultiSampleAssignForm(QWidget):
         layout.addWidget(self.primSampleGroup)
         layout.addWidget(self.highSampleGroup)
 
+    def _initWaveforms(self):
+        self.waveformViews = [
+            (self.lowSampleCombo, self.lowSampleWaveform),
+            (self.primSampleCombo, self.primSampleWaveform),
+            (self.highSampleCombo, self.highSampleWaveform),
+        ]
+        self.waveforms = {}
+        loadSampleWaveforms(self.waveformViews, self._updateWaveforms, self._onWaveformsLoaded)
+
+    def _onWaveformsLoaded(self, waveforms: dict):
+        self.waveforms = waveforms
+        applyWaveforms(self.waveformViews, waveforms, icons=True)
+
+    def _updateWaveforms(self):
+        applyWaveforms(self.waveformViews, self.waveforms)
+
     def applyChanges(self):
         lowSample = self.lowSampleCombo.currentData()
         lowTuning = self.lowSampleTuningSpin.value()
@@ -65,15 +87,28 @@ class SingleSampleAssignForm(QWidget):
 
         self._initForm()
         self._initLayout()
+        self._initWaveforms()
 
     def _initForm(self):
-        self.sampleGroup, self.sampleCombo, self.tuningSpin = createSampleGroup(self.label, self.attrName, self.preset, self)
+        self.sampleGroup, self.sampleCombo, self.tuningSpin, self.sampleWaveform = createSampleGroup(self.label, self.attrName, self.preset, self)
 
     def _initLayout(self):
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
         layout.addWidget(self.sampleGroup)
 
+    def _initWaveforms(self):
+        self.waveformViews = [(self.sampleCombo, self.sampleWaveform)]
+        self.waveforms = {}
+        loadSampleWaveforms(self.waveformViews, self._updateWaveforms, self._onWaveformsLoaded)
+
+    def _onWaveformsLoaded(self, waveforms: dict):
+        self.waveforms = waveforms
+        applyWaveforms(self.waveformViews, waveforms, icons=True)
+
+    def _updateWaveforms(self):
+        applyWaveforms(self.waveformViews, self.waveforms)
+
     def applyChanges(self):
         sample = self.sampleCombo.currentData()
         tuning = self.tuningSpin.value()
@@ -91,19 +126,12 @@ def createSampleGroup(label: str, attrName: str, preset, parent):
     sampleLayout.setAlignment(Qt.AlignmentFlag.AlignVCenter)
 
     # Sample
-    sampleCombo = ComboBox()
-    sampleCombo.setMaxVisibleItems(8)
+    sampleCombo = PresetComboBox()
     sampleCombo.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+    sampleCombo.setPresetModel(sharedPresetModel('samples'))
 
     tunedSample = getattr(preset, attrName)
-    sample = tunedSample.sample if tunedSample else None
-    populate_combo_box(
-        sampleCombo,
-        builtinPresetStore.samples.values(),
-        userPresetStore.samples.values(),
-        target_obj=sample,
-        add_none=True
-    )
+    sampleCombo.setCurrentPreset(tunedSample.sample if tunedSample else None)
 
     # Tuning
     tuningSpin = DoubleSpinBox()
@@ -116,6 +144,35 @@ def createSampleGroup(label: str, attrName: str, preset, parent):
     sampleLayout.addWidget(tuningSpin)
     sampleWidget.setMinimumHeight(tuningSpin.sizeHint().height() + 8)
 
+    # Waveform, shown once the sample has been decoded
+    waveformWidget = WaveformWidget(sampleGroup)
+    waveformWidget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+    waveformWidget.hide()
+
     sampleGroup.addCard(sampleWidget)
+    sampleGroup.addCard(waveformWidget)
+
+    return sampleGroup, sampleCombo, tuningSpin, waveformWidget
+
+
+def loadSampleWaveforms(views: list, onSelectionChanged, onLoaded):
+    """ Builds the waveforms of every sample in the combo boxes on a worker thread. """
+    samples = []
+    for combo, _ in views:
+        combo.currentIndexChanged.connect(onSelectionChanged)
+        samples += [combo.itemData(i) for i in range(combo.count())]
+
+    run_in_background(build_sample_waveforms, samples, on_finished=onLoaded)
+
+
+def applyWaveforms(views: list, waveforms: dict, icons: bool = False):
+    for combo, waveformWidget in views:
+        if icons:
+            for i in range(combo.count()):
+                pyramid = waveforms.get(id(combo.itemData(i)))
+                if pyramid is not None:
+                    combo.setItemIcon(i, createWaveformIcon(pyramid))
 
-    return sampleGroup, sampleCombo, tuningSpin
\ No newline at end of file
+        pyramid = waveforms.get(id(combo.currentData()))
+        waveformWidget.setPyramid(pyramid)
+        waveformWidget.setVisible(pyramid is not None)
\ No newline at end of file
@@ -0,0 +1,57 @@
+# App/Extensions/Widgets/EnvelopeWidget.py
+
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtGui import QPainter, QPen, QColor, QPolygonF
+from PySide6.QtWidgets import QWidget
+
+from qfluentwidgets import themeColor, isDarkTheme
+
+# App/Common
+from App.Common.Envelopes import EnvelopeCurve, ENVELOPE_END_LOOP
+
+
+class EnvelopeWidget(QWidget):
+    """ Plots an envelope curve, showing at least two passes of a loop. """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.curve: EnvelopeCurve | None = None
+        self.setFixedHeight(96)
+
+    def setCurve(self, curve: EnvelopeCurve | None):
+        self.curve = curve
+        self.update()
+
+    def _visibleTicks(self) -> float:
+        duration = self.curve.duration
+        if self.curve.end == ENVELOPE_END_LOOP:
+            duration += duration - self.curve.loop_start
+        return max(duration * 1.25, 1.0)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        gridColor = QColor(255, 255, 255, 24) if isDarkTheme() else QColor(0, 0, 0, 24)
+        painter.setPen(QPen(gridColor, 1))
+        painter.drawRect(self.rect().adjusted(0, 0, -1, -1))
+
+        if self.curve is None or self.width() < 2:
+            painter.end()
+            return
+
+        width, height = self.width(), self.height() - 4
+        columns = self.curve.evaluate(
+            [x * self._visibleTicks() / (width - 1) for x in range(width)]
+        )
+
+        polygon = QPolygonF([QPointF(x, 2 + height * (1.0 - level)) for x, level in enumerate(columns.tolist())])
+        painter.setPen(QPen(themeColor(), 1.5))
+        painter.drawPolyline(polygon)
+
+        if self.curve.end == ENVELOPE_END_LOOP:
+            x = self.curve.loop_start * (width - 1) / self._visibleTicks()
+            painter.setPen(QPen(gridColor, 1, Qt.PenStyle.DashLine))
+            painter.drawLine(QPointF(x, 0), QPointF(x, self.height()))
+
+        painter.end()
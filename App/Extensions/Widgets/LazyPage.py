@@ -0,0 +1,29 @@
+# App/Extensions/Widgets/LazyPage.py
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout
+
+
+class LazyPage(QWidget):
+    """
+    Stands in for a page in the navigation until it is first shown. The factory
+    imports the page's module and builds the page then, so pages that are never
+    opened cost nothing at start up.
+    """
+    def __init__(self, objectName: str, factory, parent=None):
+        super().__init__(parent=parent)
+        self.setObjectName(objectName)
+        self.factory = factory
+        self.page: QWidget | None = None
+
+        self.vBoxLayout = QVBoxLayout(self)
+        self.vBoxLayout.setContentsMargins(0, 0, 0, 0)
+
+    def ensurePage(self) -> QWidget:
+        if self.page is None:
+            self.page = self.factory(self)
+            self.vBoxLayout.addWidget(self.page)
+        return self.page
+
+    def showEvent(self, e):
+        self.ensurePage()
+        super().showEvent(e)
@@ -0,0 +1,121 @@
+# App/Extensions/Widgets/PresetComboBox.py
+
+from contextlib import contextmanager
+
+from PySide6.QtCore import Qt
+
+from qfluentwidgets import ComboBox
+
+# App/Common
+from App.Common.Helpers import patch_combo_setCurrentIndex
+
+# App/Models
+from App.Models.PresetListModel import PresetListModel, PresetFilterProxyModel
+
+
+class PresetComboBox(ComboBox):
+    """
+    Combo box mirroring the rows of a preset model. The fluent ComboBox keeps its own
+    items and can not show a model, so rows inserted, removed or changed in the model
+    become item inserts, removals and text updates, and only resets rebuild the items.
+    The selected preset is kept throughout.
+    Items follow model rows one to one, so a preset's item is found through the
+    model's row index. A selected preset the model does not have selects an equal
+    preset when there is one, otherwise it stays available as a trailing item.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMaxVisibleItems(8)
+        patch_combo_setCurrentIndex(self)
+
+        self.presetModel: PresetListModel | PresetFilterProxyModel | None = None
+        self.pinned = False
+
+    def setPresetModel(self, model: PresetListModel | PresetFilterProxyModel):
+        if self.presetModel is not None:
+            self.presetModel.rowsInserted.disconnect(self._onRowsInserted)
+            self.presetModel.rowsRemoved.disconnect(self._onRowsRemoved)
+            self.presetModel.dataChanged.disconnect(self._onDataChanged)
+            self.presetModel.modelReset.disconnect(self._reload)
+            self.presetModel.layoutChanged.disconnect(self._reload)
+
+        self.presetModel = model
+        model.rowsInserted.connect(self._onRowsInserted)
+        model.rowsRemoved.connect(self._onRowsRemoved)
+        model.dataChanged.connect(self._onDataChanged)
+        model.modelReset.connect(self._reload)
+        model.layoutChanged.connect(self._reload)
+
+        self._reload()
+
+    def setCurrentPreset(self, preset):
+        """ Selects the preset without emitting a change, adding it if the model hides it. """
+        with self._itemsChanging(preset):
+            pass
+
+    def currentPreset(self):
+        return self.currentData()
+
+    def _itemAt(self, row: int):
+        index = self.presetModel.index(row, 0)
+        return index.data(Qt.ItemDataRole.DisplayRole), index.data(Qt.ItemDataRole.UserRole)
+
+    def _equalItem(self, preset) -> int:
+        """ Index of an item with the same contents as the preset, -1 when there is none. """
+        if preset is None or not hasattr(preset, 'get_hash'):
+            return -1
+
+        presetHash = preset.get_hash()
+        for index in range(self.count()):
+            item = self.itemData(index)
+            if item is not None and type(item) is type(preset) and item.get_hash() == presetHash:
+                return index
+        return -1
+
+    @contextmanager
+    def _itemsChanging(self, preset):
+        """ Item changes shift the current index, restore the preset afterwards without signals. """
+        blocked = self.blockSignals(True)
+        try:
+            if self.pinned:
+                self.removeItem(self.count() - 1)
+                self.pinned = False
+
+            yield
+
+            index = self.presetModel.rowOf(preset)
+            if index < 0:
+                index = self._equalItem(preset)
+            if index < 0 and preset is not None:
+                self.addItem(preset.name, userData=preset)
+                self.pinned = True
+                index = self.count() - 1
+
+            if index >= 0:
+                self.setCurrentIndex(index)
+        finally:
+            self.blockSignals(blocked)
+
+    def _reload(self):
+        with self._itemsChanging(self.currentData()):
+            self.clear()
+            for row in range(self.presetModel.rowCount()):
+                text, preset = self._itemAt(row)
+                self.addItem(text, userData=preset)
+
+    def _onRowsInserted(self, parent, first: int, last: int):
+        with self._itemsChanging(self.currentData()):
+            for row in range(first, last + 1):
+                text, preset = self._itemAt(row)
+                self.insertItem(row, text, userData=preset)
+
+    def _onRowsRemoved(self, parent, first: int, last: int):
+        with self._itemsChanging(self.currentData()):
+            for row in range(last, first - 1, -1):
+                self.removeItem(row)
+
+    def _onDataChanged(self, topLeft, bottomRight, roles=()):
+        # Presets edited in place keep their item, only the shown name can change
+        for row in range(topLeft.row(), bottomRight.row() + 1):
+            text, _ = self._itemAt(row)
+            self.setItemText(row, text)
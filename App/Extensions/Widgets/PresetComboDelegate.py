@@ -0,0 +1,37 @@
+# App/Extensions/Widgets/PresetComboDelegate.py
+
+from PySide6.QtCore import Qt
+
+from qfluentwidgets import TableItemDelegate
+
+# App/Extensions
+from App.Extensions.Widgets.PresetComboBox import PresetComboBox
+
+# App/Models
+from App.Models.PresetListModel import PresetFilterProxyModel
+
+
+class PresetComboDelegate(TableItemDelegate):
+    """ Edits a preset cell with a combo box, only the active cell ever has one. """
+    def __init__(self, presetModel: PresetFilterProxyModel, parent=None):
+        super().__init__(parent)
+        self.presetModel = presetModel
+
+    def createEditor(self, parent, option, index):
+        combo = PresetComboBox(parent)
+        combo.setPresetModel(self.presetModel)
+        combo.currentIndexChanged.connect(lambda _, combo=combo: self._commit(combo))
+        return combo
+
+    def setEditorData(self, editor: PresetComboBox, index):
+        editor.setCurrentPreset(index.data(Qt.ItemDataRole.UserRole))
+
+    def setModelData(self, editor: PresetComboBox, model, index):
+        model.setData(index, editor.currentPreset(), Qt.ItemDataRole.UserRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        rect = option.rect
+        editor.setGeometry(rect.x() + 4, rect.y() + (rect.height() - editor.height()) // 2, rect.width() - 8, editor.height())
+
+    def _commit(self, editor: PresetComboBox):
+        self.commitData.emit(editor)
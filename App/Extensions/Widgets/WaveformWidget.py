@@ -0,0 +1,56 @@
+# App/Extensions/Widgets/WaveformWidget.py
+
+from PySide6.QtCore import Qt, QLineF
+from PySide6.QtGui import QPainter, QPixmap, QIcon, QColor, QPen
+from PySide6.QtWidgets import QWidget
+
+from qfluentwidgets import themeColor
+
+# App/Common
+from App.Common.Waveform import WaveformPyramid
+
+
+def drawWaveform(painter: QPainter, pyramid: WaveformPyramid, width: int, height: int, color: QColor):
+    """ Draws one vertical min/max line per pixel column, scaled to the sample's peak so quiet samples stay visible. """
+    mins, maxs = pyramid.columns(width, normalize=True)
+    if not len(mins):
+        return
+
+    center = height / 2
+    tops = center - maxs * center
+    bottoms = center - mins * center
+
+    painter.setPen(QPen(color, 1))
+    painter.drawLines([QLineF(x + 0.5, top, x + 0.5, bottom) for x, (top, bottom) in enumerate(zip(tops.tolist(), bottoms.tolist()))])
+
+
+def createWaveformIcon(pyramid: WaveformPyramid, width: int = 64, height: int = 16, color: QColor | None = None) -> QIcon:
+    pixmap = QPixmap(width, height)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    drawWaveform(painter, pyramid, width, height, color or themeColor())
+    painter.end()
+
+    return QIcon(pixmap)
+
+
+class WaveformWidget(QWidget):
+    """ Draws a sample's waveform at the widget's current width. """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pyramid: WaveformPyramid | None = None
+        self.setFixedHeight(40)
+
+    def setPyramid(self, pyramid: WaveformPyramid | None):
+        self.pyramid = pyramid
+        self.update()
+
+    def paintEvent(self, event):
+        if self.pyramid is None:
+            return
+
+        painter = QPainter(self)
+        drawWaveform(painter, self.pyramid, self.width(), self.height(), themeColor())
+        painter.end()
@@ -1,10 +1,11 @@
 # App/MainWindow.py
 
 import os
+from functools import partial
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QSize, QTimer
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtCore import QSize, QTimer
+from PySide6.QtGui import QIcon, QPixmap, QImage
 from PySide6.QtWidgets import QApplication, QLabel
 
 from qfluentwidgets import NavigationItemPosition, FluentWindow, SystemThemeListener, SplashScreen
@@ -12,26 +13,44 @@ from qfluentwidgets import NavigationItemPosition, FluentWindow, SystemThemeList
 # App/Common
 from App.Common.Config import cfg, isWin11, APP_VERSION
 from App.Common.SignalBus import signalBus
-from App.Common.Helpers import load_image_and_resize_image, apply_opacity_to_pixmap
-from App.Common.Presets import builtinPresetStore, userPresetStore
+from App.Common.Helpers import load_image_and_resize_image, composite_background
+from App.Common.Presets import builtinPresetStore, userPresetStore, presetLoader
+from App.Common.Frames import FrameGovernor, RepaintCounter
+from App.Common.Workers import run_in_background
+from App.Common.Startup import startupReport
 
 # App/Extensions
 from App.Resources.Icons.MSFluentIcons import MSFluentIcon as FICO
+from App.Extensions.Widgets.LazyPage import LazyPage
 
 # App/Views/Pages
 from App.Views.Pages.HomePage import HomePage
-from App.Views.Pages.BanksPage import BanksPage
-from App.Views.Pages.StructsPage import StructsPage
-from App.Views.Pages.SettingsPage import SettingsPage
+
+
+BACKGROUND_DEBOUNCE_MS = 120
+BACKGROUND_CACHE_SIZE = 4
 
 
 class MainWindow(FluentWindow):
     def __init__(self, parent=None):
         super().__init__(parent=parent)
         self._isMicaEnabled = False
-        self._originalPixmap = None
-        self._lastScaledSize = QSize()
-        self._scaledPixmapCache = None
+        self._originalImage: QImage | None = None
+        self._backgroundCache: dict[tuple, QPixmap] = {}
+        self._backgroundRequest = None
+        self._backgroundGeneration = 0
+
+        # Resizes and opacity drags settle before a new background is composited
+        self._backgroundTimer = QTimer(self)
+        self._backgroundTimer.setSingleShot(True)
+        self._backgroundTimer.setInterval(BACKGROUND_DEBOUNCE_MS)
+        self._backgroundTimer.timeout.connect(self._applyBackground)
+
+        # Repaints are driven by state changes, bursts of them are held to the frame budget
+        self.frameGovernor = FrameGovernor(60, self)
+        self.repaintCounter = RepaintCounter(self)
+        if cfg.get(cfg.repaintstats):
+            self.repaintCounter.start()
 
         # Splash Screen
         self.splashScreen = SplashScreen(':/assets/images/clef_icon.png', self)
@@ -47,12 +66,9 @@ class MainWindow(FluentWindow):
         self._onBackgroundChanged(cfg.get(cfg.bgimage))
         self.show()
 
-        # Init presets
+        # Set up Pages, they start empty and fill in as the preset stores are read
         self.builtinPresets = builtinPresetStore
         self.userPresets = userPresetStore
-        self._loadAllPresets()
-
-        # Set up Pages
         self._initPages()
         self._initNavigation()
 
@@ -61,11 +77,8 @@ class MainWindow(FluentWindow):
         self._themeListener.start()
         self._connectSlots()
 
-        QTimer.singleShot(1200, self.splashScreen.finish)
-
-        self.updateTimer = QTimer(self)
-        self.updateTimer.timeout.connect(self.onUpdate)
-        self.updateTimer.start(16)
+        # Init presets, the splash stays up until they are ready
+        self._loadAllPresets()
 
     #region Initialization
     def _initWindow(self):
@@ -86,10 +99,23 @@ class MainWindow(FluentWindow):
         self.bgLabel.lower()
 
     def _initPages(self):
+        # Only the home page is shown at start up, the others are imported and built when opened
         self.homePage = HomePage(self)
-        self.banksPage = BanksPage(self)
-        self.structsPage = StructsPage(self)
-        self.settingsPage = SettingsPage(self)
+        self.banksPage = LazyPage('banksPage', self._createBanksPage, self)
+        self.structsPage = LazyPage('structsPage', self._createStructsPage, self)
+        self.settingsPage = LazyPage('settingsPage', self._createSettingsPage, self)
+
+    def _createBanksPage(self, parent):
+        from App.Views.Pages.BanksPage import BanksPage
+        return BanksPage(parent)
+
+    def _createStructsPage(self, parent):
+        from App.Views.Pages.StructsPage import StructsPage
+        return StructsPage(parent)
+
+    def _createSettingsPage(self, parent):
+        from App.Views.Pages.SettingsPage import SettingsPage
+        return SettingsPage(parent)
 
     def _initNavigation(self):
         # Home Page
@@ -126,69 +152,104 @@ class MainWindow(FluentWindow):
         )
 
     def _connectSlots(self):
+        cfg.presetsFolderChanged.connect(self._onPresetsFolderChanged)
         cfg.backgroundChanged.connect(self._onBackgroundChanged)
         cfg.bgopacity.valueChanged.connect(self._updateBackgroundOpacity)
-        signalBus.micaEnableChanged.connect(self.setMicaEffectEnabled)
+        signalBus.micaEnableChanged.connect(self._onMicaEnableChanged)
     #endregion
 
     #region Window and Background
     def _onBackgroundChanged(self, imgPath):
-        if imgPath and os.path.exists(imgPath):
-            screenSize = QApplication.primaryScreen().size()
-            pixmap = load_image_and_resize_image(
-                imgPath,
-                target_size=(screenSize.width(), screenSize.height()),
-                keep_aspect=True
-            )
-            if not pixmap.isNull():
-                self._originalPixmap = pixmap
-            else:
-                self._originalPixmap = None
-        else:
-            self._originalPixmap = None
-
-        self._scaledPixmapCache = None
+        # Composites of the old image still in flight must not be shown or cached
+        self._backgroundGeneration += 1
+        self._backgroundCache.clear()
+
+        if not imgPath or not os.path.exists(imgPath):
+            self._originalImage = None
+            self._applyBackground()
+            return
+
+        # The old background stays up while the new one is decoded
+        screenSize = QApplication.primaryScreen().size()
+        run_in_background(
+            load_image_and_resize_image,
+            imgPath,
+            target_size=(screenSize.width(), screenSize.height()),
+            keep_aspect=True,
+            on_finished=partial(self._onBackgroundLoaded, self._backgroundGeneration, imgPath)
+        )
+
+    def _onBackgroundLoaded(self, generation: int, imgPath: str, image: QImage):
+        if generation != self._backgroundGeneration:
+            return
+
+        # Fall back to Qt's own decoder when PIL can not read the file
+        if image.isNull():
+            image = QImage(imgPath)
+
+        self._originalImage = image if not image.isNull() else None
         self._applyBackground()
 
     def _updateBackgroundOpacity(self, _: int):
-        self._applyBackground()
+        self._backgroundTimer.start()
+
+    def _onMicaEnableChanged(self, enabled: bool):
+        self.setMicaEffectEnabled(enabled)
+        self.update()
 
     def _applyBackground(self):
-        if self._originalPixmap is None:
-            # Try to load fallback
-            imgPath = cfg.get(cfg.bgimage)
-            if not imgPath or not os.path.exists(imgPath):
-                self.bgLabel.clear()
-                return
-
-            pixmap = QPixmap(imgPath)
-            if pixmap.isNull():
-                self.bgLabel.clear()
-                return
-
-            self._originalPixmap = pixmap
-
-        targetSize = self.size()
-        if self._scaledPixmapCache is None or targetSize != self._lastScaledSize:
-            self._scaledPixmapCache = self._originalPixmap.scaled(
-                targetSize,
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.FastTransformation
-            )
-            self._lastScaledSize = targetSize
-
-        self.bgLabel.setPixmap(self._scaledPixmapCache)
-
-        # Position image
-        x = (targetSize.width() - self._scaledPixmapCache.width()) // 2
-        y = (targetSize.height() - self._scaledPixmapCache.height()) // 2
-        self.bgLabel.setGeometry(x, y, self._scaledPixmapCache.width(), self._scaledPixmapCache.height())
-
-        # Apply opacity
-        opacity = cfg.get(cfg.bgopacity) / 100.0
-        pixmap_with_opacity = apply_opacity_to_pixmap(self._scaledPixmapCache, opacity)
-        self.bgLabel.setPixmap(pixmap_with_opacity)
+        """ Shows the composite for the current size and opacity, built on a worker when not cached. """
+        if self._originalImage is None:
+            self._backgroundRequest = None
+            self.bgLabel.clear()
+            return
+
+        size = self.size()
+        opacity = cfg.get(cfg.bgopacity)
+        key = (self._backgroundGeneration, size.width(), size.height(), opacity)
+
+        pixmap = self._backgroundCache.get(key)
+        if pixmap is not None:
+            self._backgroundRequest = None
+            self._showBackground(pixmap)
+            return
+
+        if key == self._backgroundRequest:
+            return
+
+        self._backgroundRequest = key
+        run_in_background(
+            composite_background, self._originalImage, size, opacity / 100.0,
+            on_finished=partial(self._onBackgroundComposited, key)
+        )
 
+    def _onBackgroundComposited(self, key, image: QImage):
+        if key[0] != self._backgroundGeneration:
+            return
+
+        pixmap = QPixmap.fromImage(image)
+
+        # A few sizes are kept so toggling maximize or an opacity back and forth is instant
+        self._backgroundCache[key] = pixmap
+        while len(self._backgroundCache) > BACKGROUND_CACHE_SIZE:
+            del self._backgroundCache[next(iter(self._backgroundCache))]
+
+        # Results of requests that were superseded are only cached
+        if key == self._backgroundRequest:
+            self._backgroundRequest = None
+            self._showBackground(pixmap)
+
+    def _showBackground(self, pixmap: QPixmap):
+        self.bgLabel.setPixmap(pixmap)
+        self.bgLabel.resize(pixmap.size())
+        self._positionBackground()
+
+    def _positionBackground(self):
+        # Keeps the shown composite centered while a new one is being built
+        pixmapSize = self.bgLabel.size()
+        x = (self.width() - pixmapSize.width()) // 2
+        y = (self.height() - pixmapSize.height()) // 2
+        self.bgLabel.move(x, y)
         self.bgLabel.lower()
 
     def _centerWindowOnScreen(self):
@@ -202,12 +263,17 @@ class MainWindow(FluentWindow):
 
     #region Load Presets
     def _loadAllPresets(self):
-        self.builtinPresets.load_builtin_presets()
-        self.userPresets.load_user_presets(Path(cfg.get(cfg.presetsfolder)))
-    #endregion
+        presetLoader.load(Path(cfg.get(cfg.presetsfolder)), on_finished=self._onPresetsLoaded)
 
-    def onUpdate(self):
-        self.update()
+    def _onPresetsLoaded(self):
+        self.splashScreen.finish()
+        startupReport.mark('presets loaded')
+        startupReport.report()
+
+    def _onPresetsFolderChanged(self, folder: str):
+        # Reloaded here rather than by the Presets page, which may not have been built
+        presetLoader.load(Path(folder))
+    #endregion
 
     def closeEvent(self, e):
         self._themeListener.terminate()
@@ -216,4 +282,5 @@ class MainWindow(FluentWindow):
 
     def resizeEvent(self, e):
         super().resizeEvent(e)
-        self._applyBackground()
+        self.frameGovernor.schedule(self._positionBackground)
+        self._backgroundTimer.start()
@@ -0,0 +1,79 @@
+# App/Models/BankListTableModel.py
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+
+class BankListTableModel(QAbstractTableModel):
+    """ One row per slot of a bank's instrument, drum or effect list. """
+    def __init__(self, listType: str, currentList: list, count: int, parent=None):
+        super().__init__(parent)
+        self.listType = listType
+        self.count = count
+        self.selection = list(currentList or [])
+        self.selection += [None] * (count - len(self.selection))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 2
+
+    def slotLabel(self, row: int) -> str:
+        if self.listType == 'instruments':
+            return f'Program {row}'
+        return f'Key {(21 + row) % 128}'
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        preset = self.selection[index.row()]
+        match index.column(), role:
+            case 0, Qt.ItemDataRole.DisplayRole:
+                return self.slotLabel(index.row())
+            case 1, Qt.ItemDataRole.DisplayRole:
+                return preset.name if preset else 'None'
+            case 1, Qt.ItemDataRole.UserRole:
+                return preset
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or index.column() != 1 or role not in (Qt.ItemDataRole.EditRole, Qt.ItemDataRole.UserRole):
+            return False
+
+        if self.selection[index.row()] is value:
+            return False
+
+        self.selection[index.row()] = value
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.UserRole])
+        return True
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() == 1:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            slot = 'Program' if self.listType == 'instruments' else 'Key'
+            return [slot, self.listType[:-1].title()][section]
+        return None
+
+    def setCount(self, count: int):
+        if count == self.count:
+            return
+
+        # Slots past the count keep their presets so shrinking and growing back is lossless
+        self.selection += [None] * (count - len(self.selection))
+        if count > self.count:
+            self.beginInsertRows(QModelIndex(), self.count, count - 1)
+            self.count = count
+            self.endInsertRows()
+        else:
+            self.beginRemoveRows(QModelIndex(), count, self.count - 1)
+            self.count = count
+            self.endRemoveRows()
+
+    def getSelection(self) -> list:
+        return self.selection[:self.count]
@@ -1,10 +1,14 @@
 # App/Models/BankPresetTableModel.py
 
-from PySide6.QtCore import Qt, QAbstractTableModel
+from PySide6.QtCore import Qt, QAbstractTableModel, QSortFilterProxyModel, QModelIndex
 
 # App/Resources
 from App.Resources.Emoji.MSFluentEmoji import MSFluentEmoji as FEMO
 
+# App/Common
+from App.Common.Presets import userPresetStore, get_preset_type
+from App.Common.SignalBus import signalBus
+
 
 GAME_TITLES = {
     'OOT': "Ocarina of Time",
@@ -13,14 +17,24 @@ GAME_TITLES = {
 
 
 class BankPresetTableModel(QAbstractTableModel):
-    def __init__(self, presets=None):
-        super().__init__()
-        self.presets = presets or []
-
-    def rowCount(self, parent=None):
-        return len(self.presets)
-
-    def columnCount(self, parent=None):
+    """
+    User banks in store order, kept in step with the store one row at a time.
+    Sorting is left to BankPresetSortProxyModel.
+    """
+    def __init__(self, userPresets=userPresetStore, parent=None):
+        super().__init__(parent)
+        self.userPresets = userPresets
+        self.presets = list(self.userPresets.banks.values())
+
+        signalBus.presetsChanged.connect(self._onPresetsChanged)
+        signalBus.presetAdded.connect(self._onPresetAdded)
+        signalBus.presetRemoved.connect(self._onPresetRemoved)
+        signalBus.presetUpdated.connect(self._onPresetUpdated)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.presets)
+
+    def columnCount(self, parent=QModelIndex()):
         return 2
 
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
@@ -30,6 +44,9 @@ class BankPresetTableModel(QAbstractTableModel):
         preset = self.presets[index.row()]
         col = index.column()
 
+        if role == Qt.ItemDataRole.UserRole:
+            return preset
+
         match col:
             case 0:
                 if role == Qt.ItemDataRole.DisplayRole:
@@ -44,10 +61,6 @@ class BankPresetTableModel(QAbstractTableModel):
                 if role == Qt.ItemDataRole.DisplayRole:
                     return preset.name
 
-            case _:
-                if role == Qt.ItemDataRole.UserRole:
-                    return preset
-
         return None
 
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
@@ -55,7 +68,57 @@ class BankPresetTableModel(QAbstractTableModel):
             return ["Game", "Preset Name"][section]
         return None
 
-    def updatePresets(self, presets):
+    def rowOf(self, preset) -> int:
+        return next((row for row, p in enumerate(self.presets) if p is preset), -1)
+
+    def updatePreset(self, preset):
+        """ Repaints a bank edited in place. """
+        row = self.rowOf(preset)
+        if row >= 0:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    #region Store Events
+    def _onPresetsChanged(self, presetType: str):
+        if presetType and presetType != 'banks':
+            return
+
+        # Bulk loads replace every bank anyway
         self.beginResetModel()
-        self.presets = presets
+        self.presets = list(self.userPresets.banks.values())
         self.endResetModel()
+
+    def _onPresetAdded(self, preset):
+        if get_preset_type(preset) != 'banks':
+            return
+
+        row = len(self.presets)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.presets.append(preset)
+        self.endInsertRows()
+
+    def _onPresetRemoved(self, preset):
+        if get_preset_type(preset) != 'banks':
+            return
+
+        row = self.rowOf(preset)
+        if row >= 0:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self.presets[row]
+            self.endRemoveRows()
+
+    def _onPresetUpdated(self, preset):
+        if get_preset_type(preset) == 'banks':
+            self.updatePreset(preset)
+    #endregion
+
+
+class BankPresetSortProxyModel(QSortFilterProxyModel):
+    """ Sorts on the clicked column, ties fall back to game then name. """
+    def lessThan(self, left, right):
+        model: BankPresetTableModel = self.sourceModel()
+        leftPreset = model.presets[left.row()]
+        rightPreset = model.presets[right.row()]
+
+        leftKey = (str(left.data()).casefold(), leftPreset.game, leftPreset.name.casefold())
+        rightKey = (str(right.data()).casefold(), rightPreset.game, rightPreset.name.casefold())
+        return leftKey < rightKey
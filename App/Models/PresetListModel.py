@@ -0,0 +1,277 @@
+# App/Models/PresetListModel.py
+
+from PySide6.QtCore import Qt, QAbstractListModel, QSortFilterProxyModel, QModelIndex, Signal
+
+# App/Common
+from App.Common.Presets import builtinPresetStore, userPresetStore, get_preset_type
+from App.Common.Helpers import has_valid_address, preset_key
+from App.Common.SignalBus import signalBus
+
+
+# Preset filters
+FILTER_ALL = 0
+FILTER_BUILTIN = 1
+FILTER_USER = 2
+
+
+class PresetListModel(QAbstractListModel):
+    """
+    Presets of one type from the built-in and user stores with a leading 'None' row,
+    the preset is stored in UserRole. Store changes are applied as row inserts and
+    removals so attached views keep their state.
+    """
+    builtinPresetsChanged = Signal()
+
+    def __init__(self, presetType: str, builtinPresets=builtinPresetStore, userPresets=userPresetStore, noneRow: bool = True, parent=None):
+        super().__init__(parent)
+        self.presetType = presetType
+        self.builtinPresets = builtinPresets
+        self.userPresets = userPresets
+        self.noneRow = noneRow
+
+        self.presets = self._storePresets()
+        self.builtinKeys = self._builtinKeys()
+        self.rows: dict | None = None             # Key to row, built on lookup
+
+        # Per game caches, cleared whenever the built-in presets change
+        self._validity: dict[tuple, bool] = {}
+        self._builtinNames: dict[str, set[str]] = {}
+
+        signalBus.presetsChanged.connect(self._onPresetsChanged)
+        signalBus.presetAdded.connect(self._onPresetAdded)
+        signalBus.presetRemoved.connect(self._onPresetRemoved)
+        signalBus.presetUpdated.connect(self._onPresetUpdated)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.presets)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        preset = self.presets[index.row()]
+        match role:
+            case Qt.ItemDataRole.DisplayRole:
+                return preset.name if preset else 'None'
+            case Qt.ItemDataRole.UserRole:
+                return preset
+        return None
+
+    def isBuiltin(self, preset) -> bool:
+        return preset_key(preset) in self.builtinKeys
+
+    def rowOf(self, preset) -> int:
+        """ Row of the preset, or of a copy of it, -1 when the stores do not have it. """
+        if self.rows is None:
+            self._indexRows()
+        return self.rows.get(preset_key(preset), -1)
+
+    def isValidFor(self, preset, game: str) -> bool:
+        """ Whether every sample of a built-in preset has an address in the game. """
+        key = (preset_key(preset), game)
+        if key not in self._validity:
+            self._validity[key] = has_valid_address(preset, game, self.presetType)
+        return self._validity[key]
+
+    def builtinNames(self, game: str = '') -> set[str]:
+        if game not in self._builtinNames:
+            self._builtinNames[game] = {
+                p.name for p in self.presets
+                if p and self.isBuiltin(p) and (not game or self.isValidFor(p, game))
+            }
+        return self._builtinNames[game]
+
+    def _storePresets(self) -> list:
+        builtin = getattr(self.builtinPresets, self.presetType, {})
+        user = getattr(self.userPresets, self.presetType, {})
+        return [None] * self.noneRow + list(builtin.values()) + list(user.values())
+
+    def _builtinKeys(self) -> set:
+        return {preset_key(p) for p in getattr(self.builtinPresets, self.presetType, {}).values()}
+
+    def _indexRows(self):
+        self.rows = {preset_key(p): row for row, p in enumerate(self.presets)}
+
+    def _tracks(self, preset) -> bool:
+        return self.userPresets is not None and get_preset_type(preset) == self.presetType
+
+    def _onPresetsChanged(self, presetType: str):
+        if presetType and presetType != self.presetType:
+            return
+
+        self.sync()
+
+    def _onPresetAdded(self, preset):
+        if not self._tracks(preset):
+            return
+
+        # User presets are appended to their store, and so to the rows
+        row = len(self.presets)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.presets.append(preset)
+        if self.rows is not None:
+            self.rows[preset_key(preset)] = row
+        self.endInsertRows()
+
+    def _onPresetRemoved(self, preset):
+        if not self._tracks(preset):
+            return
+
+        row = self._rowOfObject(preset)
+        if row < 0:
+            return
+
+        # Rows past the removed one shift, the index is rebuilt on the next lookup
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.presets[row]
+        self.rows = None
+        self.endRemoveRows()
+
+    def _onPresetUpdated(self, preset):
+        if not self._tracks(preset):
+            return
+
+        row = self._rowOfObject(preset)
+        if row >= 0:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index)
+
+    def _rowOfObject(self, preset) -> int:
+        """ Row holding this very object, copies sharing its key are skipped. """
+        row = self.rowOf(preset)
+        if 0 <= row < len(self.presets) and self.presets[row] is preset:
+            return row
+        return next((i for i, p in enumerate(self.presets) if p is preset), -1)
+
+    def sync(self):
+        """ Brings the rows in line with the stores, removing and inserting only what changed. """
+        presets = self._storePresets()
+        builtinKeys = self._builtinKeys()
+        builtinChanged = builtinKeys != self.builtinKeys
+        self.builtinKeys = builtinKeys
+        self._validity.clear()
+        self._builtinNames.clear()
+
+        newIds = {id(p) for p in presets}
+        kept = [p for p in self.presets if id(p) in newIds]
+
+        # Rows that were reordered can not be expressed as inserts and removals
+        it = iter(id(p) for p in presets)
+        if not all(id(p) in it for p in kept):
+            self.beginResetModel()
+            self.presets = presets
+            self.rows = None
+            self.endResetModel()
+        else:
+            self._applyRows(presets)
+
+        if builtinChanged:
+            self.builtinPresetsChanged.emit()
+
+    def _applyRows(self, presets: list):
+        newIds = {id(p) for p in presets}
+
+        # Remove missing rows last to first, one call per contiguous run
+        row = len(self.presets) - 1
+        while row >= 0:
+            if id(self.presets[row]) in newIds:
+                row -= 1
+                continue
+
+            last = row
+            while row >= 0 and id(self.presets[row]) not in newIds:
+                row -= 1
+
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self.presets[row + 1:last + 1]
+            self.rows = None
+            self.endRemoveRows()
+
+        # What is left is in order, insert new presets in runs where they belong
+        row = 0
+        index = 0
+        while index < len(presets):
+            if row < len(self.presets) and self.presets[row] is presets[index]:
+                row += 1
+                index += 1
+                continue
+
+            end = index
+            while end < len(presets) and (row >= len(self.presets) or presets[end] is not self.presets[row]):
+                end += 1
+
+            self.beginInsertRows(QModelIndex(), row, row + end - index - 1)
+            self.presets[row:row] = presets[index:end]
+            self.rows = None
+            self.endInsertRows()
+
+            row += end - index
+            index = end
+
+
+class PresetFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filters a PresetListModel to built-in or user-defined presets, the 'None' row is
+    always kept. With a game set, built-in presets whose samples the game lacks are hidden.
+    """
+    def __init__(self, game: str = '', parent=None):
+        super().__init__(parent)
+        self.presetFilter = FILTER_ALL
+        self.game = game
+
+    def setSourceModel(self, model: PresetListModel):
+        super().setSourceModel(model)
+        # User presets hidden behind a built-in name depend on rows other than their own
+        model.builtinPresetsChanged.connect(self.invalidateFilter)
+
+    def setPresetFilter(self, presetFilter: int):
+        if presetFilter == self.presetFilter:
+            return
+
+        self.presetFilter = presetFilter
+        self.invalidateFilter()
+
+    def setGame(self, game: str):
+        if game == self.game:
+            return
+
+        self.game = game
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, sourceRow, sourceParent):
+        model: PresetListModel = self.sourceModel()
+        preset = model.presets[sourceRow]
+        if preset is None:
+            return True
+
+        builtin = model.isBuiltin(preset)
+        if builtin and self.game and not model.isValidFor(preset, self.game):
+            return False
+
+        if self.presetFilter == FILTER_BUILTIN:
+            return builtin
+        if self.presetFilter == FILTER_USER:
+            return not builtin
+
+        # Built-in presets have no duplicates, user presets sharing their name are hidden
+        return builtin or preset.name not in model.builtinNames(self.game)
+
+    def presets(self) -> list:
+        return [self.index(row, 0).data(Qt.ItemDataRole.UserRole) for row in range(self.rowCount())]
+
+    def rowOf(self, preset) -> int:
+        model: PresetListModel = self.sourceModel()
+        sourceRow = model.rowOf(preset)
+        if sourceRow < 0:
+            return -1
+        return self.mapFromSource(model.index(sourceRow, 0)).row()
+
+
+_sharedModels: dict[str, PresetListModel] = {}
+
+
+def sharedPresetModel(presetType: str) -> PresetListModel:
+    """ The one model of a preset type every picker attaches to, created on first use. """
+    if presetType not in _sharedModels:
+        _sharedModels[presetType] = PresetListModel(presetType)
+    return _sharedModels[presetType]
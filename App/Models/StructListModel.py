@@ -0,0 +1,102 @@
+# App/Models/StructListModel.py
+
+import os
+from collections import Counter
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QIcon
+
+# App/Common
+from App.Common.Presets import userPresetStore
+
+# App/Models
+from App.Models.PresetListModel import PresetListModel
+
+
+class StructListModel(PresetListModel):
+    """
+    User presets of one type for the Presets page. Presets sharing a name show the
+    file they were loaded from, name counts are kept up to date as rows change.
+    """
+    def __init__(self, presetType: str, userPresets=userPresetStore, parent=None):
+        super().__init__(presetType, builtinPresets=None, userPresets=userPresets, noneRow=False, parent=parent)
+        self.icons: dict[int, QIcon] = {}
+
+        # Name of each row's preset as it was counted, edits rename presets in place
+        self.names: dict[int, str] = {}
+        self.nameCounts: Counter = Counter()
+        self._countNames()
+
+        self.modelReset.connect(self._countNames)
+        self.rowsInserted.connect(self._onRowsInserted)
+        self.rowsAboutToBeRemoved.connect(self._onRowsAboutToBeRemoved)
+        self.dataChanged.connect(self._onDataChanged)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        preset = self.presets[index.row()]
+        match role:
+            case Qt.ItemDataRole.DisplayRole:
+                if self.nameCounts[preset.name] > 1:
+                    path = self.userPresets.get_path(id(preset))
+                    if path:
+                        return f'{preset.name} ({os.path.basename(path)})'
+                return preset.name
+            case Qt.ItemDataRole.DecorationRole:
+                return self.icons.get(id(preset))
+        return super().data(index, role)
+
+    def setIcons(self, icons: dict[int, QIcon]):
+        """ Icons by preset id, replaces the icons of those presets. """
+        self.icons.update(icons)
+        if self.presets:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.presets) - 1, 0), [Qt.ItemDataRole.DecorationRole])
+
+    #region Name Counts
+    def _countNames(self):
+        self.names = {id(p): p.name for p in self.presets}
+        self.nameCounts = Counter(self.names.values())
+
+    def _rename(self, preset, name: str | None):
+        """ Moves a preset's count to a new name, None when it leaves the list. """
+        old = self.names.pop(id(preset), None)
+        if name is not None:
+            self.names[id(preset)] = name
+        if old == name:
+            return
+
+        # Rows of a name that crossed between unique and shared change their text
+        if old is not None:
+            self.nameCounts[old] -= 1
+            if self.nameCounts[old] == 1:
+                self._namesChanged(old, preset)
+        if name is not None:
+            self.nameCounts[name] += 1
+            if self.nameCounts[name] == 2:
+                self._namesChanged(name, preset)
+
+    def _namesChanged(self, name: str, skip):
+        for row, p in enumerate(self.presets):
+            if p is not skip and p.name == name:
+                index = self.index(row, 0)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+
+    def _onRowsInserted(self, parent, first: int, last: int):
+        for preset in self.presets[first:last + 1]:
+            self._rename(preset, preset.name)
+
+    def _onRowsAboutToBeRemoved(self, parent, first: int, last: int):
+        for preset in self.presets[first:last + 1]:
+            self._rename(preset, None)
+            self.icons.pop(id(preset), None)
+
+    def _onDataChanged(self, topLeft, bottomRight, roles=()):
+        if roles and Qt.ItemDataRole.DisplayRole not in roles:
+            return
+
+        for preset in self.presets[topLeft.row():bottomRight.row() + 1]:
+            if self.names.get(id(preset)) != preset.name:
+                self._rename(preset, preset.name)
+    #endregion
@@ -1,7 +1,5 @@
 # App/Extensions/MSFluentIcon.py
 
-from enum import Enum
-
 from PySide6.QtCore import QSize
 from PySide6.QtGui import QIcon
 
@@ -9,7 +7,48 @@ from qfluentwidgets.common.icon import FluentIconBase, getIconColor
 from qfluentwidgets.common.style_sheet import Theme
 
 
-class MSFluentIcon(FluentIconBase, Enum):
+class LazyIconType(type):
+    """
+    Icon names in the class body are kept as plain strings and an icon is only
+    created the first time it is used, building thousands of enum members up front
+    cost more than the rest of the start up imports. Members behave like an enum's,
+    one instance per icon with a name and a value.
+    """
+    def __new__(mcs, name, bases, namespace):
+        values = {k: v for k, v in namespace.items() if k.isupper() and isinstance(v, str)}
+        for key in values:
+            del namespace[key]
+
+        cls = super().__new__(mcs, name, bases, namespace)
+        cls._values = values
+        cls._names = {v: k for k, v in values.items()}
+        return cls
+
+    def __getattr__(cls, name):
+        if name not in cls._values:
+            raise AttributeError(f'{cls.__name__} has no icon {name!r}')
+        return cls(cls._values[name])
+
+    def __call__(cls, value):
+        if value not in cls._names:
+            raise ValueError(f'{value!r} is not a valid {cls.__name__}')
+
+        # Cached on the class, later lookups no longer reach __getattr__
+        name = cls._names[value]
+        member = cls.__dict__.get(name)
+        if member is None:
+            member = super().__call__(name, value)
+            setattr(cls, name, member)
+        return member
+
+    def __iter__(cls):
+        return (cls(value) for value in cls._values.values())
+
+    def __len__(cls):
+        return len(cls._values)
+
+
+class MSFluentIcon(FluentIconBase, metaclass=LazyIconType):
     ACCESSIBILITY = "accessibility"
     ACCESSIBILITY_CHECKMARK = "accessibility_checkmark"
     ACCESSIBILITY_ERROR = "accessibility_error"
@@ -2668,5 +2707,12 @@ class MSFluentIcon(FluentIconBase, Enum):
     ZOOM_IN = "zoom_in"
     ZOOM_OUT = "zoom_out"
 
+    def __init__(self, name: str, value: str):
+        self.name = name
+        self.value = value
+
+    def __repr__(self):
+        return f'<{type(self).__name__}.{self.name}: {self.value!r}>'
+
     def path(self, theme=Theme.AUTO):
         return f':/assets/icons/msfluent/{self.value}_{getIconColor(theme)}.svg'
@@ -0,0 +1,265 @@
+# Auto-generated sample address table
+# Do not edit manually. Regenerate using generate_sample_addresses.py
+# All addresses are corrected to use AT00 or AT01
+
+from array import array
+
+SAMPLE_GAMES = ('OOT', 'MM')
+
+# Sorted sample names, the position of a name is its row in every array below
+SAMPLE_NAMES = (
+    'ACOUSTIC BASS:A033',
+    'ACOUSTIC SNARE:SNGL',
+    'AFRICAN 13 111-A:A093',
+    'AFRIK FLUTE7:HIGH',
+    'AFRIK FLUTE7:LOW',
+    'AFRIK FLUTE7:PRIM',
+    'AL RYTHM 26:LOW',
+    'AL RYTHM 26:PRIM',
+    'ANCIENTS-L:B047',
+    'ANCIENTS-R:G068',
+    'AWKBIRD1:D074',
+    'AWKBIRD2:D087',
+    'BAMBREMORO:B071',
+    'BANDONEON:C072',
+    'BANJO:A057',
+    'BANJO:D050',
+    'BAR CHIMES:D123',
+    'BASSOON:A045',
+    'BASSOON:A069',
+    'BENT CONGA:C072',
+    'BOUZOUKI:D050',
+    'BOUZOUKI:D062',
+    'BRUSH SNARE:C048',
+    'CABASA:D123',
+    'CHURCH BELL:A070',
+    'CLAP:C072',
+    'CLARINET:C072',
+    'CONCERT BASS DRUM:D038',
+    'CONGAS:MUTE',
+    'CONGAS:OPEN',
+    'COWBELL:E076',
+    'CRASH CYMBAL:C060',
+    'CRUNCH ROAR:C060',
+    'CUICA:MUTE',
+    'CUICA:OPEN',
+    'DANGER:F066',
+    'DIGI PAD 04:F065',
+    'DJEMBE:MUTE',
+    'DJEMBE:OPEN',
+    'DJEMBE:SLAP',
+    'DUDUK:D086',
+    'EERIE WIND:F042',
+    'ELECTRIC ORGAN:G068',
+    'ELVES:C096',
+    'ENIGMATIC:F054',
+    'FEMALE CHOIR:B071',
+    'FEMALE CHOIR:F077',
+    'FRENCH HORN:C072',
+    'FRETLESS BASS:F041',
+    'FU YIN GONG:A081',
+    "GIANTS' VOICE:C061",
+    'GLOCKENSPIEL:B083',
+    'GONG:G068',
+    'GORON CHILD:B071',
+    'HARMONICA:G068',
+    'HARP:F065',
+    'HARP:F077',
+    'HARPSICHORD:G067',
+    'HEAVY METALLIC HIT:F066',
+    'HI-HAT:OPEN',
+    'HIGH-Q:B119',
+    'ICELAND 1:D086',
+    'JP CYMBAL:HIGH',
+    'JP CYMBAL:LOW',
+    'JP CYMBAL:PRIM',
+    'KICK DRUM:G043',
+    'LORE DRONE:A069',
+    'MALE CHOIR:C109',
+    'MALE CHOIR:G067',
+    'MALON & LULU VOICE:D074',
+    'MARIMBA:D062',
+    'MARIMBA:D074',
+    'METAL GRIND:C060',
+    'MUTED E. GUITAR:E052',
+    'MUTED TRUMPET:C060',
+    'MYSTIC PAD:F030',
+    'NYLON STR GUITAR:D075',
+    'NYLON STR GUITAR:G056',
+    'OBOE:E076',
+    'OCARINA:G080',
+    'OMINOUSITY:F018',
+    'ORCH SNARE:ROLL',
+    'ORCH SNARE:SNGL',
+    'PANDEIRO:SLAP',
+    'PANDEIRO:TAP',
+    'PERC:CONGA:MUTE',
+    'PERC:CONGA:OPEN',
+    'PERC:CONGA:SLAP',
+    'PIANO:A045',
+    'PIANO:C060',
+    'PIANO:C072',
+    'PICCOLO:G091',
+    'PIPE ORGAN:C048',
+    'PIPE ORGAN:C060',
+    'PIT HIT 1:D038',
+    'PIZZ. STRINGS:A070',
+    'PIZZ. STRINGS:B047',
+    'RAWHIDE DRUM:B047',
+    'RELIGIOUS PRAYER:C072',
+    'RELIGIOUS PRAYER:D086',
+    'RELIGIOUS PRAYER:F089',
+    'REVERB MARIMBA:A057',
+    'RHODES E. PIANO:C072',
+    'RHODES E. PIANO:F054',
+    'RIDE CYMBAL:G116',
+    'SHAKER:E112',
+    'SHEHNAI:A057',
+    'SHINE:E088',
+    'SITAR:A057',
+    'SLEIGHBELL:B107',
+    'SPACEOSPHERE:G091',
+    'STEEL DRUM:C060',
+    'STEEL DRUM:D074',
+    'STEEL STR GUITAR:D050',
+    'STEEL STR GUITAR:D074',
+    'STRINGS:C036',
+    'STRINGS:G056',
+    'STRINGS:G068',
+    'SURDO:A045',
+    'SUSTAIN E. GUITAR:A045',
+    'SUSTAIN E. GUITAR:C060',
+    'SUSTAIN E. GUITAR:G079',
+    'SYNFANTASIA3:D075',
+    'SYNTH STRINGS:C060',
+    'SYNTH STRINGS:G067',
+    'TABLA:G055',
+    'TAMBOURINE:A118',
+    'TENOR SAXOPHONE:A057',
+    'TENOR SAXOPHONE:E064',
+    'TIMPANI:C048',
+    'TRIP-HOPPIN:KICK',
+    'TRIP-HOPPIN:SNRE',
+    'TROMBONE:G067',
+    'TRUMPET:C072',
+    'TUBA:E040',
+    'TUNNEL RAIN:F029',
+    'UDU:A046',
+    'UDU:D038',
+    'VELOCITY MC-202:C036',
+    'VERBHHOD6:C120',
+    'VIOLIN:A069',
+)
+
+# Address of every sample per game, -1 if the game does not have the sample
+SAMPLE_ADDRESSES = {
+    'OOT': array('l', [
+        0x00359170, -1, -1, 0x003D37A0, 0x003D1980, 0x003D2840, 0x00391FD0, 0x00395710,
+        0x004006B0, 0x0029FE30, -1, -1, 0x003C9FD0, 0x000FDFC0, 0x003F0DF0, 0x003EDFB0,
+        0x003C1F90, 0x0033BC30, -1, 0x003C7A90, 0x003AC3B0, 0x003AFA80, -1, 0x003DBB00,
+        0x003E8000, 0x0035C900, 0x00397A60, 0x00304E30, -1, -1, 0x003DCA50, 0x0030EAF0,
+        0x00416B30, 0x003ED4F0, 0x003ECC50, -1, 0x003CB570, 0x003B6B40, 0x003B4330, 0x003B5350,
+        0x004428B0, 0x00381930, -1, -1, 0x003FA9E0, 0x002DFF40, 0x002E7410, 0x00351810,
+        -1, 0x0038D230, -1, 0x002F3300, 0x003B7A60, -1, 0x0032CA00, 0x002EF650,
+        0x001026F0, 0x00398650, -1, -1, -1, -1, -1, -1,
+        -1, -1, 0x002A4D40, 0x002B43B0, 0x002AF020, 0x00106C20, 0x0039FBE0, 0x003A2280,
+        0x002F8690, -1, -1, -1, 0x00332D10, 0x0032ECB0, 0x0033A980, 0x000FAD40,
+        -1, 0x0030C360, 0x00309BD0, 0x00337A10, 0x00335740, 0x003D45A0, 0x003D6860, 0x003D9030,
+        0x002C8510, 0x002CFEE0, 0x002D96A0, 0x00108690, 0x00343870, 0x0034D670, -1, 0x003403F0,
+        0x0033D130, -1, 0x00365DB0, 0x0035D100, 0x0036C840, 0x0037A4B0, -1, -1,
+        -1, -1, -1, 0x002A8500, -1, -1, 0x002B9E60, 0x003F3690,
+        0x003F82F0, -1, -1, 0x0031F640, 0x00324660, 0x00328D10, -1, 0x003DD710,
+        0x003DFEF0, 0x003E20B0, 0x003A4410, 0x004377E0, -1, -1, 0x00338450, -1,
+        -1, 0x00317260, 0x00409270, 0x0040AC40, 0x002FD270, 0x002F9A90, 0x00301EC0, -1,
+        -1, -1, -1, -1, 0x003E3F80,
+    ]),
+    'MM': array('l', [
+        0x004461A0, 0x00411340, 0x0049BF60, -1, -1, -1, -1, -1,
+        -1, -1, 0x00498B50, 0x0049A670, -1, 0x0027B930, 0x004F6280, 0x004F3440,
+        0x004CC1F0, 0x0043E560, 0x004E60A0, 0x004D1CF0, 0x004B6610, 0x004B9CE0, 0x00496610, 0x00500080,
+        0x0051E2C0, -1, 0x004EC650, 0x003D9670, 0x00495240, 0x00493E70, 0x00500FD0, 0x003E3330,
+        -1, 0x00540830, 0x0053FF90, 0x00473E10, 0x0052A260, 0x004C0DA0, 0x004BE590, 0x004BF5B0,
+        -1, 0x004520D0, 0x00480600, 0x004E65F0, -1, 0x003C0F20, 0x003C83F0, 0x00427770,
+        0x002B6570, -1, 0x002BB710, 0x003D42E0, 0x004C1CC0, 0x002B82E0, 0x00435820, 0x003D0630,
+        0x00280060, 0x004DEB10, 0x004AB940, 0x00412620, 0x004B0BA0, 0x004D4230, 0x0050AA40, 0x00501C90,
+        0x002A4740, 0x0040E220, -1, 0x004889B0, 0x00483620, 0x00284590, 0x00513220, 0x005158C0,
+        -1, 0x004728F0, 0x0029A8F0, 0x004B0CD0, 0x0043BB30, 0x00437AD0, 0x004264C0, 0x002786B0,
+        0x00464970, 0x003E0BA0, 0x003DE410, 0x003F3980, 0x0028CFA0, 0x004F8B20, 0x004FADE0, 0x004FD5B0,
+        0x003F9010, 0x004009E0, 0x002AFCD0, 0x00286000, -1, -1, 0x0046E340, 0x00442D20,
+        0x0043FA60, 0x002917A0, -1, -1, -1, 0x005412F0, 0x004608E0, 0x0045D9D0,
+        0x00414C60, 0x0040EBE0, 0x004ED240, -1, 0x004EF640, 0x003EBAA0, -1, 0x00522F10,
+        0x00527B70, 0x00295040, 0x003F21D0, 0x00419100, 0x0041E120, 0x004227D0, 0x0028A690, 0x00517A50,
+        0x0051A230, 0x0051C3F0, 0x0044A130, -1, 0x00478C20, 0x004AEF20, 0x0028F270, 0x003EF2C0,
+        0x003F0780, 0x0029C360, -1, -1, 0x003F43C0, 0x0042F0D0, 0x004328B0, 0x004A5780,
+        0x00491090, 0x0048E460, 0x004B4940, 0x0046AB90, 0x0040A1A0,
+    ]),
+}
+
+# Present addresses in ascending order and the row of each, for reverse lookups
+SAMPLE_ADDRESSES_SORTED = {
+    'OOT': array('l', [
+        0x000FAD40, 0x000FDFC0, 0x001026F0, 0x00106C20, 0x00108690, 0x0029FE30, 0x002A4D40, 0x002A8500,
+        0x002AF020, 0x002B43B0, 0x002B9E60, 0x002C8510, 0x002CFEE0, 0x002D96A0, 0x002DFF40, 0x002E7410,
+        0x002EF650, 0x002F3300, 0x002F8690, 0x002F9A90, 0x002FD270, 0x00301EC0, 0x00304E30, 0x00309BD0,
+        0x0030C360, 0x0030EAF0, 0x00317260, 0x0031F640, 0x00324660, 0x00328D10, 0x0032CA00, 0x0032ECB0,
+        0x00332D10, 0x00335740, 0x00337A10, 0x00338450, 0x0033A980, 0x0033BC30, 0x0033D130, 0x003403F0,
+        0x00343870, 0x0034D670, 0x00351810, 0x00359170, 0x0035C900, 0x0035D100, 0x00365DB0, 0x0036C840,
+        0x0037A4B0, 0x00381930, 0x0038D230, 0x00391FD0, 0x00395710, 0x00397A60, 0x00398650, 0x0039FBE0,
+        0x003A2280, 0x003A4410, 0x003AC3B0, 0x003AFA80, 0x003B4330, 0x003B5350, 0x003B6B40, 0x003B7A60,
+        0x003C1F90, 0x003C7A90, 0x003C9FD0, 0x003CB570, 0x003D1980, 0x003D2840, 0x003D37A0, 0x003D45A0,
+        0x003D6860, 0x003D9030, 0x003DBB00, 0x003DCA50, 0x003DD710, 0x003DFEF0, 0x003E20B0, 0x003E3F80,
+        0x003E8000, 0x003ECC50, 0x003ED4F0, 0x003EDFB0, 0x003F0DF0, 0x003F3690, 0x003F82F0, 0x003FA9E0,
+        0x004006B0, 0x00409270, 0x0040AC40, 0x00416B30, 0x004377E0, 0x004428B0,
+    ]),
+    'MM': array('l', [
+        0x002786B0, 0x0027B930, 0x00280060, 0x00284590, 0x00286000, 0x0028A690, 0x0028CFA0, 0x0028F270,
+        0x002917A0, 0x00295040, 0x0029A8F0, 0x0029C360, 0x002A4740, 0x002AFCD0, 0x002B6570, 0x002B82E0,
+        0x002BB710, 0x003C0F20, 0x003C83F0, 0x003D0630, 0x003D42E0, 0x003D9670, 0x003DE410, 0x003E0BA0,
+        0x003E3330, 0x003EBAA0, 0x003EF2C0, 0x003F0780, 0x003F21D0, 0x003F3980, 0x003F43C0, 0x003F9010,
+        0x004009E0, 0x0040A1A0, 0x0040E220, 0x0040EBE0, 0x00411340, 0x00412620, 0x00414C60, 0x00419100,
+        0x0041E120, 0x004227D0, 0x004264C0, 0x00427770, 0x0042F0D0, 0x004328B0, 0x00435820, 0x00437AD0,
+        0x0043BB30, 0x0043E560, 0x0043FA60, 0x00442D20, 0x004461A0, 0x0044A130, 0x004520D0, 0x0045D9D0,
+        0x004608E0, 0x00464970, 0x0046AB90, 0x0046E340, 0x004728F0, 0x00473E10, 0x00478C20, 0x00480600,
+        0x00483620, 0x004889B0, 0x0048E460, 0x00491090, 0x00493E70, 0x00495240, 0x00496610, 0x00498B50,
+        0x0049A670, 0x0049BF60, 0x004A5780, 0x004AB940, 0x004AEF20, 0x004B0BA0, 0x004B0CD0, 0x004B4940,
+        0x004B6610, 0x004B9CE0, 0x004BE590, 0x004BF5B0, 0x004C0DA0, 0x004C1CC0, 0x004CC1F0, 0x004D1CF0,
+        0x004D4230, 0x004DEB10, 0x004E60A0, 0x004E65F0, 0x004EC650, 0x004ED240, 0x004EF640, 0x004F3440,
+        0x004F6280, 0x004F8B20, 0x004FADE0, 0x004FD5B0, 0x00500080, 0x00500FD0, 0x00501C90, 0x0050AA40,
+        0x00513220, 0x005158C0, 0x00517A50, 0x0051A230, 0x0051C3F0, 0x0051E2C0, 0x00522F10, 0x00527B70,
+        0x0052A260, 0x0053FF90, 0x00540830, 0x005412F0,
+    ]),
+}
+
+SAMPLE_ADDRESS_ROWS = {
+    'OOT': array('H', [
+         79,  13,  56,  69,  91,   9,  66, 107,
+         68,  67, 110,  88,  89,  90,  45,  46,
+         55,  51,  72, 133, 132, 134,  27,  82,
+         81,  31, 129, 115, 116, 117,  54,  77,
+         76,  84,  83, 126,  78,  17,  96,  95,
+         92,  93,  47,   0,  25,  99,  98, 100,
+        101,  41,  49,   6,   7,  26,  57,  70,
+         71, 122,  20,  21,  38,  39,  37,  52,
+         16,  19,  12,  36,   4,   5,   3,  85,
+         86,  87,  23,  30, 119, 120, 121, 140,
+         24,  34,  33,  15,  14, 111, 112,  44,
+          8, 130, 131,  32, 123,  40,
+    ]),
+    'MM': array('H', [
+         79,  13,  56,  69,  91, 118,  84, 126,
+         97, 113,  74, 129,  64,  90,  48,  53,
+         50,  45,  46,  55,  51,  27,  82,  81,
+         31, 109, 127, 128, 114,  83, 132,  88,
+         89, 140,  65, 105,   1,  59, 104, 115,
+        116, 117,  78,  47, 133, 134,  54,  77,
+         76,  17,  96,  95,   0, 122,  41, 103,
+        102,  80, 139,  94,  73,  35, 124,  42,
+         68,  67, 137, 136,  29,  28,  22,  10,
+         11,   2, 135,  58, 125,  60,  75, 138,
+         20,  21,  38,  39,  37,  52,  16,  19,
+         61,  57,  18,  43,  26, 106, 108,  15,
+         14,  85,  86,  87,  23,  30,  63,  62,
+         70,  71, 119, 120, 121,  24, 111, 112,
+         36,  34,  33, 101,
+    ]),
+}
@@ -16,10 +16,12 @@ from App.Resources.Icons.MSFluentIcons import MSFluentIcon as FICO
 
 # App/Common
 from App.Common.Config import cfg
-from App.Common.Presets import builtinPresetStore, userPresetStore, presetRegistry
+from App.Common.Presets import builtinPresetStore, userPresetStore, presetLoader, presetRegistry
 from App.Common.Helpers import make_dot_icon, clone_bank, generate_copy_name
 from App.Common.Serialization import serialize_to_yaml
 from App.Common.Audiobank import Audiobank
+from App.Common.Audiotable import get_audiotable
+from App.Common.Workers import run_in_background
 
 # App/Extensions
 from App.Extensions.Components.PresetCommands import (
@@ -60,7 +62,7 @@ class BanksViewModel(object):
         # Signals
         self._connectSignals()
 
-        # Refresh presets
+        # Initial action state
         self.refresh()
 
     def _setupCommandBarActions(self):
@@ -133,6 +135,8 @@ class BanksViewModel(object):
         self.exportPresetMenu = RoundMenu()
         self.savePresetAction = Action(icon=FICO.SAVE, text='Save to YAML', triggered=self._onExportPreset)
         self.compilePresetAction = Action(icon=FICO.CODE_BLOCK, text='Compile to binary', triggered=self._onCompilePreset)
+        self.soundFontPresetAction = Action(icon=FICO.MUSIC_NOTE_2, text='Export to SoundFont', triggered=self._onExportSoundFont)
+        self.prunePresetAction = Action(icon=FICO.CODE_BLOCK, text='Compile pruned for sequence', triggered=self._onCompilePrunedPreset)
 
         # These are here so they show up in the menu
         self.savePresetAction.setShortcut(QKeySequence('Ctrl+S'))
@@ -140,7 +144,9 @@ class BanksViewModel(object):
 
         self.exportPresetMenu.addActions([
             self.savePresetAction,
-            self.compilePresetAction
+            self.compilePresetAction,
+            self.prunePresetAction,
+            self.soundFontPresetAction
         ])
 
     def _connectSignals(self):
@@ -229,18 +235,7 @@ class BanksViewModel(object):
             self._setupEditPresetMenu()
 
     def _loadAllPresets(self):
-        self.builtinPresets.load_builtin_presets()
-        self.userPresets.load_user_presets(Path(cfg.get(cfg.presetsfolder)))
-
-    def _refreshTableWidget(self):
-        presetList = list(self._getPresetList())
-        presetList.sort(key=lambda p: (p.game, p.name))
-
-        self.page.tableModel.updatePresets(presetList)
-        self.page.tableWidget.clearSelection()
-
-    def _getPresetList(self):
-        return self.userPresets.banks.values()
+        presetLoader.load(Path(cfg.get(cfg.presetsfolder)))
     #endregion
 
     #region Preset Handling
@@ -259,12 +254,7 @@ class BanksViewModel(object):
             self._clearPresetSelection()
 
             # Select newly created item
-            row_to_select = -1
-            for row, preset in enumerate(self.page.tableModel.presets):
-                if preset == newPreset:
-                    row_to_select = row
-                    break
-
+            row_to_select = self.page.tableModel.rowOf(newPreset)
             if row_to_select >= 0:
                 index = self.page.tableModel.index(row_to_select, 1)
                 proxy_index = self.page.tableProxy.mapFromSource(index)
@@ -305,7 +295,6 @@ class BanksViewModel(object):
             self._showErrorTooltip(ex)
             return
 
-        self.userPresets.remove_preset(preset)
         self.userPresets.add_preset(preset, filePath)
 
     def _onCompilePreset(self):
@@ -316,7 +305,7 @@ class BanksViewModel(object):
         errorMsgs = []
 
         for preset in self.selectedPresets:
-            success, error = preset.compile(cfg.get(cfg.outputfolder))
+            success, error = preset.compile(cfg.get(cfg.outputfolder), cfg.get(cfg.writemapfile))
 
             if success:
                 outPath = Path(cfg.outputfolder.value) / preset.game / preset.name
@@ -330,6 +319,82 @@ class BanksViewModel(object):
         if errorMsgs:
             self._showErrorTooltip('\n'.join(errorMsgs))
 
+    def _onCompilePrunedPreset(self):
+        from App.Common.Sequence import read_sequence_usage, prune_bank
+
+        if not self.selectedItems and not self.selectedPresets:
+            return
+
+        filePath, _ = QFileDialog.getOpenFileName(
+            self.page,
+            'Select Sequence',
+            '',
+            'Sequence Files (*.seq *.zseq *.aseq);;All Files (*)'
+        )
+
+        if not filePath:
+            return
+
+        try:
+            usage = read_sequence_usage(filePath)
+        except Exception as ex:
+            self._showErrorTooltip(ex)
+            return
+
+        successMsgs = []
+        errorMsgs = []
+
+        for preset in self.selectedPresets:
+            # A name of its own keeps the pruned bank from overwriting the full compile
+            try:
+                pruned, report = prune_bank(preset, usage, f'{preset.name} (pruned)')
+            except Exception as ex:
+                errorMsgs.append(f"Error pruning '{preset.name}': {ex}")
+                continue
+
+            success, error = pruned.compile(cfg.get(cfg.outputfolder), cfg.get(cfg.writemapfile))
+
+            if success:
+                successMsgs.append(
+                    f"Compiled '{pruned.name}' without {len(report.removed_instruments)} instrument(s) and "
+                    f"{len(report.removed_drums)} drum(s), saving {report.bytes_saved} bytes "
+                    f"and {report.sample_bytes} bytes of samples"
+                )
+            else:
+                errorMsgs.append(f"Error compiling '{preset.name}': {error}")
+
+        if successMsgs:
+            self._showSuccessTooltip('\n'.join(successMsgs))
+
+        if errorMsgs:
+            self._showErrorTooltip('\n'.join(errorMsgs))
+
+    def _onExportSoundFont(self):
+        # The SoundFont writer and its sample cache are only imported once needed
+        from App.Common.SoundFont import export_soundfonts
+
+        if not self.selectedItems and not self.selectedPresets:
+            return
+
+        # Banks of a game share their samples, so they are exported together
+        banksByGame: dict[str, list[Audiobank]] = {}
+        for preset in self.selectedPresets:
+            banksByGame.setdefault(preset.game, []).append(preset)
+
+        for game, banks in banksByGame.items():
+            audiotable = get_audiotable(game)
+            if audiotable is None:
+                self._showErrorTooltip(f"No {game}.audiobin in the audiobin folder, set it in Settings to export SoundFonts")
+                continue
+
+            # Samples are decoded on the worker thread, spawning processes from the GUI is not safe
+            outDir = Path(cfg.get(cfg.outputfolder)) / game
+            run_in_background(
+                export_soundfonts, banks, audiotable, outDir, workers=1,
+                on_finished=lambda paths, outDir=outDir: self._showSuccessTooltip(f'Exported {len(paths)} SoundFont(s) to folder: {outDir}'),
+                on_failed=self._showErrorTooltip
+            )
+
     def _onDeletePreset(self):
         if not self.selectedItems and not self.selectedPresets:
             return
@@ -474,15 +539,12 @@ class BanksViewModel(object):
                 return
 
             oldList = currentList.copy()
-            combinedPresets, builtinPresets, userPresets = self._getCombinedPresets(listType)
 
             dialog = EditBankDialog(
                 mode='bankList',
                 listType=listType,
                 currentList=currentList,
-                combinedPresets=combinedPresets,
-                builtinPresets=builtinPresets,
-                userPresets=userPresets,
+                game=bank.game,
                 parent=self.page
             )
 
@@ -498,41 +560,6 @@ class BanksViewModel(object):
                 self.undoStack.push(cmd)
 
             # self._clearPresetSelection()
-
-    def _getCombinedPresets(self, listType: str):
-        from App.Common.Addresses import AUDIO_SAMPLE_ADDRESSES
-        from App.Common.Constants import SAMPLE_FIELDS
-
-        def has_valid_address(preset, gameId: str) -> bool:
-            sample_fields = SAMPLE_FIELDS.get(listType, [])
-            for field in sample_fields:
-                sample_obj = getattr(preset, field, None)
-                if not sample_obj or not sample_obj.sample:
-                    continue
-                sample_name = sample_obj.sample.name
-                sample_entry = AUDIO_SAMPLE_ADDRESSES.get(sample_name.upper())
-                if not sample_entry or sample_entry.get(gameId, -1) == -1:
-                    return False
-            return True # All samples valid
-
-        builtin_dict = getattr(self.builtinPresets, listType, {})
-        user_dict = getattr(self.userPresets, listType, {})
-
-        # Convert builtin dict values to list
-        gameId = self.bankObject.game if self.bankObject else 'OOT'
-        builtin_list = [
-            p for p in builtin_dict.values()
-            if has_valid_address(p, gameId) # Ensure only objects for the bank's game are added
-        ]
-        user_list = list(user_dict.values())
-
-        # Combine builtin presets with user-defined presets
-        # Duplicates are allowed for user-defined presets, but builtin presets do not have duplicates
-        builtin_names = {p.name for p in builtin_list}
-
-        combined_list = builtin_list + [p for p in user_list if p.name not in builtin_names]
-
-        return combined_list, builtin_list, user_list
     #endregion
 
     #region Tooltips
@@ -557,4 +584,5 @@ class BanksViewModel(object):
         self._updateCommandBarButtonState()
 
     def refresh(self):
-        self._refreshTableWidget()
+        # The table model follows the preset store, only the actions depend on the edit
+        self._updateCommandBarButtonState()
@@ -24,6 +24,7 @@ class SettingsViewModel(object):
 
         self.page.presetFolderPickerCard.clicked.connect(self._presetsFolderPickerClicked)
         self.page.outputFolderPickerCard.clicked.connect(self._outputFolderPickerClicked)
+        self.page.audiobinFolderPickerCard.clicked.connect(self._audiobinFolderPickerClicked)
         self.page.micaCard.checkedChanged.connect(signalBus.micaEnableChanged)
     #endregion
 
@@ -53,6 +54,19 @@ class SettingsViewModel(object):
 
         cfg.set(cfg.outputfolder, folder)
         self.page.outputFolderPickerCard.setContent(folder)
+
+    def _audiobinFolderPickerClicked(self):
+        folder = QFileDialog.getExistingDirectory(
+            parent=self.page,
+            caption='Choose folder',
+            dir='./',
+            options=QFileDialog.Option.ShowDirsOnly
+        )
+        if not folder or cfg.get(cfg.audiobinfolder) == folder:
+            return
+
+        cfg.set(cfg.audiobinfolder, folder)
+        self.page.audiobinFolderPickerCard.setContent(folder)
     #endregion
 
     #region Tooltips
@@ -1,15 +1,14 @@
 # App/ViewModels/Pages/PresetsViewModel.py
 
 import yaml
-from collections import defaultdict
 from pathlib import Path
 from functools import partial
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSize, QModelIndex
 from PySide6.QtGui import QShortcut, QUndoStack, QKeySequence
-from PySide6.QtWidgets import QListWidgetItem, QFileDialog
+from PySide6.QtWidgets import QFileDialog
 
-from qfluentwidgets import Action, RoundMenu, MenuAnimationType, ListWidget, CommandBar, InfoBar, SegmentedWidget
+from qfluentwidgets import Action, RoundMenu, MenuAnimationType, ListView, CommandBar, InfoBar, SegmentedWidget
 from qfluentwidgets import FluentIcon as FIF
 
 # App/Common
@@ -18,17 +17,26 @@ from App.Common.Presets import builtinPresetStore, userPresetStore, presetRegist
 from App.Common.Helpers import make_dot_icon, apply_group_box_style, generate_copy_name, clone_struct
 from App.Common.Serialization import serialize_to_yaml
 from App.Common.Structs import Instrument, Drum, Effect, TunedSample, Sample, Envelope
+from App.Common.Waveform import build_sample_waveforms
+from App.Common.Workers import run_in_background
 
 # App/Extensions
 from App.Resources.Icons.MSFluentIcons import MSFluentIcon as FICO
 from App.Extensions.Components.PresetCommands import CreatePresetCommand, EditStructDataCommand, PastePresetCommand, DeletePresetCommand
 from App.Extensions.Dialogs.CreatePresetDialog import CreatePresetDialog
 from App.Extensions.Dialogs.EditStructDialog import EditStructDialog
+from App.Extensions.Widgets.WaveformWidget import createWaveformIcon
+
+# App/Models
+from App.Models.StructListModel import StructListModel
+
+
+PRESET_TYPES = ('instruments', 'drums', 'effects', 'samples', 'envelopes')
 
 
 class StructsViewModel(object):
     #region Initialization
-    def initPage(self, listView: ListWidget, commandBar: CommandBar, pivot: SegmentedWidget, parentPage):
+    def initPage(self, listView: ListView, commandBar: CommandBar, pivot: SegmentedWidget, parentPage):
         self.listView = listView
         self.commandBar = commandBar
         self.pivot = pivot
@@ -38,13 +46,18 @@ class StructsViewModel(object):
         self.builtinPresets = builtinPresetStore
         self.undoStack = QUndoStack()
 
-        self.selectedItems: list[QListWidgetItem] = []
+        self.selectedItems: list[QModelIndex] = []
         self.selectedPresets: list[Instrument | Drum | Effect | Sample | Envelope] = []
         self.copiedPresets: list[Instrument | Drum | Effect | Sample | Envelope] = []
         self.currentPresetType = 'instruments'
         self.copiedPresetType = 'instruments'
         self.editedPresets = set()
 
+        # One model per preset type, each follows the user preset store on its own
+        self.listModels = {presetType: StructListModel(presetType, self.userPresets, self.listView) for presetType in PRESET_TYPES}
+        self.listModels['samples'].rowsInserted.connect(self._onSamplesInserted)
+        self.waveformsLoaded = False
+
         # Menu setup
         self._setupCommandBarActions()
         self._setupPivotActions()
@@ -57,8 +70,8 @@ class StructsViewModel(object):
         # Signals
         self._connectSignals()
 
-        # Refresh presets
-        self.refresh()
+        # Show presets
+        self._setListModel()
 
     def _setupCommandBarActions(self):
         self.createPreset = Action(icon=FICO.ADD, text='Create', triggered=self._showNewPresetMenu)
@@ -165,13 +178,12 @@ class StructsViewModel(object):
 
     def _connectSignals(self):
         cfg.themeChanged.connect(self.onThemeChanged)
-        cfg.presetsFolderChanged.connect(self._loadAllPresets)
+        cfg.audiobinFolderChanged.connect(self._onAudiobinFolderChanged)
 
         self.undoStack.canUndoChanged.connect(self.undoAction.setEnabled)
         self.undoStack.canRedoChanged.connect(self.redoAction.setEnabled)
 
         self.pivot.currentItemChanged.connect(self._onTabChanged)
-        self.listView.itemSelectionChanged.connect(self._onSelectionChanged)
         self.listView.customContextMenuRequested.connect(self._onPresetContextMenu)
     #endregion
 
@@ -181,12 +193,12 @@ class StructsViewModel(object):
         self.selectedPresets = []
 
         self.listView.clearSelection()
-        self.listView.setCurrentItem(None)
+        self.listView.setCurrentIndex(QModelIndex())
         self.listView.clearFocus()
 
     def _onSelectionChanged(self):
-        self.selectedItems = self.listView.selectedItems()
-        self.selectedPresets = [item.data(Qt.ItemDataRole.UserRole) for item in self.selectedItems]
+        self.selectedItems = sorted(self.listView.selectionModel().selectedIndexes(), key=lambda index: index.row())
+        self.selectedPresets = [index.data(Qt.ItemDataRole.UserRole) for index in self.selectedItems]
 
         self._updateCommandBarButtonState()
 
@@ -208,53 +220,40 @@ class StructsViewModel(object):
             'envelopesInterface': 'envelopes'
         }
         self.currentPresetType = types.get(value)
-        self._refreshListView()
+        self._setListModel()
         self._clearPresetSelection()
 
         # Recreate edit menu
         self._setupEditPresetMenu()
 
-    def _loadAllPresets(self):
-        self.builtinPresets.load_builtin_presets()
-        self.userPresets.load_user_presets(Path(cfg.get(cfg.presetsfolder)))
-
-    def _refreshListView(self):
-        self.listView.clear()
-
-        presetList = self._getPresetList(self.currentPresetType)
-        name_counts = defaultdict(int)
-
-        for obj in presetList:
-            name_counts[obj.name] += 1
-
-        for obj in presetList:
-            displayName = obj.name
-            if name_counts[obj.name] > 1:
-                path = self.userPresets.get_path(obj)
-                if path:
-                    import os
-                    filename = os.path.basename(path)
-                    displayName = f'{obj.name} ({filename})'
-                else:
-                    displayName = f'{obj.name}'
-
-            item = QListWidgetItem(displayName)
-            item.setData(Qt.ItemDataRole.UserRole, obj)
-
-            if id(obj) in self.editedPresets:
-                # item.setIcon(make_dot_icon())
-                pass
-
-            self.listView.addItem(item)
-
-    def _getPresetList(self, presetType: str):
-        return {
-            'instruments': self.userPresets.instruments.values(),
-            'drums': self.userPresets.drums.values(),
-            'effects': self.userPresets.effects.values(),
-            'samples': self.userPresets.samples.values(),
-            'envelopes': self.userPresets.envelopes.values()
-        }.get(presetType, [])
+    def _setListModel(self):
+        # Each model switch brings a new selection model, the old one is not reused
+        oldSelectionModel = self.listView.selectionModel()
+        self.listView.setModel(self.listModels[self.currentPresetType])
+        self.listView.selectionModel().selectionChanged.connect(self._onSelectionChanged)
+        if oldSelectionModel:
+            oldSelectionModel.deleteLater()
+
+        if self.currentPresetType == 'samples' and not self.waveformsLoaded:
+            self._loadWaveforms(self.listModels['samples'].presets)
+
+    def _loadWaveforms(self, samples: list):
+        self.listView.setIconSize(QSize(64, 16))
+        self.waveformsLoaded = True
+        run_in_background(build_sample_waveforms, list(samples), on_finished=self._onWaveformsLoaded)
+
+    def _onWaveformsLoaded(self, waveforms: dict):
+        self.listModels['samples'].setIcons({key: createWaveformIcon(pyramid) for key, pyramid in waveforms.items()})
+
+    def _onSamplesInserted(self, parent, first: int, last: int):
+        # Only the new samples are decoded, the rest keep their icons
+        if self.waveformsLoaded:
+            self._loadWaveforms(self.listModels['samples'].presets[first:last + 1])
+
+    def _onAudiobinFolderChanged(self):
+        self.waveformsLoaded = False
+        if self.currentPresetType == 'samples':
+            self._loadWaveforms(self.listModels['samples'].presets)
     #endregion
 
     #region Preset Handling
@@ -275,12 +274,9 @@ class StructsViewModel(object):
             self._clearPresetSelection()
 
             # Select newly created item
-            for i in range(self.listView.count()):
-                item = self.listView.item(i)
-                if item.data(Qt.ItemDataRole.UserRole) == newPreset:
-                    item.setSelected(True)
-                    self.listView.setCurrentItem(item)
-                    break
+            row = self.listModels[self.currentPresetType].rowOf(newPreset)
+            if row >= 0:
+                self.listView.setCurrentIndex(self.listView.model().index(row, 0))
 
     def _onExportPreset(self):
         if not self.selectedItems and not self.selectedPresets:
@@ -313,7 +309,6 @@ class StructsViewModel(object):
             self._showErrorTooltip(ex)
             return
 
-        self.userPresets.remove_preset(preset)
         self.userPresets.add_preset(preset, filePath)
 
     def _onDeletePreset(self):
@@ -345,10 +340,7 @@ class StructsViewModel(object):
         if self.pivot.currentRouteKey() != expectedTab:
             self.pivot.setCurrentItem(expectedTab)
 
-        existingNames = {
-            self.listView.item(i).text()
-            for i in range(self.listView.count())
-        }
+        existingNames = {p.name for p in self.listModels[self.currentPresetType].presets}
 
         pastedPresets = []
         for presetCopy in self.copiedPresets:
@@ -369,9 +361,9 @@ class StructsViewModel(object):
 
     #region Menus
     def _onPresetContextMenu(self, pos):
-        clickedItem = self.listView.itemAt(pos)
-        if clickedItem and clickedItem not in self.selectedItems:
-            self.listView.setCurrentItem(clickedItem)
+        clickedIndex = self.listView.indexAt(pos)
+        if clickedIndex.isValid() and clickedIndex not in self.selectedItems:
+            self.listView.setCurrentIndex(clickedIndex)
 
         selectedItems = self.selectedItems
         selectedPresets = self.selectedPresets
@@ -458,7 +450,6 @@ class StructsViewModel(object):
             )
             self.undoStack.push(cmd)
             self.editedPresets.add(id(editedPreset))
-            self._refreshListView()
             self._clearPresetSelection()
     #endregion
 
@@ -484,4 +475,5 @@ class StructsViewModel(object):
         self._updateCommandBarButtonState()
 
     def refresh(self):
-        self._refreshListView()
+        # The list models follow the preset store, there is nothing to rebuild
+        self._updateCommandBarButtonState()
@@ -1,6 +1,6 @@
 # App/Views/Pages/BanksPage.py
 
-from PySide6.QtCore import Qt, QSortFilterProxyModel
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QAbstractItemView, QHeaderView
 
 from qfluentwidgets import TitleLabel, CommandBar, TableView, ScrollArea
@@ -9,7 +9,7 @@ from qfluentwidgets import TitleLabel, CommandBar, TableView, ScrollArea
 from App.Extensions.Widgets.Frame import Frame
 
 # App/Models
-from App.Models.BankPresetTableModel import BankPresetTableModel
+from App.Models.BankPresetTableModel import BankPresetTableModel, BankPresetSortProxyModel
 
 # App/ViewModels
 from App.ViewModels.Pages.BanksViewModel import BanksViewModel
@@ -75,12 +75,13 @@ class BanksPage(QWidget):
         self.tableWidget.horizontalHeader().setStretchLastSection(True)
         self.tableWidget.verticalHeader().setVisible(False)
 
-        self.tableModel = BankPresetTableModel([])
-        self.tableProxy = QSortFilterProxyModel(self)
+        self.tableModel = BankPresetTableModel(parent=self)
+        self.tableProxy = BankPresetSortProxyModel(self)
         self.tableProxy.setSourceModel(self.tableModel)
         self.tableProxy.setSortCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
 
         self.tableWidget.setModel(self.tableProxy)
+        self.tableWidget.sortByColumn(0, Qt.SortOrder.AscendingOrder)
         header = self.tableWidget.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         header.setSectionsMovable(False)
@@ -30,6 +30,7 @@ class SettingsPage(QWidget):
         self._initAppearanceGroup()
         self._initPersonalizationGroup()
         self._initFoldersGroup()
+        self._initCompileGroup()
 
         # Layout
         self._buildLayout()
@@ -134,16 +135,40 @@ class SettingsPage(QWidget):
             content=cfg.get(cfg.outputfolder),
             parent=self.foldersGroup
         )
+        self.audiobinFolderPickerCard = PushSettingCard(
+            text='Choose folder',
+            icon=FIF.MUSIC_FOLDER,
+            title='Audiobin folder',
+            content=cfg.get(cfg.audiobinfolder),
+            parent=self.foldersGroup
+        )
 
         self.foldersGroup.addSettingCards([
             self.presetFolderPickerCard,
-            self.outputFolderPickerCard
+            self.outputFolderPickerCard,
+            self.audiobinFolderPickerCard
+        ])
+
+    def _initCompileGroup(self):
+        self.compileGroup = SettingCardGroup('Compile', self.scrollWidget)
+
+        self.mapFileCard = SwitchSettingCard(
+            configItem=cfg.writemapfile,
+            icon=FIF.DOCUMENT,
+            title='Memory map',
+            content='Write a .map report of each bank\'s layout next to the compiled binary',
+            parent=self.compileGroup
+        )
+
+        self.compileGroup.addSettingCards([
+            self.mapFileCard
         ])
 
     def _buildLayout(self):
         self.expandLayout.addWidget(self.appearanceGroup)
         self.expandLayout.addWidget(self.personalizationGroup)
         self.expandLayout.addWidget(self.foldersGroup)
+        self.expandLayout.addWidget(self.compileGroup)
 
         mainLayout = QVBoxLayout(self)
         mainLayout.setContentsMargins(20, 12, 20, 20)
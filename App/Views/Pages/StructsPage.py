@@ -3,7 +3,7 @@
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QAbstractItemView
 
-from qfluentwidgets import TitleLabel, CommandBar, ListWidget, ScrollArea, SegmentedWidget
+from qfluentwidgets import TitleLabel, CommandBar, ListView, ScrollArea, SegmentedWidget
 
 # App/Extensions
 from App.Extensions.Widgets.Frame import Frame
@@ -65,7 +65,7 @@ class StructsPage(QWidget):
         self.scrollLayout.setSpacing(8)
 
         self.listFrame = Frame(self.scrollWidget)
-        self.listView = ListWidget(self.listFrame)
+        self.listView = ListView(self.listFrame)
         self.listView.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.listView.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
 
@@ -3,6 +3,7 @@
 import sys
 from struct import unpack
 from pathlib import Path
+from typing import NamedTuple
 import zipfile
 import yaml
 
@@ -19,7 +20,11 @@ from App.Common.Enums import (
     AudioSampleCodec, AudioSampleLoopCount, EnvelopeOpcode,
     IntEnum
 )
-from App.Common.Addresses import AUDIO_SAMPLE_ADDRESSES
+from App.Common.Addresses import is_known_sample, get_sample_address, get_sample_name
+from App.Common.Vadpcm import (
+    read_book_predictors, read_loop_predictors, read_envelope_points,
+    predictors_to_list, predictors_key
+)
 
 
 #region Audiobin
@@ -31,57 +36,101 @@ class Audiobin:
         self.audiosamples = _audiosamples
         self.audiosample_table = _audiosample_table
 
-        # List of all audiobanks in the table
-        self.audiobank_list: list[Audiobank] = []
+        # Banks are only decoded when requested, decoded banks are kept here
+        self._bank_cache: dict[int, Audiobank] = {}
+
+        self.num_banks = int.from_bytes(self.audiobank_table[0:2], 'big')
+        self._sample_banks: SampleBankTable | None = None
+
+    def __len__(self) -> int:
+        return self.num_banks
+
+    def __getitem__(self, index: int) -> 'Audiobank':
+        if not 0 <= index < self.num_banks:
+            raise IndexError(f'Bank index out of range: {index}')
+
+        bank = self._bank_cache.get(index)
+        if bank is None:
+            bank = self._decode_bank(index)
+            self._bank_cache[index] = bank
+        return bank
+
+    def __iter__(self):
+        for i in range(self.num_banks):
+            yield self._bank_cache.get(i) or self._decode_bank(i)
 
-        num_banks = int.from_bytes(self.audiobank_table[0:2], 'big')
-        for i in range(num_banks):
-            table_entry = 0x10 + (0x10 * i) # Offset by 16 as the first line is the number of banks
-            current_entry = self.audiobank_table[table_entry:table_entry + 0x10]
-            instrument_bank: Audiobank = Audiobank(game, current_entry, self.audiobank)
-            self.audiobank_list.append(instrument_bank)
+    def _decode_bank(self, index: int) -> 'Audiobank':
+        table_entry = 0x10 + (0x10 * index) # Offset by 16 as the first line is the number of banks
+        current_entry = self.audiobank_table[table_entry:table_entry + 0x10]
+        return Audiobank(self.game, current_entry, self.audiobank)
+
+    def iter_banks(self, include_skipped: bool = False):
+        """ Yields (index, bank) pairs one at a time without keeping decoded banks alive. """
+        for i in range(self.num_banks):
+            if not include_skipped and self.skip_bank(i):
+                continue
+            yield i, self._bank_cache.get(i) or self._decode_bank(i)
+
+    @property
+    def audiobank_list(self) -> list['Audiobank']:
+        return [self[i] for i in range(self.num_banks)]
+
+    @property
+    def sample_banks(self) -> 'SampleBankTable':
+        if self._sample_banks is None:
+            self._sample_banks = SampleBankTable(self.audiosample_table)
+        return self._sample_banks
+
+    def build_sample_catalog(self) -> 'SampleCatalog':
+        catalog = SampleCatalog(self.game, self.sample_banks)
+        for _, bank in self.iter_banks(include_skipped=True):
+            sample_bank_id = bank.table_entry.raw_sample_bank_id_1
+            for sample in iter_bank_samples(bank):
+                catalog.add(sample_bank_id, sample)
+        return catalog
 
     def assign_names(self):
-        for i, bank in enumerate(self.audiobank_list):
+        for i in range(self.num_banks):
             if self.skip_bank(i):
                 continue
+            self.assign_bank_names(self[i])
 
-            for instrument in bank.instruments:
-                if instrument is None:
-                    continue
-
-                names = []
-
-                for sample_attr in ['prim_sample', 'low_sample', 'high_sample']:
-                    sample_obj = getattr(instrument, sample_attr, None)
-                    if sample_obj is None:
-                        continue
-                    sample = getattr(sample_obj, 'sample', None)
-                    if sample is None:
-                        continue
-                    vrom_address = getattr(sample, 'vrom_address', None)
-                    if vrom_address is None:
-                        continue
+    def assign_bank_names(self, bank: 'Audiobank'):
+        for instrument in bank.instruments:
+            if instrument is None:
+                continue
 
-                    name = get_sample_name_from_address(self.game, vrom_address)
-                    if name:
-                        names.append(name)
+            names = []
 
-                if not names:
+            for sample_attr in ['prim_sample', 'low_sample', 'high_sample']:
+                sample_obj = getattr(instrument, sample_attr, None)
+                if sample_obj is None:
                     continue
-
-                # Take the first name, split by colon, take first part
-                base_name = names[0].split(':')[0]
-                setattr(instrument, 'name', base_name)
-            for drum in bank.drums:
-                if drum is None:
+                sample = getattr(sample_obj, 'sample', None)
+                if sample is None:
                     continue
-                setattr(drum, 'name', get_sample_name_from_address(self.game, drum.drum_sample.sample.vrom_address))
-            for effect in bank.effects:
-                if not effect.effect_sample:
+                vrom_address = getattr(sample, 'vrom_address', None)
+                if vrom_address is None:
                     continue
-                setattr(effect, 'name', get_sample_name_from_address(self.game, effect.effect_sample.sample.vrom_address))
 
+                name = get_sample_name_from_address(self.game, vrom_address)
+                if name:
+                    names.append(name)
+
+            if not names:
+                continue
+
+            # Take the first name, split by colon, take first part
+            base_name = names[0].split(':')[0]
+            setattr(instrument, 'name', base_name)
+        for drum in bank.drums:
+            if drum is None:
+                continue
+            setattr(drum, 'name', get_sample_name_from_address(self.game, drum.drum_sample.sample.vrom_address))
+        for effect in bank.effects:
+            if not effect.effect_sample:
+                continue
+            setattr(effect, 'name', get_sample_name_from_address(self.game, effect.effect_sample.sample.vrom_address))
 
     def skip_bank(self, index: int) -> bool:
         if index in {0x00, 0x01, 0x02}:
@@ -95,54 +144,67 @@ class Audiobin:
         return False
 
     def collect_unique_objects(self):
-        unique_instruments: set[Instrument] = set()
-        unique_drums: set[Drum] = set()
-        unique_effects: set[Effect] = set()
-        unique_samples: set[Sample] = set()
-        unique_envelopes: set[Envelope] = set()
-
-        for i, bank in enumerate(self.audiobank_list):
-            if skip_bank(self.game, i):
+        unique_objects = self.collect_bank_objects(None)
+
+        for i in range(self.num_banks):
+            if self.skip_bank(i):
                 continue
+            self.collect_bank_objects(self[i], unique_objects)
+
+        return unique_objects
+
+    @staticmethod
+    def collect_bank_objects(bank: 'Audiobank', unique_objects: dict = None) -> dict:
+        if unique_objects is None:
+            unique_objects = {
+                'instruments': set(),
+                'drums': set(),
+                'effects': set(),
+                'samples': set(),
+                'envelopes': set()
+            }
 
-            for inst in bank.instruments:
-                if inst is None:
-                    continue
-                unique_instruments.add(inst)
+        if bank is None:
+            return unique_objects
 
-                for tuned_sample in [inst.low_sample, inst.prim_sample, inst.high_sample]:
-                    if tuned_sample and tuned_sample.sample:
-                        unique_samples.add(tuned_sample.sample)
+        unique_instruments: set[Instrument] = unique_objects['instruments']
+        unique_drums: set[Drum] = unique_objects['drums']
+        unique_effects: set[Effect] = unique_objects['effects']
+        unique_samples: set[Sample] = unique_objects['samples']
+        unique_envelopes: set[Envelope] = unique_objects['envelopes']
 
-                if inst.envelope:
-                    unique_envelopes.add(inst.envelope)
+        for inst in bank.instruments:
+            if inst is None:
+                continue
+            unique_instruments.add(inst)
 
-            for drum in bank.drums:
-                if drum is None:
-                    continue
-                unique_drums.add(drum)
+            for tuned_sample in [inst.low_sample, inst.prim_sample, inst.high_sample]:
+                if tuned_sample and tuned_sample.sample:
+                    unique_samples.add(tuned_sample.sample)
 
-                if drum.drum_sample and drum.drum_sample.sample:
-                    unique_samples.add(drum.drum_sample.sample)
+            if inst.envelope:
+                unique_envelopes.add(inst.envelope)
 
-                if drum.envelope:
-                    unique_envelopes.add(drum.envelope)
+        for drum in bank.drums:
+            if drum is None:
+                continue
+            unique_drums.add(drum)
 
-            for effect in bank.effects:
-                if effect is None:
-                    continue
-                unique_effects.add(effect)
+            if drum.drum_sample and drum.drum_sample.sample:
+                unique_samples.add(drum.drum_sample.sample)
 
-                if effect.effect_sample and effect.effect_sample.sample:
-                    unique_samples.add(effect.effect_sample.sample)
+            if drum.envelope:
+                unique_envelopes.add(drum.envelope)
 
-        return {
-            'instruments': unique_instruments,
-            'drums': unique_drums,
-            'effects': unique_effects,
-            'samples': unique_samples,
-            'envelopes': unique_envelopes
-        }
+        for effect in bank.effects:
+            if effect is None:
+                continue
+            unique_effects.add(effect)
+
+            if effect.effect_sample and effect.effect_sample.sample:
+                unique_samples.add(effect.effect_sample.sample)
+
+        return unique_objects
 #endregion
 
 
@@ -154,8 +216,8 @@ class TableEntry:
             self.size,
             raw_storage_medium,
             raw_cache_load_type,
-            _, # The sample bank does not matter
-            _, # The sample bank does not matter
+            self.raw_sample_bank_id_1,
+            self.raw_sample_bank_id_2,
             self.num_instruments,
             self.num_drums,
             self.num_effects
@@ -163,11 +225,124 @@ class TableEntry:
 
         self.storage_medium = AudioStorageMedium(raw_storage_medium)
         self.cache_load_type = AudioCacheLoadType(raw_cache_load_type)
+
+        # Presets record samples as raw offsets into their sample bank, or as the names of
+        # documented samples. Dumped banks name BANK_0 unless a port sets another, the raw
+        # ids are kept to locate samples in the Audiotable.
         self.sample_bank_id_1 = SampleBankId.BANK_0
         self.sample_bank_id_2 = SampleBankId.NO_BANK
 #endregion
 
 
+#region Sample Banks
+class SampleBankEntry:
+    def __init__(self, index: int, table_entry: bytearray):
+        self.index = index
+        (
+            self.address,
+            self.size,
+            raw_storage_medium,
+            raw_cache_load_type
+        ) = unpack('>2I2B', table_entry[0:10])
+
+        self.storage_medium = AudioStorageMedium(raw_storage_medium)
+        self.cache_load_type = AudioCacheLoadType(raw_cache_load_type)
+
+        # Entries without a size point at another sample bank by index
+        self.is_pointer = self.size == 0
+
+
+class SampleBankTable:
+    def __init__(self, audiosample_table: bytearray):
+        num_entries = int.from_bytes(audiosample_table[0:2], 'big')
+
+        self.entries: list[SampleBankEntry] = []
+        for i in range(num_entries):
+            table_entry = 0x10 + (0x10 * i)
+            self.entries.append(SampleBankEntry(i, audiosample_table[table_entry:table_entry + 0x10]))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def resolve(self, bank_id: int) -> SampleBankEntry | None:
+        seen = set()
+        while 0 <= bank_id < len(self.entries) and bank_id not in seen:
+            seen.add(bank_id)
+            entry = self.entries[bank_id]
+            if not entry.is_pointer:
+                return entry
+            bank_id = entry.address
+        return None
+
+    def absolute_address(self, bank_id: int, offset: int) -> int | None:
+        entry = self.resolve(bank_id)
+        return entry.address + offset if entry else None
+#endregion
+
+
+#region Sample Catalog
+class SampleCatalogEntry(NamedTuple):
+    bank_id: int
+    offset: int
+    address: int
+    size: int
+    codec: AudioSampleCodec
+
+
+class SampleCatalog:
+    def __init__(self, game: str, sample_banks: SampleBankTable):
+        self.game = game
+        self.sample_banks = sample_banks
+
+        self.entries: dict[tuple[int, int], SampleCatalogEntry] = {}
+        self.by_address: dict[int, SampleCatalogEntry] = {}
+        self.by_offset: dict[int, list[SampleCatalogEntry]] = {}
+
+        # (bank, offset) pairs that were referenced with different sizes or codecs
+        self.conflicts: list[tuple[SampleCatalogEntry, SampleCatalogEntry]] = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries.values())
+
+    def add(self, bank_id: int, sample: 'Sample') -> SampleCatalogEntry | None:
+        key = (bank_id, sample.vrom_address)
+        existing = self.entries.get(key)
+        if existing is not None:
+            if existing.size != sample.size or existing.codec != sample.codec:
+                self.conflicts.append((existing, self._make_entry(bank_id, sample)))
+            return existing
+
+        entry = self._make_entry(bank_id, sample)
+        if entry is None:
+            return None
+
+        self.entries[key] = entry
+        self.by_address.setdefault(entry.address, entry)
+        self.by_offset.setdefault(entry.offset, []).append(entry)
+        return entry
+
+    def _make_entry(self, bank_id: int, sample: 'Sample') -> SampleCatalogEntry | None:
+        address = self.sample_banks.absolute_address(bank_id, sample.vrom_address)
+        if address is None:
+            return None
+        return SampleCatalogEntry(bank_id, sample.vrom_address, address, sample.size, sample.codec)
+
+    def get(self, bank_id: int, offset: int) -> SampleCatalogEntry | None:
+        return self.entries.get((bank_id, offset))
+
+    def find_offset(self, offset: int) -> list[SampleCatalogEntry]:
+        """ Samples at a raw offset, one per sample bank that has a sample there. """
+        return self.by_offset.get(offset, [])
+
+    def find_address(self, address: int) -> SampleCatalogEntry | None:
+        """ Sample at an absolute Audiotable address. """
+        return self.by_address.get(address)
+#endregion
+
+
 #region Audiobank
 class Audiobank:
     def __init__(self, game: str, table_entry: bytearray, audiobank_file: bytearray):
@@ -356,10 +531,10 @@ class Sample:
             self.vadpcm_loop.loop_end,
             self.vadpcm_loop.loop_count,
             self.vadpcm_loop.num_samples,
-            tuple(self.vadpcm_loop.predictors or []),
+            predictors_key(self.vadpcm_loop.predictors),
             self.vadpcm_book.order,
             self.vadpcm_book.num_predictors,
-            tuple(self.vadpcm_book.predictors)
+            predictors_key(self.vadpcm_book.predictors)
         ))
 
     def __eq__(self, other):
@@ -380,10 +555,10 @@ class Sample:
             self.vadpcm_loop.loop_end == other.vadpcm_loop.loop_end and
             self.vadpcm_loop.loop_count == other.vadpcm_loop.loop_count and
             self.vadpcm_loop.num_samples == other.vadpcm_loop.num_samples and
-            (self.vadpcm_loop.predictors or []) == (other.vadpcm_loop.predictors or []) and
+            predictors_key(self.vadpcm_loop.predictors) == predictors_key(other.vadpcm_loop.predictors) and
             self.vadpcm_book.order == other.vadpcm_book.order and
             self.vadpcm_book.num_predictors == other.vadpcm_book.num_predictors and
-            self.vadpcm_book.predictors == other.vadpcm_book.predictors
+            predictors_key(self.vadpcm_book.predictors) == predictors_key(other.vadpcm_book.predictors)
         )
 
     def hash_ignore_vrom(self):
@@ -394,10 +569,10 @@ class Sample:
             self.vadpcm_loop.loop_end,
             self.vadpcm_loop.loop_count,
             self.vadpcm_loop.num_samples,
-            tuple(self.vadpcm_loop.predictors or []),
+            predictors_key(self.vadpcm_loop.predictors),
             self.vadpcm_book.order,
             self.vadpcm_book.num_predictors,
-            tuple(self.vadpcm_book.predictors)
+            predictors_key(self.vadpcm_book.predictors)
         ))
 
 
@@ -412,9 +587,9 @@ class VadpcmLoop:
 
         self.loop_count = AudioSampleLoopCount(raw_loop_count)
 
+        # Predictors are kept as big-endian s16 views into the bank data
         if self.loop_start != 0:
-            p_offset = struct_offset + 0x10
-            self.predictors = list(unpack('>16h', bank_data[p_offset:p_offset + 0x20]))
+            self.predictors = read_loop_predictors(bank_data, struct_offset + 0x10)
         else:
             self.predictors = None
 
@@ -426,20 +601,19 @@ class VadpcmBook:
             self.num_predictors
         ) = unpack('>2i', bank_data[struct_offset: struct_offset + 0x08])
 
-        num_p = 8 * self.order * self.num_predictors
-
-        start = struct_offset + 0x08
-        end = start + (num_p * 2)
-
-        self.predictors = list(unpack(f'>{num_p}h', bank_data[start:end]))
+        self.predictors = read_book_predictors(bank_data, struct_offset + 0x08, self.order, self.num_predictors)
 
 
 class Envelope:
     def __init__(self, bank_data: bytearray, array_offset: int):
-        # Data should just be 4 points in banks
-        raw_array = list(unpack('>8h', bank_data[array_offset:array_offset + 0x10]))
+        # Data should just be 4 points in banks, kept as a big-endian s16 view until serialized
+        self.points = read_envelope_points(bank_data, array_offset)
 
-        self.array = []
+    def to_array(self) -> list:
+        """ Points as ints, with opcode delays as EnvelopeOpcode. """
+        raw_array = self.points.tolist()
+
+        array = []
         for i in range(0, len(raw_array), 2):
             t = raw_array[i]
             v = raw_array[i + 1]
@@ -449,14 +623,20 @@ class Envelope:
             except ValueError:
                 pass
 
-            self.array.append(t)
-            self.array.append(v)
+            array.append(t)
+            array.append(v)
+        return array
+
+    @property
+    def array(self) -> list:
+        """ Read-only view matching App.Common.Structs.Envelope, for the renderer and SoundFont export. """
+        return self.to_array()
 
     def __hash__(self):
-        return hash(tuple(self.array))
+        return hash(predictors_key(self.points))
 
     def __eq__(self, other):
-        return isinstance(other, Envelope) and self.array == other.array
+        return isinstance(other, Envelope) and predictors_key(self.points) == predictors_key(other.points)
 #endregion
 
 
@@ -466,7 +646,7 @@ def serialize_envelope(game: str, envelope: Envelope, index: int = 0):
         'name': f'Envelope_{index}',
         'array': FlowStyleList([
             val.name if isinstance(val, IntEnum) else val
-            for val in envelope.array
+            for val in envelope.to_array()
         ])
     }
 
@@ -495,12 +675,12 @@ def serialize_sample(game: str, sample: Sample, index: int = 0, region: str = ''
         'vadpcm_book': {
             'order': sample.vadpcm_book.order,
             'num_predictors': sample.vadpcm_book.num_predictors,
-            'predictors': FlowStyleList(sample.vadpcm_book.predictors)
+            'predictors': FlowStyleList(predictors_to_list(sample.vadpcm_book.predictors))
         }
     }
 
-    if sample.vadpcm_loop.predictors:
-        dict['vadpcm_loop']['predictors'] = FlowStyleList(sample.vadpcm_loop.predictors)
+    if sample.vadpcm_loop.predictors is not None:
+        dict['vadpcm_loop']['predictors'] = FlowStyleList(predictors_to_list(sample.vadpcm_loop.predictors))
 
     return dict
 
@@ -672,10 +852,24 @@ def skip_bank(game: str, index: int) -> bool:
 
 
 def get_sample_name_from_address(game: str, address: int) -> str | None:
-    for name, platforms in AUDIO_SAMPLE_ADDRESSES.items():
-        if platforms.get(game) == address:
-            return name
-    return None
+    return get_sample_name(game, address)
+
+
+def iter_bank_samples(bank: Audiobank):
+    for inst in bank.instruments:
+        if inst is None:
+            continue
+        for tuned_sample in [inst.low_sample, inst.prim_sample, inst.high_sample]:
+            if tuned_sample and tuned_sample.sample:
+                yield tuned_sample.sample
+
+    for drum in bank.drums:
+        if drum and drum.drum_sample and drum.drum_sample.sample:
+            yield drum.drum_sample.sample
+
+    for effect in bank.effects:
+        if effect and effect.effect_sample and effect.effect_sample.sample:
+            yield effect.effect_sample.sample
 #endregion
 
 
@@ -703,19 +897,108 @@ def dump_unique_objects_to_yaml(game: str, unique_objects: dict, base_path: Path
     dump_category(unique_objects.get('envelopes', []), 'Envelopes', serialize_unique_envelope, 'Envelope')
 
 
-def dump_banks_to_yaml(game: str, audiobin: Audiobin, base_path: Path):
+def dump_bank_to_yaml(game: str, bank: Audiobank, index: int, base_path: Path):
     out_dir = base_path / 'Banks'
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    for i, bank in enumerate(audiobin.audiobank_list):
-        if audiobin.skip_bank(i):
+    bank_data = serialize_bank(game, bank, index=index)
+    file_path = out_dir / f'Bank_{index}.yaml'
+
+    with open(file_path, 'w') as f:
+        yaml.safe_dump(bank_data, f, sort_keys=False)
+
+
+def dump_banks_to_yaml(game: str, audiobin: Audiobin, base_path: Path):
+    for i, bank in audiobin.iter_banks():
+        dump_bank_to_yaml(game, bank, i, base_path)
+#endregion
+
+
+#region Verification
+def load_builtin_presets() -> list[tuple[str, object]]:
+    """
+    Reads every builtin preset from the compiled Qt resources, the same source the
+    app loads them from. Fails when the resources have not been built.
+    """
+    try:
+        import App.Common.Resources
+    except ImportError as ex:
+        raise RuntimeError('Builtin presets are read from App/Common/Resources.py, run build.py to compile it first') from ex
+
+    from PySide6.QtCore import QFile, QTextStream
+    from App.Resources.Presets.PresetPaths import BANKS_PATHS, DRUMKITS_PATHS, INSTRUMENTS_PATHS, SAMPLES_PATHS, ENVELOPES_PATHS
+
+    presets = []
+    for path in (ENVELOPES_PATHS + SAMPLES_PATHS + INSTRUMENTS_PATHS + DRUMKITS_PATHS + BANKS_PATHS):
+        file = QFile(path)
+        if not file.open(QFile.OpenModeFlag.ReadOnly | QFile.OpenModeFlag.Text):
+            raise IOError(f'Failed to open builtin preset: {path}')
+
+        content = QTextStream(file).readAll()
+        file.close()
+        presets.append((path, yaml.safe_load(content)))
+    return presets
+
+
+def preset_game(path: str) -> str | None:
+    """ Game of a builtin preset from its folder, None for presets every game shares. """
+    folder = path.split('/')[-2].upper()
+    return folder if folder in ('OOT', 'MM') else None
+
+
+def iter_preset_samples(presets: list[tuple[str, object]]):
+    """ Yields every sample dict found in the presets, including inline samples. """
+    for path, raw in presets:
+        stack = [raw]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                if 'vrom_address' in node and 'size' in node:
+                    yield path, node
+                    continue
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                stack.extend(node)
+
+
+def verify_sample_presets(catalog: SampleCatalog, presets: list[tuple[str, object]]) -> list[str]:
+    errors = []
+    game = catalog.game
+
+    # Presets of the other game are checked against its own catalog
+    presets = [(path, raw) for path, raw in presets if preset_game(path) in (None, game)]
+
+    for path, data in iter_preset_samples(presets):
+        file = Path(path)
+        name = data.get('name', '?')
+        offset = data['vrom_address']
+
+        # Preset addresses, named or not, are raw sample bank offsets
+        if isinstance(offset, str):
+            if not is_known_sample(offset):
+                errors.append(f"{file.name}: sample '{name}' references unknown address name '{offset}'")
+                continue
+            offset = get_sample_address(offset, game)
+
+        # Sample does not exist in this game
+        if offset == -1:
+            continue
+
+        entries = catalog.find_offset(offset)
+        if not entries:
+            errors.append(f"{file.name}: sample '{name}' offset 0x{offset:08X} is not referenced by any {game} bank")
+            continue
+
+        if not any(entry.size == data['size'] for entry in entries):
+            sizes = ', '.join(f'0x{entry.size:X}' for entry in entries)
+            errors.append(f"{file.name}: sample '{name}' size 0x{data['size']:X} does not match {game} size(s) {sizes}")
             continue
 
-        bank_data = serialize_bank(game, bank, index=i)
-        file_path = out_dir / f'Bank_{i}.yaml'
+        codec = data.get('codec')
+        if codec is not None and not any(entry.codec.name == str(codec).upper() for entry in entries):
+            errors.append(f"{file.name}: sample '{name}' codec {codec} does not match {game} codec {entries[0].codec.name}")
 
-        with open(file_path, 'w') as f:
-            yaml.safe_dump(bank_data, f, sort_keys=False)
+    return errors
 #endregion
 
 
@@ -742,14 +1025,34 @@ if __name__ == '__main__':
     audiobin_dir = script_dir / 'Audio Binary'
     output_root = script_dir / 'Raw Presets'
 
+    # The cross-check below needs the builtin presets from the compiled resources, the
+    # presets are still dumped without them
+    try:
+        builtin_presets = load_builtin_presets()
+    except RuntimeError as ex:
+        print(f'Warning: {ex}, skipping the builtin sample preset cross-check')
+        builtin_presets = None
+
     for game_code, filename in [('OOT', 'OOT.audiobin'), ('MM', 'MM.audiobin')]:
         audiobin_path = audiobin_dir / filename
         if not audiobin_path.exists():
             continue
 
         audiobin = load_audiobin_archive(game_code, audiobin_path)
-        audiobin.assign_names()
-        unique_objects = audiobin.collect_unique_objects()
 
-        dump_banks_to_yaml(game_code, audiobin, output_root / game_code)
-        dump_unique_objects_to_yaml(game_code, unique_objects, output_root / game_code)
\ No newline at end of file
+        # Banks are decoded, named, and dumped one at a time
+        unique_objects = audiobin.collect_bank_objects(None)
+        for index, bank in audiobin.iter_banks():
+            audiobin.assign_bank_names(bank)
+            dump_bank_to_yaml(game_code, bank, index, output_root / game_code)
+            audiobin.collect_bank_objects(bank, unique_objects)
+
+        dump_unique_objects_to_yaml(game_code, unique_objects, output_root / game_code)
+
+        # Cross-check the builtin sample presets against the game's sample catalog
+        if builtin_presets is None:
+            continue
+
+        catalog = audiobin.build_sample_catalog()
+        for error in verify_sample_presets(catalog, builtin_presets):
+            print(f'[{game_code}] {error}')
\ No newline at end of file
@@ -0,0 +1,119 @@
+# Tools/benchmark_vadpcm.py
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+TOOLS_DIR = Path(__file__).resolve().parent
+
+# Add ROOT_DIR and TOOLS_DIR to sys.path if needed
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(TOOLS_DIR))
+
+
+from App.Common.Enums import AudioSampleCodec
+from App.Common.Vadpcm import encode_samples, decode_vadpcm_batch, decode_samples, expand_book
+
+
+GAME_SAMPLE_RATE = 32000
+
+
+#region Signals
+def synthetic_signals(count: int, seconds: float, seed: int = 0) -> list[np.ndarray]:
+    """ Decaying harmonic tones, sweeps and noise bursts, a rough stand-in for instrument samples. """
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * GAME_SAMPLE_RATE)) / GAME_SAMPLE_RATE
+
+    signals = []
+    for i in range(count):
+        match i % 3:
+            case 0:
+                frequency = rng.uniform(80, 1200)
+                signal = sum(np.sin(2 * np.pi * frequency * h * t) / h for h in range(1, 6)) * np.exp(-t * rng.uniform(0.5, 4))
+            case 1:
+                signal = np.sin(2 * np.pi * np.cumsum(np.geomspace(50, 8000, len(t))) / GAME_SAMPLE_RATE)
+            case _:
+                signal = rng.standard_normal(len(t)) * np.exp(-t * rng.uniform(2, 20))
+
+        signal = signal / np.abs(signal).max() * rng.uniform(4000, 30000)
+        signals.append(np.clip(np.rint(signal), -32768, 32767).astype(np.int16))
+    return signals
+
+
+def snr(reference: np.ndarray, decoded: np.ndarray) -> float:
+    reference = reference.astype(np.float64)
+    noise = np.sum((decoded[:len(reference)].astype(np.float64) - reference) ** 2)
+    return 10 * np.log10(np.sum(reference ** 2) / noise) if noise > 0 else float('inf')
+#endregion
+
+
+#region Benchmarks
+def benchmark_encoder(signals: list[np.ndarray], codec: AudioSampleCodec, workers: int):
+    start = time.perf_counter()
+    encoded = encode_samples([(pcm, None, None) for pcm in signals], codec, workers=workers)
+    elapsed = time.perf_counter() - start
+
+    decoded = decode_vadpcm_batch(
+        (result.data, codec, expand_book(result.book.order, result.book.num_predictors, result.book.predictors), len(pcm))
+        for pcm, result in zip(signals, encoded)
+    )
+    ratios = [snr(pcm, pcm_decoded) for pcm, pcm_decoded in zip(signals, decoded)]
+
+    seconds = sum(len(pcm) for pcm in signals) / GAME_SAMPLE_RATE
+    print(
+        f'{codec.name:<12} workers={workers:<3} {seconds / elapsed:7.1f}x real time'
+        f'  SNR mean {np.mean(ratios):5.1f} dB  min {np.min(ratios):5.1f} dB'
+    )
+
+
+def benchmark_game_samples(archive_path: Path, game: str, limit: int):
+    """ Re-encodes decoded game samples and compares them with the originals. """
+    from audiobin_to_presets import load_audiobin_archive, iter_bank_samples
+
+    audiobin = load_audiobin_archive(game, archive_path)
+    sample_banks = audiobin.sample_banks
+
+    # Unique ADPCM samples by absolute address
+    samples = {}
+    for _, bank in audiobin.iter_banks(include_skipped=True):
+        for sample in iter_bank_samples(bank):
+            address = sample_banks.absolute_address(bank.table_entry.raw_sample_bank_id_1, sample.vrom_address)
+            if address is not None and sample.codec == AudioSampleCodec.ADPCM:
+                samples.setdefault(address, sample)
+
+    addresses = list(samples)[:limit]
+    originals = decode_samples([samples[address] for address in addresses], audiobin.audiosamples, addresses)
+
+    start = time.perf_counter()
+    encoded = encode_samples([(pcm, None, None) for pcm in originals], AudioSampleCodec.ADPCM, workers=os.cpu_count() or 1)
+    elapsed = time.perf_counter() - start
+
+    decoded = decode_vadpcm_batch(
+        (result.data, AudioSampleCodec.ADPCM, expand_book(result.book.order, result.book.num_predictors, result.book.predictors), len(pcm))
+        for pcm, result in zip(originals, encoded)
+    )
+    ratios = [snr(pcm, pcm_decoded) for pcm, pcm_decoded in zip(originals, decoded) if np.any(pcm)]
+
+    seconds = sum(len(pcm) for pcm in originals) / GAME_SAMPLE_RATE
+    print(f'{game} samples: {len(addresses)} re-encoded, {seconds / elapsed:.1f}x real time, SNR mean {np.mean(ratios):.1f} dB')
+#endregion
+
+
+if __name__ == '__main__':
+    signals = synthetic_signals(count=24, seconds=2.0)
+    cpu_count = os.cpu_count() or 1
+
+    for codec in (AudioSampleCodec.ADPCM, AudioSampleCodec.SMALL_ADPCM):
+        benchmark_encoder(signals, codec, 1)
+        if cpu_count > 1:
+            benchmark_encoder(signals, codec, cpu_count)
+
+    for game in ('OOT', 'MM'):
+        archive_path = TOOLS_DIR / 'Audio Binary' / f'{game}.audiobin'
+        if archive_path.exists():
+            benchmark_game_samples(archive_path, game, limit=200)
@@ -0,0 +1,115 @@
+# Tools/encode_sample.py
+
+import os
+import struct
+import sys
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Add ROOT_DIR to sys.path if needed
+sys.path.insert(0, str(ROOT_DIR))
+
+
+from App.Common.Enums import AudioSampleCodec, AudioStorageMedium
+from App.Common.Structs import Sample
+from App.Common.Serialization import sample_to_dict
+from App.Common.Vadpcm import encode_samples, decode_vadpcm, expand_book
+
+
+GAME_SAMPLE_RATE = 32000
+
+
+#region WAV
+def read_wav_loop(path: Path) -> tuple[int, int] | None:
+    """ Returns the first loop of a WAV file's smpl chunk as (start, end), end exclusive. """
+    data = path.read_bytes()
+    pos = 12
+    while pos + 8 <= len(data):
+        chunk_id, size = data[pos:pos + 4], struct.unpack('<I', data[pos + 4:pos + 8])[0]
+        if chunk_id == b'smpl' and size >= 36 + 24:
+            num_loops = struct.unpack('<I', data[pos + 8 + 28:pos + 8 + 32])[0]
+            if num_loops:
+                start, end = struct.unpack('<II', data[pos + 8 + 36 + 8:pos + 8 + 36 + 16])
+                return start, end + 1
+        pos += 8 + size + (size & 1)
+    return None
+
+
+def read_wav(path: Path) -> tuple[np.ndarray, int]:
+    """ Reads a PCM WAV file as mono s16. """
+    with wave.open(str(path), 'rb') as f:
+        num_channels, sample_width, rate = f.getnchannels(), f.getsampwidth(), f.getframerate()
+        frames = f.readframes(f.getnframes())
+
+    if sample_width == 1:
+        pcm = (np.frombuffer(frames, dtype=np.uint8).astype(np.int32) - 128) << 8
+    elif sample_width == 2:
+        pcm = np.frombuffer(frames, dtype='<i2').astype(np.int32)
+    elif sample_width == 3:
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3)
+        pcm = (raw[:, 2].astype(np.int8).astype(np.int32) << 8) | raw[:, 1]
+    else:
+        pcm = np.frombuffer(frames, dtype='<i4') >> 16
+
+    pcm = pcm.reshape(-1, num_channels).mean(axis=1)
+    return np.clip(np.rint(pcm), -32768, 32767).astype(np.int16), rate
+#endregion
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print('Usage: encode_sample.py <WAV> [<WAV> ...] [--small]')
+        sys.exit(1)
+
+    codec = AudioSampleCodec.SMALL_ADPCM if '--small' in sys.argv else AudioSampleCodec.ADPCM
+    paths = [Path(arg) for arg in sys.argv[1:] if not arg.startswith('--')]
+
+    sources = []
+    for path in paths:
+        pcm, rate = read_wav(path)
+        loop = read_wav_loop(path)
+        sources.append((path, pcm, rate, loop))
+
+    start = time.perf_counter()
+    encoded = encode_samples(
+        [(pcm, *(loop or (None, None))) for _, pcm, _, loop in sources],
+        codec,
+        workers=min(len(sources), os.cpu_count() or 1)
+    )
+    elapsed = time.perf_counter() - start
+
+    for (path, pcm, rate, loop), result in zip(sources, encoded):
+        sample = Sample(
+            name=path.stem,
+            unk_0=0,
+            codec=codec,
+            medium=AudioStorageMedium.CART,
+            is_cached=False,
+            is_relocated=False,
+            size=len(result.data),
+            vrom_address=0,
+            vadpcm_loop=result.loop,
+            vadpcm_book=result.book
+        )
+
+        path.with_suffix('.bin').write_bytes(result.data)
+        with open(path.with_suffix('.yaml'), 'w', encoding='utf-8') as f:
+            yaml.safe_dump(sample_to_dict(sample), f, sort_keys=False, allow_unicode=True)
+
+        book = expand_book(result.book.order, result.book.num_predictors, result.book.predictors)
+        decoded = decode_vadpcm(result.data, codec, book, len(pcm)).astype(np.float64)
+        noise = np.sum((decoded - pcm) ** 2)
+        snr = 10 * np.log10(np.sum(pcm.astype(np.float64) ** 2) / noise) if noise > 0 else float('inf')
+
+        print(f'{path.name}: {len(result.data)} bytes, SNR {snr:.1f} dB, tuning {rate / GAME_SAMPLE_RATE:.6f}')
+
+    seconds = sum(len(pcm) / rate for _, pcm, rate, _ in sources)
+    print(f'Encoded {seconds:.1f}s of audio in {elapsed:.2f}s ({seconds / elapsed:.1f}x real time)')
+    print('Place each .bin in the Audiotable and set the vrom_address of its .yaml to its offset')
@@ -0,0 +1,186 @@
+# Tools/generate_sample_addresses.py
+
+import sys
+from pathlib import Path
+
+import yaml
+
+# Configuration
+ROOT_DIR = Path(__file__).resolve().parent.parent
+TOOLS_DIR = Path(__file__).resolve().parent
+SOURCE_FILE = TOOLS_DIR / 'sample_addresses.yaml'
+AUDIOBIN_DIR = TOOLS_DIR / 'Audio Binary'
+OUTPUT_FILE = ROOT_DIR / 'App' / 'Resources' / 'Presets' / 'SampleAddresses.py'
+
+GAMES = ('OOT', 'MM')
+
+# Documented addresses are raw offsets into sample bank 0 (AT00) or 1 (AT01)
+DOCUMENTED_SAMPLE_BANKS = (0, 1)
+VALUES_PER_LINE = 8
+
+# Add ROOT_DIR and TOOLS_DIR to sys.path if needed
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from App.Common.Addresses import iter_sample_addresses
+
+
+#region Sources
+def load_documented_samples(source_path: Path) -> dict[str, dict[str, int]]:
+    """ Reads the documented sample names, a missing game means the address is unknown. """
+    with open(source_path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or {}
+
+    samples = {}
+    for name, platforms in data.items():
+        platforms = platforms or {}
+        samples[str(name).upper()] = {
+            game: int(platforms[game]) for game in GAMES if game in platforms
+        }
+    return samples
+
+
+def load_fingerprint_index():
+    """ Builds a fingerprint index from every available audiobin, or None if there are none. """
+    archives = [(game, AUDIOBIN_DIR / f'{game}.audiobin') for game in GAMES]
+    archives = [(game, path) for game, path in archives if path.exists()]
+    if not archives:
+        return None
+
+    from audiobin_to_presets import load_audiobin_archive
+    from sample_fingerprints import SampleFingerprintIndex
+
+    index = SampleFingerprintIndex()
+    for game, path in archives:
+        index.add_audiobin(load_audiobin_archive(game, path))
+    return index
+#endregion
+
+
+#region Resolution
+def find_equivalent_address(index, src_game: str, address: int, dst_game: str) -> int:
+    for bank_id in DOCUMENTED_SAMPLE_BANKS:
+        entry = index.equivalent(src_game, bank_id, address, dst_game)
+        if entry is not None:
+            return entry.offset
+    return -1
+
+
+def is_referenced(index, game: str, address: int) -> bool:
+    return any(index.fingerprint_at_offset(game, bank_id, address) is not None for bank_id in DOCUMENTED_SAMPLE_BANKS)
+
+
+def resolve_sample_addresses(documented: dict, previous: dict, index=None) -> dict[str, dict[str, int]]:
+    table = {}
+    for name, platforms in documented.items():
+        resolved = dict(platforms)
+
+        for game in GAMES:
+            if game in resolved:
+                continue
+
+            # Fill unknown addresses from the audiobins, or keep the last generated value
+            address = -1
+            if index is not None:
+                for src_game, src_address in platforms.items():
+                    if src_address == -1:
+                        continue
+                    address = find_equivalent_address(index, src_game, src_address, game)
+                    if address != -1:
+                        break
+            else:
+                address = previous.get(name, {}).get(game, -1)
+
+            resolved[game] = address
+
+        table[name] = resolved
+    return table
+
+
+def check_sample_addresses(table: dict, index) -> list[str]:
+    """ Reports documented addresses that no bank in the game references. """
+    warnings = []
+    for name, platforms in table.items():
+        for game, address in platforms.items():
+            if address == -1 or is_referenced(index, game, address):
+                continue
+            warnings.append(f"'{name}' {game} address 0x{address:08X} is not referenced by any bank")
+    return warnings
+#endregion
+
+
+#region Output
+def generate_array_block(var_name: str, type_code: str, arrays: dict[str, list[int]], fmt: str) -> list[str]:
+    lines = [f'{var_name} = {{']
+    for game, values in arrays.items():
+        lines.append(f"    '{game}': array('{type_code}', [")
+        for start in range(0, len(values), VALUES_PER_LINE):
+            chunk = values[start:start + VALUES_PER_LINE]
+            lines.append('        ' + ' '.join(f'{fmt.format(value)},' for value in chunk))
+        lines.append('    ]),')
+    lines.append('}')
+    lines.append('')
+    return lines
+
+
+def format_address(value: int) -> str:
+    return '-1' if value == -1 else f'0x{value:08X}'
+
+
+def generate_sample_addresses(table: dict[str, dict[str, int]]) -> str:
+    names = sorted(table)
+
+    addresses = {game: [table[name][game] for name in names] for game in GAMES}
+    sorted_rows = {
+        game: sorted((row for row, address in enumerate(addresses[game]) if address != -1), key=addresses[game].__getitem__)
+        for game in GAMES
+    }
+    sorted_addresses = {game: [addresses[game][row] for row in sorted_rows[game]] for game in GAMES}
+
+    lines = [
+        '# Auto-generated sample address table',
+        '# Do not edit manually. Regenerate using generate_sample_addresses.py',
+        '# All addresses are corrected to use AT00 or AT01',
+        '',
+        'from array import array',
+        '',
+        f'SAMPLE_GAMES = {GAMES!r}',
+        '',
+        '# Sorted sample names, the position of a name is its row in every array below',
+        'SAMPLE_NAMES = (',
+    ]
+    lines += [f'    {name!r},' for name in names]
+    lines += [')', '']
+
+    lines.append('# Address of every sample per game, -1 if the game does not have the sample')
+    lines += generate_array_block('SAMPLE_ADDRESSES', 'l', {g: [format_address(a) for a in v] for g, v in addresses.items()}, '{}')
+
+    lines.append('# Present addresses in ascending order and the row of each, for reverse lookups')
+    lines += generate_array_block('SAMPLE_ADDRESSES_SORTED', 'l', {g: [format_address(a) for a in v] for g, v in sorted_addresses.items()}, '{}')
+    lines += generate_array_block('SAMPLE_ADDRESS_ROWS', 'H', sorted_rows, '{:>3}')
+
+    return '\n'.join(lines)
+#endregion
+
+
+def generate_sample_address_table():
+    documented = load_documented_samples(SOURCE_FILE)
+    previous = dict(iter_sample_addresses())
+    index = load_fingerprint_index()
+
+    table = resolve_sample_addresses(documented, previous, index)
+    OUTPUT_FILE.write_text(generate_sample_addresses(table), encoding='utf-8')
+
+    if index is None:
+        print('No audiobins found, unknown addresses were kept from the previous table')
+        return
+
+    for warning in check_sample_addresses(table, index):
+        print(warning)
+
+    filled = sum(1 for name in documented for game in GAMES if game not in documented[name] and table[name][game] != -1)
+    print(f'Filled {filled} address(es) by fingerprint matching')
+
+
+if __name__ == '__main__':
+    generate_sample_address_table()
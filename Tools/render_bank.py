@@ -0,0 +1,52 @@
+# Tools/render_bank.py
+
+import sys
+import time
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+TOOLS_DIR = Path(__file__).resolve().parent
+
+# Add ROOT_DIR and TOOLS_DIR to sys.path if needed
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(TOOLS_DIR))
+
+
+from audiobin_to_presets import load_audiobin_archive
+
+from App.Common.Audiotable import load_audiotable
+from App.Common.Renderer import (
+    RENDER_SAMPLE_RATE,
+    render_bank, audition_events, read_midi_events, write_wav
+)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 4:
+        print('Usage: render_bank.py <GAME> <BANK_INDEX> <OUT.wav> [<MIDI>]')
+        sys.exit(1)
+
+    game = sys.argv[1].upper()
+    bank_index = int(sys.argv[2], 0)
+    output_path = Path(sys.argv[3])
+
+    archive_path = TOOLS_DIR / 'Audio Binary' / f'{game}.audiobin'
+    audiobin = load_audiobin_archive(game, archive_path)
+    audiotable = load_audiotable(game, archive_path)
+    bank = audiobin[bank_index]
+
+    if len(sys.argv) > 4:
+        events = read_midi_events(Path(sys.argv[4]))
+    else:
+        events = audition_events(bank)
+
+    start = time.perf_counter()
+    audio = render_bank(bank, events, audiotable, bank.table_entry.raw_sample_bank_id_1)
+    elapsed = time.perf_counter() - start
+
+    write_wav(output_path, audio)
+
+    seconds = len(audio) / RENDER_SAMPLE_RATE
+    speed = seconds / elapsed if elapsed > 0 else float('inf')
+    print(f'Rendered {len(events)} note(s), {seconds:.1f}s of audio in {elapsed:.2f}s ({speed:.1f}x real time)')
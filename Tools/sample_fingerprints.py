@@ -0,0 +1,183 @@
+# Tools/sample_fingerprints.py
+
+import sys
+from hashlib import blake2b
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+TOOLS_DIR = Path(__file__).resolve().parent
+
+# Add ROOT_DIR and TOOLS_DIR to sys.path if needed
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(TOOLS_DIR))
+
+
+from App.Common.Enums import SampleBankId
+
+from audiobin_to_presets import (
+    Audiobin, Audiobank, SampleCatalog, SampleCatalogEntry,
+    iter_bank_samples, load_audiobin_archive, dump_bank_to_yaml
+)
+
+
+#region Fingerprints
+def fingerprint_sample(audiotable: bytearray, entry: SampleCatalogEntry) -> bytes:
+    data = memoryview(audiotable)[entry.address:entry.address + entry.size]
+    return blake2b(data, digest_size=16).digest()
+
+
+class SampleFingerprintIndex:
+    def __init__(self):
+        # fingerprint -> game -> entries with identical sample bytes
+        self.by_fingerprint: dict[bytes, dict[str, list[SampleCatalogEntry]]] = {}
+
+        # (game, sample bank, raw offset) or (game, absolute address) -> fingerprint,
+        # the same raw offset names a different sample in every sample bank
+        self.by_offset: dict[tuple[str, int, int], bytes] = {}
+        self.by_address: dict[tuple[str, int], bytes] = {}
+
+    def add_catalog(self, catalog: SampleCatalog, audiotable: bytearray):
+        game = catalog.game
+        for entry in catalog:
+            fingerprint = fingerprint_sample(audiotable, entry)
+            self.by_fingerprint.setdefault(fingerprint, {}).setdefault(game, []).append(entry)
+            self.by_offset[(game, entry.bank_id, entry.offset)] = fingerprint
+            self.by_address.setdefault((game, entry.address), fingerprint)
+
+    def add_audiobin(self, audiobin: Audiobin, catalog: SampleCatalog | None = None) -> SampleCatalog:
+        catalog = catalog or audiobin.build_sample_catalog()
+        self.add_catalog(catalog, audiobin.audiosamples)
+        return catalog
+
+    def fingerprint_at_offset(self, game: str, bank_id: int, offset: int) -> bytes | None:
+        return self.by_offset.get((game, bank_id, offset))
+
+    def fingerprint_at_address(self, game: str, address: int) -> bytes | None:
+        return self.by_address.get((game, address))
+
+    def equivalent(self, src_game: str, bank_id: int, offset: int, dst_game: str) -> SampleCatalogEntry | None:
+        """ Returns the dst_game sample whose bytes match the src_game sample at offset in sample bank bank_id. """
+        return self._equivalent(self.fingerprint_at_offset(src_game, bank_id, offset), dst_game)
+
+    def equivalent_address(self, src_game: str, address: int, dst_game: str) -> SampleCatalogEntry | None:
+        """ Returns the dst_game sample whose bytes match the src_game sample at an absolute address. """
+        return self._equivalent(self.fingerprint_at_address(src_game, address), dst_game)
+
+    def _equivalent(self, fingerprint: bytes | None, dst_game: str) -> SampleCatalogEntry | None:
+        if fingerprint is None:
+            return None
+
+        entries = self.by_fingerprint[fingerprint].get(dst_game)
+        return entries[0] if entries else None
+
+    def shared_fingerprints(self, game_a: str, game_b: str):
+        for fingerprint, games in self.by_fingerprint.items():
+            if game_a in games and game_b in games:
+                yield fingerprint, games[game_a][0], games[game_b][0]
+#endregion
+
+
+#region Bank Porting
+class PortReport:
+    def __init__(self, src_game: str, dst_game: str):
+        self.src_game = src_game
+        self.dst_game = dst_game
+        self.ported: list[tuple[int, int]] = []
+        self.missing: list[int] = []
+        self.errors: list[str] = []
+
+    @property
+    def success(self) -> bool:
+        return not self.missing and not self.errors
+
+
+def port_bank(bank: Audiobank, index: SampleFingerprintIndex, src_game: str, dst_game: str) -> PortReport:
+    """
+    Rewrites every sample reference in bank to its dst_game equivalent in place. A bank
+    reads its samples from one sample bank, so a port that would need several is
+    reported as an error and leaves the bank untouched.
+    """
+    report = PortReport(src_game, dst_game)
+    src_bank_id = bank.table_entry.raw_sample_bank_id_1
+
+    # Structures may hold separate sample objects for the same address,
+    # so each address is only looked up and reported once
+    seen = set()
+    resolved: dict[int, SampleCatalogEntry | None] = {}
+    rewrites: list[tuple[object, SampleCatalogEntry]] = []
+    for sample in iter_bank_samples(bank):
+        if id(sample) in seen:
+            continue
+        seen.add(id(sample))
+
+        offset = sample.vrom_address
+        if offset not in resolved:
+            entry = index.equivalent(src_game, src_bank_id, offset, dst_game)
+            resolved[offset] = entry
+            if entry is None:
+                report.missing.append(offset)
+            else:
+                report.ported.append((offset, entry.offset))
+
+        entry = resolved[offset]
+        if entry is not None:
+            rewrites.append((sample, entry))
+
+    dst_bank_ids = {entry.bank_id for _, entry in rewrites}
+    if len(dst_bank_ids) > 1:
+        banks = ', '.join(str(bank_id) for bank_id in sorted(dst_bank_ids))
+        report.errors.append(f'{dst_game} equivalents are spread over sample banks {banks}, a bank can only use one')
+        return report
+
+    for sample, entry in rewrites:
+        sample.vrom_address = entry.offset
+
+    # The dumped bank names the sample bank its offsets are relative to
+    if dst_bank_ids:
+        dst_bank_id = dst_bank_ids.pop()
+        bank.table_entry.raw_sample_bank_id_1 = dst_bank_id
+        bank.table_entry.sample_bank_id_1 = SampleBankId(dst_bank_id)
+
+    bank.game = dst_game
+    return report
+#endregion
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 4:
+        print('Usage: sample_fingerprints.py <SRC_GAME> <DST_GAME> <BANK_INDEX> [<BANK_INDEX> ...] [--allow-missing]')
+        sys.exit(1)
+
+    # Samples without an equivalent keep their source offsets, which name other samples in
+    # the destination game, so banks with missing samples are only dumped when asked to
+    allow_missing = '--allow-missing' in sys.argv
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+
+    src_game, dst_game = args[0].upper(), args[1].upper()
+    bank_indices = [int(arg, 0) for arg in args[2:]]
+
+    audiobin_dir = TOOLS_DIR / 'Audio Binary'
+    output_root = TOOLS_DIR / 'Raw Presets' / 'Ported' / f'{src_game}_TO_{dst_game}'
+
+    index = SampleFingerprintIndex()
+    audiobins = {}
+    for game in (src_game, dst_game):
+        audiobins[game] = load_audiobin_archive(game, audiobin_dir / f'{game}.audiobin')
+        index.add_audiobin(audiobins[game])
+
+    for bank_index in bank_indices:
+        bank = audiobins[src_game][bank_index]
+        report = port_bank(bank, index, src_game, dst_game)
+        dumped = report.success or (allow_missing and not report.errors)
+        if dumped:
+            dump_bank_to_yaml(dst_game, bank, bank_index, output_root)
+            print(f'Bank 0x{bank_index:02X}: ported {len(report.ported)} sample(s), {len(report.missing)} missing')
+        else:
+            print(f'Bank 0x{bank_index:02X}: not ported')
+
+        for error in report.errors:
+            print(f'    {error}')
+        for address in report.missing:
+            kept = ', kept its source offset' if dumped else ''
+            print(f'    No {dst_game} equivalent for {src_game} sample 0x{address:08X}{kept}')
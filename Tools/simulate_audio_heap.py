@@ -0,0 +1,57 @@
+# Tools/simulate_audio_heap.py
+
+import sys
+import time
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Add ROOT_DIR to sys.path if needed
+sys.path.insert(0, str(ROOT_DIR))
+
+
+from App.Common.AppExceptions import InvalidGameException
+from App.Common.AudioHeap import (
+    ScenarioStep, get_heap_spec,
+    simulate_scenario, compiled_bank_item, sequence_heap_item, format_report
+)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        print('Usage: simulate_audio_heap.py <GAME> <COMPILED_FOLDER> [<SEQ>:<BANK_NAME> ...]')
+        sys.exit(1)
+
+    game = sys.argv[1].upper()
+    try:
+        spec = get_heap_spec(game)
+    except InvalidGameException as ex:
+        print(ex)
+        sys.exit(1)
+
+    start = time.perf_counter()
+    banks = {path.stem: compiled_bank_item(path) for path in sorted(Path(sys.argv[2]).rglob('*.zbank'))}
+
+    # Every bank on its own, then every bank in turn
+    reports = [simulate_scenario(name, [ScenarioStep(name, [item])], spec) for name, item in banks.items()]
+    reports.append(simulate_scenario(
+        'All banks in turn',
+        [ScenarioStep(name, [item]) for name, item in banks.items()],
+        spec
+    ))
+
+    # Sequences played in the given order with the bank each one uses
+    pairs = [arg.rsplit(':', 1) for arg in sys.argv[3:]]
+    if pairs:
+        reports.append(simulate_scenario(
+            'Sequences in turn',
+            [ScenarioStep(Path(seq).stem, [sequence_heap_item(Path(seq)), banks[bank]]) for seq, bank in pairs],
+            spec
+        ))
+
+    elapsed = time.perf_counter() - start
+    for report in reports:
+        print(format_report(report))
+
+    print(f'{sum(not report.fits for report in reports)} of {len(reports)} scenario(s) do not fit, checked in {elapsed:.3f}s')
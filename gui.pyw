@@ -1,6 +1,11 @@
 import os
 import sys
 
+# Start up timing has to be in place before anything else is imported
+from App.Common.Startup import startupReport
+if '--startup-report' in sys.argv:
+    startupReport.enable()
+
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
 from qfluentwidgets import Theme
@@ -28,7 +33,10 @@ else:
     os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '0'
     os.environ['QT_SCALE_FACTOR'] = str(cfg.get(cfg.dpiscale))
 
+startupReport.mark('imports done')
+
 app = QApplication(sys.argv)
 win = MainWindow()
+startupReport.mark('window shown')
 
 app.exec()
\ No newline at end of file